@@ -26,33 +26,106 @@
 #  SOFTWARE.
 
 name = "psg_reskinner"
-from .constants import HSL_INTERPOLATION, HUE_INTERPOLATION, RGB_INTERPOLATION
-from .easings import (
-    EASE_CONSTANT,
-    EASE_IN_SINE,
-    EASE_OUT_SINE,
-    EASE_IN_OUT_SINE,
-    EASE_IN_QUAD,
-    EASE_OUT_QUAD,
-    EASE_IN_OUT_QUAD,
-    EASE_IN_CUBIC,
-    EASE_OUT_CUBIC,
-    EASE_IN_OUT_CUBIC,
-    EASE_IN_QUART,
-    EASE_OUT_QUART,
-    EASE_IN_OUT_QUART,
-    EASE_IN_QUINT,
-    EASE_OUT_QUINT,
-    EASE_IN_OUT_QUINT,
-    EASE_IN_EXPO,
-    EASE_OUT_EXPO,
-    EASE_IN_OUT_EXPO,
-    EASE_IN_CIRC,
-    EASE_OUT_CIRC,
-    EASE_IN_OUT_CIRC,
-    EASE_OUT_BOUNCE,
-    EASE_IN_BOUNCE,
-    EASE_IN_OUT_BOUNCE,
-)
-from .psg_reskinner import animated_reskin, reskin, toggle_transparency
+from importlib import import_module
+
 from .version import __version__
+
+# Public names, by the submodule they come from. Submodules only get imported when one of their names is first
+# accessed, so importing psg_reskinner has no side effects, and doesn't import PySimpleGUI, Tkinter or colour.
+_EXPORTS = {
+    "backend": ("Operation", "RecordingBackend", "TkBackend"),
+    "colorprocessor": ("invalidate_menu_cache", "invalidate_tag_cache"),
+    "constants": (
+        "HSL_INTERPOLATION",
+        "HUE_INTERPOLATION",
+        "REFRESH_COALESCED",
+        "REFRESH_IDLETASKS",
+        "REFRESH_NONE",
+        "REFRESH_UPDATE",
+        "RGB_INTERPOLATION",
+    ),
+    "easings": (
+        "EASE_CONSTANT",
+        "EASE_IN_SINE",
+        "EASE_OUT_SINE",
+        "EASE_IN_OUT_SINE",
+        "EASE_IN_QUAD",
+        "EASE_OUT_QUAD",
+        "EASE_IN_OUT_QUAD",
+        "EASE_IN_CUBIC",
+        "EASE_OUT_CUBIC",
+        "EASE_IN_OUT_CUBIC",
+        "EASE_IN_QUART",
+        "EASE_OUT_QUART",
+        "EASE_IN_OUT_QUART",
+        "EASE_IN_QUINT",
+        "EASE_OUT_QUINT",
+        "EASE_IN_OUT_QUINT",
+        "EASE_IN_EXPO",
+        "EASE_OUT_EXPO",
+        "EASE_IN_OUT_EXPO",
+        "EASE_IN_CIRC",
+        "EASE_OUT_CIRC",
+        "EASE_IN_OUT_CIRC",
+        "EASE_OUT_BOUNCE",
+        "EASE_IN_BOUNCE",
+        "EASE_IN_OUT_BOUNCE",
+    ),
+    "handlers": (
+        "canvas_items_handler",
+        "image_tint_handler",
+        "register_handler",
+        "unregister_handler",
+    ),
+    "journal": (
+        "JournalBackend",
+        "JournalEntry",
+        "load_journal",
+        "replay_journal",
+        "save_journal",
+    ),
+    "profiling": (
+        "ChromeTraceSink",
+        "TraceSink",
+        "add_trace_sink",
+        "remove_trace_sink",
+        "tracing",
+    ),
+    "psg_reskinner": (
+        "animated_reskin",
+        "animated_reskin_all",
+        "dry_run",
+        "prewarm",
+        "reskin",
+        "reskin_all",
+        "reskinned_finalize",
+        "toggle_transparency",
+        "warmup",
+    ),
+    "stats": ("ReskinStats",),
+    "snapshot": ("ColorSnapshot", "restore_snapshot", "take_snapshot"),
+    "tinting": ("clear_tint_cache",),
+}
+_EXPORTED_FROM = {
+    export: module for module, exports in _EXPORTS.items() for export in exports
+}
+__all__ = ["__version__", *_EXPORTED_FROM]
+
+
+def __getattr__(attribute: str):
+    """
+    Imports public names from their submodules on first access.
+
+    First available from v3.2.0.
+    """
+    module = _EXPORTED_FROM.get(attribute)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attribute!r}")
+    value = globals()[attribute] = getattr(
+        import_module(f".{module}", __name__), attribute
+    )
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTED_FROM))
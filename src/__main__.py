@@ -25,7 +25,9 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
-from .psg_reskinner import main
+import sys
+
+from .cli import main
 
 # ENTRY POINT
-main()
+sys.exit(main())
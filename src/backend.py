@@ -0,0 +1,843 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+from tkinter import Menu as TKMenu
+from tkinter import PhotoImage, TclError, Widget
+from tkinter.ttk import Style
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from weakref import WeakKeyDictionary
+
+from PySimpleGUI import Combo, Element, Window
+
+from .constants import REFRESH_COALESCED, REFRESH_IDLETASKS, REFRESH_UPDATE
+from .default import _cgetde, _normalize_tk_color
+from .utilities import _tcl_command
+
+# The path of the listbox in every combo's popdown window, resolved once per combo.
+_COMBO_LISTBOXES: WeakKeyDictionary = WeakKeyDictionary()
+# The target of operations on groups of ttk styles.
+_STYLES_TARGET = "ttk::style"
+# The Tcl interpreters with a coalesced refresh pending.
+_PENDING_REFRESHES = set()
+
+# A Tcl lambda returning a flat list of (tag, background, foreground) for every tag of a treeview or text widget.
+# Treeviews return tag options through `tag configure`, text widgets through `tag cget`.
+_TAG_COLORS_LAMBDA = (
+    "{w query} {set colors {}; foreach tag [$w tag names] "
+    "{lappend colors $tag [$w tag $query $tag -background] [$w tag $query $tag -foreground]}; "
+    "return $colors}"
+)
+# A Tcl lambda returning the distinct (option, color) pairs used by the fill and outline of a canvas' items.
+_ITEM_COLORS_LAMBDA = (
+    "w {set colors [dict create]; foreach item [$w find all] {foreach option {fill outline} "
+    "{if {![catch {$w itemcget $item -$option} color] && $color ne {}} {dict set colors [list $option $color] {}}}}; "
+    "return [dict keys $colors]}"
+)
+# A Tcl lambda removing tags from every item of a canvas, then adding them to the items with matching colors.
+_TAG_ITEMS_LAMBDA = (
+    "{w tags matches} {foreach tag $tags {$w dtag all $tag}; if {![dict size $matches]} return; "
+    "foreach item [$w find all] {foreach option {fill outline} "
+    "{if {![catch {$w itemcget $item -$option} color] && [dict exists $matches [list $option $color]]} "
+    "{$w addtag [dict get $matches [list $option $color]] withtag $item}}}}"
+)
+# A Tcl lambda making the pixels of a photo image at the indexes given fully transparent.
+_SET_TRANSPARENT_LAMBDA = (
+    "{image width pixels} {foreach index $pixels "
+    "{$image transparency set [expr {$index % $width}] [expr {$index / $width}] 1}}"
+)
+
+
+class Operation(NamedTuple):
+    """
+    A single operation performed (or planned) by a reskin.
+
+    First available from v3.2.0.
+
+    - `kind` is one of "configure", "style", "map", "styles", "maps", "menu", "listbox", "tags", "itemtags", "items" or
+        "refresh". Reskins configure ttk styles in groups, through "styles" and "maps" operations.
+    - `target` is the Tk path of the widget (or menu, or combo), the ttk style name ("ttk::style" for groups of styles),
+        or the window title.
+    - `options` maps options to values. For "refresh" operations, the only option is the refresh strategy. For "map"
+        operations, values are lists of (state, value) pairs. For "styles" and "maps" operations, Tcl lists of style
+        names are mapped to the options (or state maps) shared by those styles. For "menu" operations, entry indexes are
+        mapped to the options of each entry. For "tags" operations, Tcl lists of item tags are mapped to the options
+        shared by those tags. For "itemtags" operations, canvas item tags are mapped to the (option, color) pairs of the
+        items they get added to, and for "items" operations, canvas item tags are mapped to the options of the items
+        they group.
+    """
+
+    kind: str
+    target: str
+    options: Dict[Any, Any]
+
+
+class TkBackend:
+    """
+    Applies the operations planned by a ColorProcessor to live Tk widgets and styles, and resolves defaults from the
+    default window.
+
+    Subclass this to change where operations go; see `RecordingBackend` and `psg_reskinner.mock.MockBackend`.
+
+    First available from v3.2.0.
+    """
+
+    # Reading.
+    def styler(self) -> Style:
+        return Style()
+
+    def resolve_default(self, default_function: Callable[[], str]) -> str:
+        """
+        Obtains a safe default color when a theme's color can't be used.
+
+        :param default_function: A callable returning the (possibly system) default color.
+        :return: A hex color string.
+        """
+        return _normalize_tk_color(default_function())
+
+    def default_option(self, element_name: str, attribute: str) -> Any:
+        """
+        Obtains an option of a default element.
+
+        :param element_name: The lowercase class name of the element.
+        :param attribute: The option to obtain.
+        :return: The value of the option.
+        """
+        return _cgetde(element_name, attribute)
+
+    def prewarm(self, element: Element) -> None:
+        """
+        Resolves whatever applying operations to an element will need, ahead of time. Currently, this creates the
+        popdown window of combos.
+
+        :param element: The element.
+        :return: None
+        """
+        if isinstance(element, Combo):
+            _combo_listbox(element.widget)
+
+    def tag_colors(self, widget: Widget) -> Dict[str, Dict[str, str]]:
+        """
+        Reads the colors of every tag of a treeview or text widget with a single Tcl call.
+
+        First available from v3.2.0.
+        :param widget: The ttk Treeview or Tk Text widget.
+        :return: The background and foreground of each tag (empty strings when unset), keyed by tag.
+        """
+        words = widget.tk.splitlist(
+            widget.tk.call(
+                "apply",
+                _TAG_COLORS_LAMBDA,
+                widget,
+                "cget" if widget.widgetName == "text" else "configure",
+            )
+        )
+        return {
+            str(words[index]): {
+                "background": str(words[index + 1]),
+                "foreground": str(words[index + 2]),
+            }
+            for index in range(0, len(words), 3)
+        }
+
+    def tag_set(self, widget: Widget) -> Tuple[str, ...]:
+        """
+        Reads what the tag plan of a widget depends on with a single Tcl call: the names of the tags of a treeview or
+        text widget, or the ids of the items of a canvas.
+
+        First available from v3.2.0.
+        :param widget: The ttk Treeview, Tk Text or Tk Canvas widget.
+        :return: The tag names or item ids.
+        """
+        if widget.widgetName == "canvas":
+            words = widget.tk.call(widget, "find", "all")
+        else:
+            words = widget.tk.call(widget, "tag", "names")
+        return tuple(str(word) for word in widget.tk.splitlist(words))
+
+    def item_colors(self, widget: Widget) -> List[Tuple[str, str]]:
+        """
+        Reads the distinct colors used by the fill and outline of a canvas' items with a single Tcl call.
+
+        First available from v3.2.0.
+        :param widget: The Tk Canvas widget.
+        :return: The distinct (option, color) pairs.
+        """
+        return [
+            tuple(str(word) for word in widget.tk.splitlist(pair))
+            for pair in widget.tk.splitlist(
+                widget.tk.call("apply", _ITEM_COLORS_LAMBDA, widget)
+            )
+        ]
+
+    def widget_options(self, widget: Widget, options: Iterable[str]) -> Dict[str, str]:
+        """
+        Reads the current values of options of a widget.
+
+        First available from v3.2.0.
+        :param widget: The widget.
+        :param options: The options to read.
+        :return: The value of each option.
+        """
+        return {option: str(widget.cget(option)) for option in options}
+
+    def style_options(
+        self, styler: Style, style: str, options: Iterable[str]
+    ) -> Dict[str, str]:
+        """
+        Reads the current values of options of a ttk style. Options the style doesn't set itself are looked up through
+        the styles it inherits from.
+
+        First available from v3.2.0.
+        :param styler: The ttk Style object.
+        :param style: The style name.
+        :param options: The options to read.
+        :return: The value of each option.
+        """
+        values = {}
+        for option in options:
+            value = styler.configure(style, option)
+            if value in (None, ""):
+                value = styler.lookup(style, option)
+            values[option] = "" if value is None else str(value)
+        return values
+
+    def style_map_options(
+        self, styler: Style, style: str, options: Iterable[str]
+    ) -> Dict[str, List]:
+        """
+        Reads the current state maps of options of a ttk style.
+
+        First available from v3.2.0.
+        :param styler: The ttk Style object.
+        :param style: The style name.
+        :param options: The options to read.
+        :return: The list of (state, value) pairs of each option.
+        """
+        return {
+            option: [tuple(spec) for spec in styler.map(style, option)]
+            for option in options
+        }
+
+    def menu_entry_options(
+        self, menu: TKMenu, entries: Dict[int, Iterable[str]]
+    ) -> Dict[int, Dict[str, str]]:
+        """
+        Reads the current values of options of the entries of a menu.
+
+        First available from v3.2.0.
+        :param menu: The Tkinter menu object.
+        :param entries: The options to read, keyed by entry index.
+        :return: The value of each option, keyed by entry index.
+        """
+        return {
+            index: {option: str(menu.entrycget(index, option)) for option in options}
+            for index, options in entries.items()
+        }
+
+    def combo_listbox_options(
+        self, combo_widget: Widget, options: Iterable[str]
+    ) -> Dict[str, str]:
+        """
+        Reads the current values of options of the listbox in a combo's popdown window.
+
+        First available from v3.2.0.
+        :param combo_widget: The ttk Combobox widget.
+        :param options: The options to read.
+        :return: The value of each option.
+        """
+        listbox = _combo_listbox(combo_widget)
+        return {
+            option: str(combo_widget.tk.call(listbox, "cget", f"-{option}"))
+            for option in options
+        }
+
+    def item_options(
+        self, widget: Widget, groups: Dict[str, Iterable[str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Reads the current values of options of groups of canvas items, from the first item of each group.
+
+        First available from v3.2.0.
+        :param widget: The Tk Canvas widget.
+        :param groups: The options to read, keyed by the tag of each group.
+        :return: The value of each option, keyed by the tag of each group.
+        """
+        return {
+            tag: {
+                option: str(widget.tk.call(widget, "itemcget", tag, f"-{option}"))
+                for option in options
+            }
+            for tag, options in groups.items()
+        }
+
+    def image_type(self, widget: Widget, image_name: str) -> str:
+        """
+        Reads the type of an image.
+
+        First available from v3.2.0.
+        :param widget: A widget of the Tk interpreter the image belongs to.
+        :param image_name: The name of the image.
+        :return: The type of the image (e.g. "photo"), or an empty string if there's no such image.
+        """
+        try:
+            return str(widget.tk.call("image", "type", image_name))
+        except TclError:
+            return ""
+
+    def read_photo(
+        self, widget: Widget, image_name: str
+    ) -> Tuple[int, int, bytes, bytes]:
+        """
+        Reads the pixels of a photo image, twice: once with transparent pixels on black, and once on white. Pixels
+        which differ between the two are the transparent ones, so transparency takes no per-pixel Tcl calls.
+
+        First available from v3.2.0.
+        :param widget: A widget of the Tk interpreter the image belongs to.
+        :param image_name: The name of the photo image.
+        :return: The width and height of the image, and its pixels as RGB bytes on black and on white.
+        """
+        width = int(widget.tk.call("image", "width", image_name))
+        height = int(widget.tk.call("image", "height", image_name))
+        return (
+            width,
+            height,
+            _photo_pixels(widget, image_name, "#000000"),
+            _photo_pixels(widget, image_name, "#ffffff"),
+        )
+
+    def image_in_use(self, master: Any, image_name: str) -> bool:
+        """
+        Checks whether any widget displays an image.
+
+        First available from v3.2.0.
+        :param master: A widget (or image) of the Tk interpreter the image belongs to.
+        :param image_name: The name of the image.
+        :return: True if the image is displayed, else False (including when there's no such image anymore).
+        """
+        try:
+            return master.tk.getboolean(master.tk.call("image", "inuse", image_name))
+        except TclError:
+            return False
+
+    # Writing.
+    def configure(self, widget: Widget, options: Dict[str, str]) -> None:
+        widget.configure(**options)
+
+    def configure_widgets(
+        self, configurations: List[Tuple[Widget, Dict[str, str]]]
+    ) -> None:
+        """
+        Configures many widgets with a single batched Tcl script.
+
+        First available from v3.2.0.
+        :param configurations: The widgets, each along with its configuration arguments.
+        :return: None
+        """
+        commands = [
+            _tcl_command(
+                widget,
+                "configure",
+                *(
+                    word
+                    for attribute, value in options.items()
+                    for word in (f"-{attribute}", value)
+                ),
+            )
+            for widget, options in configurations
+        ]
+        if commands:
+            configurations[0][0].tk.eval("\n".join(commands))
+
+    def style_configure(self, styler: Style, style: str, options: Dict[str, str]):
+        styler.configure(style, **options)
+
+    def style_map(self, styler: Style, style: str, options: Dict[str, List]):
+        styler.map(style, **options)
+
+    def configure_styles(self, styler: Style, groups: Dict[str, Dict[str, str]]):
+        """
+        Configures groups of ttk styles with a single batched Tcl script, one `ttk::style configure` per style.
+
+        First available from v3.2.0.
+        :param styler: The ttk Style object.
+        :param groups: The options shared by each group of styles, keyed by the Tcl list of the styles in the group.
+        :return: None
+        """
+        commands = [
+            "foreach style {%s} {ttk::style configure $style %s}"
+            % (
+                styles,
+                _tcl_command(
+                    *(
+                        word
+                        for attribute, value in options.items()
+                        for word in (f"-{attribute}", value)
+                    )
+                ),
+            )
+            for styles, options in groups.items()
+        ]
+        if commands:
+            styler.tk.eval("\n".join(commands))
+
+    def map_styles(self, styler: Style, groups: Dict[str, Dict[str, List]]):
+        """
+        Sets the state maps of groups of ttk styles with a single batched Tcl script, one `ttk::style map` per style.
+
+        First available from v3.2.0.
+        :param styler: The ttk Style object.
+        :param groups: The state maps shared by each group of styles, as lists of (state, ..., value) tuples per
+            option, keyed by the Tcl list of the styles in the group.
+        :return: None
+        """
+        commands = [
+            "foreach style {%s} {ttk::style map $style %s}"
+            % (
+                styles,
+                _tcl_command(
+                    *(
+                        word
+                        for attribute, pairs in options.items()
+                        for word in (
+                            f"-{attribute}",
+                            # Every state but the value make up a single statespec, as with tkinter.
+                            _tcl_command(
+                                *(
+                                    part
+                                    for *states, value in pairs
+                                    for part in (" ".join(map(str, states)), value)
+                                )
+                            ),
+                        )
+                    )
+                ),
+            )
+            for styles, options in groups.items()
+        ]
+        if commands:
+            styler.tk.eval("\n".join(commands))
+
+    def configure_menu_entries(
+        self, menu: TKMenu, entries: Dict[int, Dict[str, str]]
+    ) -> None:
+        """
+        Configures the entries of a menu with a single batched Tcl command.
+
+        :param menu: The Tkinter menu object.
+        :param entries: The options of each entry, keyed by entry index.
+        :return: None
+        """
+        commands = [
+            _tcl_command(
+                menu,
+                "entryconfigure",
+                index,
+                *(
+                    word
+                    for attribute, value in options.items()
+                    for word in (f"-{attribute}", value)
+                ),
+            )
+            for index, options in entries.items()
+        ]
+        if commands:
+            menu.tk.eval("\n".join(commands))
+
+    def configure_combo_listbox(
+        self, combo_widget: Widget, options: Dict[str, str]
+    ) -> None:
+        """
+        Configures the listbox in a combo's popdown window with a single Tcl command.
+
+        :param combo_widget: The ttk Combobox widget.
+        :param options: The configuration arguments, in the format of attribute: value.
+        :return: None
+        """
+        combo_widget.tk.call(
+            _combo_listbox(combo_widget),
+            "configure",
+            *(
+                word
+                for attribute, value in options.items()
+                for word in (f"-{attribute}", value)
+            ),
+        )
+
+    def configure_tags(self, widget: Widget, groups: Dict[str, Dict[str, str]]) -> None:
+        """
+        Configures groups of tags of a treeview or text widget with a single batched Tcl script, so that the cost
+        doesn't grow with the number of rows (or lines) sharing the same colors.
+
+        First available from v3.2.0.
+        :param widget: The ttk Treeview or Tk Text widget.
+        :param groups: The options shared by each group of tags, keyed by the Tcl list of the tags in the group.
+        :return: None
+        """
+        commands = [
+            "foreach tag {%s} {%s $tag %s}"
+            % (
+                tags,
+                _tcl_command(widget, "tag", "configure"),
+                _tcl_command(
+                    *(
+                        word
+                        for attribute, value in options.items()
+                        for word in (f"-{attribute}", value)
+                    )
+                ),
+            )
+            for tags, options in groups.items()
+        ]
+        if commands:
+            widget.tk.eval("\n".join(commands))
+
+    def tag_items(self, widget: Widget, tags: Dict[str, List[Tuple[str, str]]]) -> None:
+        """
+        Retags the items of a canvas with a single Tcl call. Every tag given gets removed from all items, then added to
+        the items whose fill or outline has one of the colors listed for it.
+
+        First available from v3.2.0.
+        :param widget: The Tk Canvas widget.
+        :param tags: The (option, color) pairs of the items each tag should be added to, keyed by tag.
+        :return: None
+        """
+        widget.tk.call(
+            "apply",
+            _TAG_ITEMS_LAMBDA,
+            widget,
+            tuple(tags),
+            tuple(
+                word
+                for tag, matches in tags.items()
+                for match in matches
+                for word in (match, tag)
+            ),
+        )
+
+    def configure_items(
+        self, widget: Widget, groups: Dict[str, Dict[str, str]]
+    ) -> None:
+        """
+        Configures groups of canvas items with a single batched Tcl script, one `itemconfigure` per tag, so that the
+        cost grows with the number of distinct colors rather than with the number of items.
+
+        First available from v3.2.0.
+        :param widget: The Tk Canvas widget.
+        :param groups: The options of the items in each group, keyed by the tag of the group.
+        :return: None
+        """
+        commands = [
+            _tcl_command(
+                widget,
+                "itemconfigure",
+                tag,
+                *(
+                    word
+                    for attribute, value in options.items()
+                    for word in (f"-{attribute}", value)
+                ),
+            )
+            for tag, options in groups.items()
+        ]
+        if commands:
+            widget.tk.eval("\n".join(commands))
+
+    def create_photo(
+        self,
+        widget: Widget,
+        width: int,
+        height: int,
+        pixels: bytes,
+        transparent: Sequence[int],
+    ) -> PhotoImage:
+        """
+        Creates a photo image. The image gets deleted once the object returned is garbage collected.
+
+        First available from v3.2.0.
+        :param widget: A widget of the Tk interpreter to create the image in.
+        :param width: The width of the image.
+        :param height: The height of the image.
+        :param pixels: The pixels of the image, as RGB bytes.
+        :param transparent: The indexes of the pixels which are fully transparent.
+        :return: The image.
+        """
+        digits = pixels.hex()
+        words = ["#" + digits[start : start + 6] for start in range(0, len(digits), 6)]
+        image = PhotoImage(master=widget, width=width, height=height)
+        image.put(
+            " ".join(
+                "{%s}" % " ".join(words[row * width : (row + 1) * width])
+                for row in range(height)
+            )
+        )
+        if transparent:
+            widget.tk.call("apply", _SET_TRANSPARENT_LAMBDA, image, width, transparent)
+        return image
+
+    def refresh(self, window: Window, strategy: str = REFRESH_UPDATE) -> None:
+        """
+        Refreshes a window after a reskin pass, so that the changes get drawn.
+
+        :param window: The window.
+        :param strategy: `REFRESH_UPDATE` for a full `update`, which processes pending events too;
+            `REFRESH_IDLETASKS` for an `update_idletasks`, which only redraws; or `REFRESH_COALESCED` for a single
+            `update_idletasks` per interpreter, once Tk is idle, however many windows ask for one before then.
+        :return: None
+        """
+        if strategy == REFRESH_UPDATE:
+            window.refresh()
+        elif strategy == REFRESH_IDLETASKS:
+            window.TKroot.update_idletasks()
+        elif strategy == REFRESH_COALESCED:
+            _coalesced_refresh(window.TKroot._root())
+        else:
+            raise ValueError(f"Unknown refresh strategy: {strategy!r}.")
+
+
+class RecordingBackend(TkBackend):
+    """
+    Records every operation into `log` before passing it on to another backend.
+
+    With `dry_run` set, operations are only recorded and nothing gets written to the widgets, which lets you inspect
+    (or diff) what a reskin would do. Defaults are still read through the wrapped backend.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self, backend: Optional[TkBackend] = None, dry_run: bool = False):
+        """
+        :param backend: The backend to pass operations on to. Defaults to a TkBackend.
+        :param dry_run: If True, operations are recorded but not applied.
+        """
+        self.backend = backend if backend is not None else TkBackend()
+        self.dry_run = dry_run
+        self.log: List[Operation] = []
+
+    def _record(self, kind: str, target: Any, options: Dict) -> bool:
+        self.log.append(Operation(kind, str(target), dict(options)))
+        return not self.dry_run
+
+    def styler(self) -> Style:
+        return self.backend.styler()
+
+    def resolve_default(self, default_function: Callable[[], str]) -> str:
+        return self.backend.resolve_default(default_function)
+
+    def default_option(self, element_name: str, attribute: str) -> Any:
+        return self.backend.default_option(element_name, attribute)
+
+    def prewarm(self, element: Element) -> None:
+        self.backend.prewarm(element)
+
+    def tag_colors(self, widget: Widget) -> Dict[str, Dict[str, str]]:
+        return self.backend.tag_colors(widget)
+
+    def tag_set(self, widget: Widget) -> Tuple[str, ...]:
+        return self.backend.tag_set(widget)
+
+    def item_colors(self, widget: Widget) -> List[Tuple[str, str]]:
+        return self.backend.item_colors(widget)
+
+    def widget_options(self, widget: Widget, options: Iterable[str]) -> Dict[str, str]:
+        return self.backend.widget_options(widget, options)
+
+    def style_options(
+        self, styler: Style, style: str, options: Iterable[str]
+    ) -> Dict[str, str]:
+        return self.backend.style_options(styler, style, options)
+
+    def style_map_options(
+        self, styler: Style, style: str, options: Iterable[str]
+    ) -> Dict[str, List]:
+        return self.backend.style_map_options(styler, style, options)
+
+    def menu_entry_options(
+        self, menu: TKMenu, entries: Dict[int, Iterable[str]]
+    ) -> Dict[int, Dict[str, str]]:
+        return self.backend.menu_entry_options(menu, entries)
+
+    def combo_listbox_options(
+        self, combo_widget: Widget, options: Iterable[str]
+    ) -> Dict[str, str]:
+        return self.backend.combo_listbox_options(combo_widget, options)
+
+    def item_options(
+        self, widget: Widget, groups: Dict[str, Iterable[str]]
+    ) -> Dict[str, Dict[str, str]]:
+        return self.backend.item_options(widget, groups)
+
+    def image_type(self, widget: Widget, image_name: str) -> str:
+        return self.backend.image_type(widget, image_name)
+
+    def read_photo(
+        self, widget: Widget, image_name: str
+    ) -> Tuple[int, int, bytes, bytes]:
+        return self.backend.read_photo(widget, image_name)
+
+    def image_in_use(self, master: Any, image_name: str) -> bool:
+        return self.backend.image_in_use(master, image_name)
+
+    def create_photo(
+        self,
+        widget: Widget,
+        width: int,
+        height: int,
+        pixels: bytes,
+        transparent: Sequence[int],
+    ) -> PhotoImage:
+        # Creating an image changes nothing on screen, so it isn't an operation.
+        return self.backend.create_photo(widget, width, height, pixels, transparent)
+
+    def configure(self, widget: Widget, options: Dict[str, str]) -> None:
+        if self._record("configure", widget, options):
+            self.backend.configure(widget, options)
+
+    def configure_widgets(
+        self, configurations: List[Tuple[Widget, Dict[str, str]]]
+    ) -> None:
+        applied = [
+            (widget, options)
+            for widget, options in configurations
+            if self._record("configure", widget, options)
+        ]
+        if applied:
+            self.backend.configure_widgets(applied)
+
+    def style_configure(self, styler: Style, style: str, options: Dict[str, str]):
+        if self._record("style", style, options):
+            self.backend.style_configure(styler, style, options)
+
+    def style_map(self, styler: Style, style: str, options: Dict[str, List]):
+        if self._record("map", style, options):
+            self.backend.style_map(styler, style, options)
+
+    def configure_styles(self, styler: Style, groups: Dict[str, Dict[str, str]]):
+        if self._record("styles", _STYLES_TARGET, groups):
+            self.backend.configure_styles(styler, groups)
+
+    def map_styles(self, styler: Style, groups: Dict[str, Dict[str, List]]):
+        if self._record("maps", _STYLES_TARGET, groups):
+            self.backend.map_styles(styler, groups)
+
+    def configure_menu_entries(
+        self, menu: TKMenu, entries: Dict[int, Dict[str, str]]
+    ) -> None:
+        if self._record("menu", menu, entries):
+            self.backend.configure_menu_entries(menu, entries)
+
+    def configure_combo_listbox(
+        self, combo_widget: Widget, options: Dict[str, str]
+    ) -> None:
+        if self._record("listbox", combo_widget, options):
+            self.backend.configure_combo_listbox(combo_widget, options)
+
+    def configure_tags(self, widget: Widget, groups: Dict[str, Dict[str, str]]) -> None:
+        if self._record("tags", widget, groups):
+            self.backend.configure_tags(widget, groups)
+
+    def tag_items(self, widget: Widget, tags: Dict[str, List[Tuple[str, str]]]) -> None:
+        if self._record("itemtags", widget, tags):
+            self.backend.tag_items(widget, tags)
+
+    def configure_items(
+        self, widget: Widget, groups: Dict[str, Dict[str, str]]
+    ) -> None:
+        if self._record("items", widget, groups):
+            self.backend.configure_items(widget, groups)
+
+    def refresh(self, window: Window, strategy: str = REFRESH_UPDATE) -> None:
+        if self._record("refresh", window.Title, {"strategy": strategy}):
+            self.backend.refresh(window, strategy)
+
+
+def _photo_pixels(widget: Widget, image_name: str, background: str) -> bytes:
+    """
+    Internal use only.
+
+    Reads the pixels of a photo image with a single Tcl call, with its transparent pixels in the background color.
+
+    First available from v3.2.0.
+    :param widget: A widget of the Tk interpreter the image belongs to.
+    :param image_name: The name of the photo image.
+    :param background: The color transparent pixels get.
+    :return: The pixels, as RGB bytes.
+    """
+    rows = widget.tk.splitlist(
+        widget.tk.call(image_name, "data", "-background", background)
+    )
+    return bytes.fromhex("".join(rows).replace("#", "").replace(" ", ""))
+
+
+def _combo_listbox(combo_widget: Widget) -> str:
+    """
+    Internal use only.
+
+    Obtains the path of the listbox in a combo's popdown window, creating the popdown window if need be. The path is
+    resolved only once per combo, and without setting any global Tcl variables.
+
+    First available from v3.2.0.
+    :param combo_widget: The ttk Combobox widget.
+    :return: The Tk path of the listbox.
+    """
+    listbox = _COMBO_LISTBOXES.get(combo_widget)
+    if listbox is None:
+        popdown = combo_widget.tk.call("ttk::combobox::PopdownWindow", combo_widget)
+        listbox = _COMBO_LISTBOXES[combo_widget] = f"{popdown}.f.l"
+    return listbox
+
+
+def _coalesced_refresh(root: Widget) -> None:
+    """
+    Internal use only.
+
+    Schedules an `update_idletasks` for when Tk is next idle, unless one is pending for the interpreter already. The
+    callback is registered on the Tk root, which outlives every window.
+
+    First available from v3.2.0.
+    :param root: The Tk root.
+    :return: None
+    """
+    interpreter = root.tk
+    if interpreter in _PENDING_REFRESHES:
+        return
+    _PENDING_REFRESHES.add(interpreter)
+
+    def flush() -> None:
+        _PENDING_REFRESHES.discard(interpreter)
+        root.update_idletasks()
+
+    root.after_idle(flush)
@@ -0,0 +1,771 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+"""
+Reproducible benchmarks for Reskinner.
+
+Run them with `python -m psg_reskinner.benchmark`. Pass `--mock` to use the mock backend on machines without a
+display; otherwise run them under a real display (or Xvfb, e.g. `xvfb-run python -m psg_reskinner.benchmark`).
+"""
+
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySimpleGUI import (
+    LOOK_AND_FEEL_TABLE,
+    Button,
+    Column,
+    Combo,
+    Element,
+    Image,
+    Menu,
+    Tab,
+    TabGroup,
+    Table,
+    Text,
+    Tree,
+    TreeData,
+    Window,
+    theme,
+)
+from PySimpleGUI import version as psg_version
+
+from .backend import RecordingBackend, TkBackend
+from .colorprocessor import ColorProcessor
+from .exception import ReskinnerException
+from .handlers import (
+    _ELEMENT_HANDLERS,
+    image_tint_handler,
+    register_handler,
+    unregister_handler,
+)
+from .constants import REFRESH_UPDATE, THEME_COLOR_KEYS, WINDOW_THEME_MAP
+from .mock import MockBackend, MockWindow
+from .psg_reskinner import animated_reskin, reskin, reskin_all
+from .stats import _summary
+from .tinting import _numpy
+from .version import __version__
+
+# Themes cycled through by the benchmarks. Consecutive themes always differ, so no reskin gets skipped as redundant.
+BENCHMARK_THEMES: Tuple[str, ...] = ("DarkBlue3", "LightGreen", "DarkAmber", "Reddit")
+# The element counts of the default synthetic layout.
+DEFAULT_COUNTS: Dict[str, int] = {
+    "buttons": 40,
+    "ttk_buttons": 20,
+    "menus": 3,
+    "menu_depth": 4,
+    "menu_width": 8,
+    "combos": 20,
+    "tables": 4,
+    "trees": 4,
+    "tab_groups": 2,
+    "tabs": 4,
+    "scrollable_columns": 4,
+    "texts": 40,
+    "images": 0,
+}
+# The element counts of the synthetic layout used by the memory benchmark, which opens thousands of windows.
+MEMORY_COUNTS: Dict[str, int] = {
+    **{element: 1 for element in DEFAULT_COUNTS},
+    "tabs": 2,
+    "images": 1,
+    "menu_depth": 2,
+    "menu_width": 2,
+}
+# Regressions are reported when a metric is this much (relatively) worse than the baseline.
+DEFAULT_THRESHOLD = 0.1
+# The memory benchmark fails when more than this many bytes are retained after its cycles.
+DEFAULT_MEMORY_THRESHOLD = 1024 * 1024
+ROW_LENGTH = 10
+
+
+def _deep_menu(depth: int, width: int) -> List:
+    items = [f"Item {index}" for index in range(width)]
+    if depth > 1:
+        items += ["Submenu", _deep_menu(depth - 1, width)]
+    return items
+
+
+def _rows(elements: List[Element]) -> List[List[Element]]:
+    return [
+        elements[index : index + ROW_LENGTH]
+        for index in range(0, len(elements), ROW_LENGTH)
+    ]
+
+
+def synthetic_layout(**counts: int) -> List[List[Element]]:
+    """
+    Generates a layout with the given number of each element type handled by `reskin()`. Counts which aren't given
+    are taken from `DEFAULT_COUNTS`. A new layout has to be generated for every window.
+
+    First available from v3.2.0.
+    :param counts: Any of the keys of `DEFAULT_COUNTS`.
+    :return: The layout.
+    """
+    unknown = set(counts) - set(DEFAULT_COUNTS)
+    if unknown:
+        raise ValueError(f"Unknown element counts: {', '.join(sorted(unknown))}.")
+    counts = {**DEFAULT_COUNTS, **counts}
+    menu = _deep_menu(counts["menu_depth"], counts["menu_width"])
+    tree_data = TreeData()
+    for index in range(10):
+        tree_data.insert("", f"-NODE{index}-", f"Node {index}", [index])
+
+    layout = []
+    if counts["menus"]:
+        layout.append(
+            [Menu([[f"Menu {index}", menu] for index in range(counts["menus"])])]
+        )
+    layout += _rows(
+        [Text(f"Text {index}", k=f"-TEXT{index}-") for index in range(counts["texts"])]
+    )
+    layout += _rows([Image(k=f"-IMAGE{index}-") for index in range(counts["images"])])
+    layout += _rows(
+        [
+            Button(f"Button {index}", k=f"-BUTTON{index}-", right_click_menu=["", menu])
+            for index in range(counts["buttons"])
+        ]
+    )
+    layout += _rows(
+        [
+            Button(f"Ttk {index}", k=f"-TTKBUTTON{index}-", use_ttk_buttons=True)
+            for index in range(counts["ttk_buttons"])
+        ]
+    )
+    layout += _rows(
+        [
+            Combo(["a", "b", "c"], k=f"-COMBO{index}-")
+            for index in range(counts["combos"])
+        ]
+    )
+    layout += _rows(
+        [
+            Table([[index, "row"]] * 10, ["#", "Row"], k=f"-TABLE{index}-")
+            for index in range(counts["tables"])
+        ]
+    )
+    layout += _rows(
+        [
+            Tree(tree_data, ["Value"], k=f"-TREE{index}-")
+            for index in range(counts["trees"])
+        ]
+    )
+    layout += [
+        [
+            TabGroup(
+                [
+                    [
+                        Tab(f"Tab {index}", [[Text(f"Tab {index}")]])
+                        for index in range(counts["tabs"])
+                    ]
+                ],
+                k=f"-TABGROUP{group}-",
+            )
+        ]
+        for group in range(counts["tab_groups"])
+    ]
+    layout += _rows(
+        [
+            Column(
+                [[Text(f"Line {line}")] for line in range(5)],
+                scrollable=True,
+                k=f"-COLUMN{index}-",
+            )
+            for index in range(counts["scrollable_columns"])
+        ]
+    )
+    return layout
+
+
+def load_layout(spec: str) -> Callable[[], List[List[Element]]]:
+    """
+    Loads a layout factory from a module, so that benchmarks and profiles can run against real-world layouts.
+
+    First available from v3.2.0.
+    :param spec: The module (an importable name or the path of a Python file) and the name of a callable in it which
+        returns a fresh layout every time it's called, separated by a colon; e.g. `my_app.layouts:main_layout`.
+    :return: The layout factory.
+    """
+    module_name, _, factory_name = spec.rpartition(":")
+    if not module_name or not factory_name:
+        raise ValueError(f"`{spec}` isn't in the format module:factory.")
+    if module_name.endswith(".py") or os.sep in module_name:
+        module_spec = spec_from_file_location(
+            os.path.splitext(os.path.basename(module_name))[0], module_name
+        )
+        module = module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        module = import_module(module_name)
+    factory = getattr(module, factory_name)
+    if not callable(factory):
+        raise ValueError(f"`{spec}` isn't callable; it should return a layout.")
+    return factory
+
+
+def _layout(
+    layout: Optional[Callable[[], List[List[Element]]]], counts: Dict[str, int]
+) -> List[List[Element]]:
+    return layout() if layout is not None else synthetic_layout(**counts)
+
+
+def _theme(index: int) -> str:
+    """
+    The theme to switch to at the given step; windows start out with the first one.
+    """
+    return BENCHMARK_THEMES[(index + 1) % len(BENCHMARK_THEMES)]
+
+
+def _window(layout: List[List[Element]], mock: bool) -> Tuple[Any, Optional[TkBackend]]:
+    if mock:
+        window, backend = MockWindow("Reskinner Benchmark", layout), MockBackend()
+    else:
+        window, backend = Window("Reskinner Benchmark", layout, finalize=True), None
+    WINDOW_THEME_MAP[window] = (
+        BENCHMARK_THEMES[0],
+        LOOK_AND_FEEL_TABLE[BENCHMARK_THEMES[0]],
+    )
+    return window, backend
+
+
+def _draw_images(window: Any, backend: Optional[TkBackend]) -> List[Any]:
+    """
+    Gives every Image element of a window a photo drawn in the window's theme, for `image_tint_handler` to tint. The
+    photos are returned, and have to be kept referenced for as long as they're displayed.
+    """
+    backend = backend if backend is not None else TkBackend()
+    theme_dict = WINDOW_THEME_MAP[window][1]
+    pixels = b"".join(
+        bytes.fromhex(theme_dict[key].lstrip("#"))
+        for key in ("BACKGROUND", "TEXT", "INPUT", "SCROLL")
+    )
+    photos = []
+    for element in window.element_list():
+        if isinstance(element, Image):
+            photo = backend.create_photo(element.widget, 2, 2, pixels, (3,))
+            backend.configure(element.widget, {"image": str(photo)})
+            photos.append(photo)
+    return photos
+
+
+def _close(window: Any) -> None:
+    WINDOW_THEME_MAP.pop(window, None)
+    if isinstance(window, Window):
+        window.close()
+
+
+class _FrameClock(RecordingBackend):
+    """
+    Passes operations on without logging them, and timestamps every window refresh (i.e. every frame).
+    """
+
+    def __init__(self, backend: Optional[TkBackend] = None):
+        super().__init__(backend)
+        self.timestamps: List[float] = []
+
+    def _record(self, kind: str, target: Any, options: Dict) -> bool:
+        return True
+
+    def refresh(self, window, strategy: str = REFRESH_UPDATE) -> None:
+        super().refresh(window, strategy)
+        self.timestamps.append(perf_counter())
+
+
+def bench_reskin(
+    repeat: int = 20,
+    mock: bool = False,
+    layout: Optional[Callable[[], List[List[Element]]]] = None,
+    **counts: int,
+) -> Dict[str, float]:
+    """
+    Times full `reskin()` passes over a synthetic window.
+
+    First available from v3.2.0.
+    :param repeat: The number of passes.
+    :param mock: If True, the mock backend gets used instead of a real window.
+    :param layout: A callable returning the layout to use instead of the synthetic one.
+    :param counts: The element counts of the synthetic layout.
+    :return: The timing summary.
+    """
+    window, backend = _window(_layout(layout, counts), mock)
+    samples = []
+    try:
+        for index in range(repeat):
+            start = perf_counter()
+            reskin(
+                window,
+                _theme(index),
+                theme,
+                LOOK_AND_FEEL_TABLE,
+                set_future=False,
+                backend=backend,
+            )
+            samples.append(perf_counter() - start)
+    finally:
+        _close(window)
+    return _summary(samples)
+
+
+def bench_reskin_all(
+    repeat: int = 5,
+    windows: int = 15,
+    mock: bool = False,
+    layout: Optional[Callable[[], List[List[Element]]]] = None,
+    **counts: int,
+) -> Dict[str, float]:
+    """
+    Times `reskin_all()` passes over a number of synthetic windows open at once.
+
+    First available from v3.2.0.
+    :param repeat: The number of passes.
+    :param windows: The number of windows.
+    :param mock: If True, the mock backend gets used instead of real windows.
+    :param layout: A callable returning the layout to use instead of the synthetic one.
+    :param counts: The element counts of the synthetic layout.
+    :return: The timing summary.
+    """
+    opened = [_window(_layout(layout, counts), mock) for _ in range(windows)]
+    backend = opened[0][1]
+    samples = []
+    try:
+        for index in range(repeat):
+            start = perf_counter()
+            reskin_all(
+                _theme(index),
+                theme,
+                LOOK_AND_FEEL_TABLE,
+                set_future=False,
+                backend=backend,
+            )
+            samples.append(perf_counter() - start)
+    finally:
+        for window, _ in opened:
+            _close(window)
+    return _summary(samples)
+
+
+def bench_animated_reskin(
+    repeat: int = 3,
+    duration_in_milliseconds: float = 450,
+    mock: bool = False,
+    layout: Optional[Callable[[], List[List[Element]]]] = None,
+    **counts: int,
+) -> Dict[str, float]:
+    """
+    Times every frame of `animated_reskin()` runs over a synthetic window.
+
+    First available from v3.2.0.
+    :param repeat: The number of animations.
+    :param duration_in_milliseconds: The duration of each animation.
+    :param mock: If True, the mock backend gets used instead of a real window.
+    :param layout: A callable returning the layout to use instead of the synthetic one.
+    :param counts: The element counts of the synthetic layout.
+    :return: The frame time summary, along with the number of frames rendered and the achieved FPS.
+    """
+    window, backend = _window(_layout(layout, counts), mock)
+    clock = _FrameClock(backend)
+    frame_times = []
+    try:
+        for index in range(repeat):
+            clock.timestamps = [perf_counter()]
+            animated_reskin(
+                window,
+                _theme(index),
+                theme,
+                LOOK_AND_FEEL_TABLE,
+                set_future=False,
+                duration_in_milliseconds=duration_in_milliseconds,
+                backend=clock,
+            )
+            frame_times += [
+                end - start
+                for start, end in zip(clock.timestamps, clock.timestamps[1:])
+            ]
+    finally:
+        _close(window)
+    summary = _summary(frame_times)
+    summary["frames"] = len(frame_times)
+    summary["fps"] = 1000 / summary["mean_ms"] if frame_times else 0.0
+    return summary
+
+
+def bench_theme_compilation(repeat: int = 200) -> Dict[str, float]:
+    """
+    Times the creation of a ColorProcessor and the resolution of every color of the new theme, which is the work done
+    before any element gets touched.
+
+    First available from v3.2.0.
+    :param repeat: The number of compilations.
+    :return: The timing summary.
+    """
+    backend = MockBackend()
+    samples = []
+    for index in range(repeat):
+        old_theme = BENCHMARK_THEMES[index % len(BENCHMARK_THEMES)]
+        new_theme = BENCHMARK_THEMES[(index + 1) % len(BENCHMARK_THEMES)]
+        start = perf_counter()
+        cp = ColorProcessor(
+            LOOK_AND_FEEL_TABLE[old_theme],
+            LOOK_AND_FEEL_TABLE[new_theme],
+            backend.styler(),
+            backend=backend,
+        )
+        for theme_dict_key in THEME_COLOR_KEYS:
+            cp._processed(theme_dict_key, lambda: "black")
+        samples.append(perf_counter() - start)
+    return _summary(samples)
+
+
+def bench_import(repeat: int = 5) -> Dict[str, Any]:
+    """
+    Times importing Reskinner in a fresh interpreter, minus the time taken by an interpreter which imports nothing.
+    Importing the package should be free of side effects, so it also checks that PySimpleGUI, Tkinter and colour
+    only get imported once `reskin` is accessed, and times that as well.
+
+    First available from v3.2.0.
+    :param repeat: The number of imports.
+    :return: The timing summary of the bare import, the median time taken to import `reskin`, and whether the bare
+        import was free of heavy imports.
+    """
+
+    def _run(code: str) -> Tuple[float, int]:
+        start = perf_counter()
+        returncode = subprocess.run([sys.executable, "-c", code]).returncode
+        return perf_counter() - start, returncode
+
+    heavy = ("PySimpleGUI", "tkinter", "colour")
+    samples, reskin_samples, side_effect_free = [], [], True
+    for _ in range(repeat):
+        baseline, _ = _run("pass")
+        seconds, returncode = _run(
+            f"import sys, {__package__}; sys.exit(any(module in sys.modules for module in {heavy!r}))"
+        )
+        samples.append(max(seconds - baseline, 0))
+        side_effect_free &= returncode == 0
+        seconds, _ = _run(f"from {__package__} import reskin")
+        reskin_samples.append(max(seconds - baseline, 0))
+    summary = _summary(samples)
+    summary["reskin_median_ms"] = _summary(reskin_samples)["median_ms"]
+    summary["passed"] = side_effect_free
+    return summary
+
+
+def cache_sizes() -> Dict[str, int]:
+    """
+    Reports the number of entries held by each of Reskinner's module-level caches.
+
+    First available from v3.2.0.
+    :return: The size of each cache, keyed by its name.
+    """
+    from . import colorprocessor, default, handlers, tinting, utilities
+    from .backend import _COMBO_LISTBOXES
+
+    return {
+        "WINDOW_THEME_MAP": len(WINDOW_THEME_MAP),
+        "_is_valid_color": colorprocessor._is_valid_color.cache_info().currsize,
+        "_color": colorprocessor._color.cache_info().currsize,
+        "_cgetde": default._cgetde.cache_info().currsize,
+        "_normalize_tk_color": default._normalize_tk_color.cache_info().currsize,
+        "_lower_type_name": utilities._lower_type_name.cache_info().currsize,
+        "_default_element_name": default._default_element_name.cache_info().currsize,
+        "_default_combo_listbox_option": colorprocessor._default_combo_listbox_option.cache_info().currsize,
+        "_WIDGET_CAPABILITIES": len(utilities._WIDGET_CAPABILITIES),
+        "_MENU_ENTRY_OPTIONS": len(colorprocessor._MENU_ENTRY_OPTIONS),
+        "_MENU_ENTRY_TYPES": len(colorprocessor._MENU_ENTRY_TYPES),
+        "_TAG_PLANS": len(colorprocessor._TAG_PLANS),
+        "_COMBO_LISTBOXES": len(_COMBO_LISTBOXES),
+        "_RESOLVED_HANDLERS": len(handlers._RESOLVED_HANDLERS),
+        "_ORIGINALS": len(tinting._ORIGINALS),
+        "_TINTED": len(tinting._TINTED),
+        "_TINT_SOURCES": len(tinting._TINT_SOURCES),
+    }
+
+
+def bench_memory(
+    cycles: int = 2000,
+    mock: bool = False,
+    threshold: int = DEFAULT_MEMORY_THRESHOLD,
+    warmup: int = 20,
+    layout: Optional[Callable[[], List[List[Element]]]] = None,
+    **counts: int,
+) -> Dict[str, Any]:
+    """
+    Cycles themes the way long-running applications do: every cycle opens a window, reskins it, animates a reskin,
+    lazily reskins it (leaving a reskin of its non-selected tab deferred) and closes it. When NumPy is installed, the
+    images of Image elements get tinted along. Memory is traced with `tracemalloc`, and the benchmark fails if more
+    than `threshold` bytes are retained once the cycles are over.
+
+    First available from v3.2.0.
+    :param cycles: The number of cycles.
+    :param mock: If True, the mock backend gets used instead of real windows.
+    :param threshold: The number of retained bytes above which the benchmark fails.
+    :param warmup: The number of cycles run before the first snapshot, so that caches bounded by design fill up.
+    :param layout: A callable returning the layout to use instead of the synthetic one.
+    :param counts: The element counts of the synthetic layout. Defaults to `MEMORY_COUNTS`.
+    :return: The retained memory, the size of every cache, the top allocation sites and whether the benchmark passed.
+    """
+    counts = {**MEMORY_COUNTS, **counts}
+    try:
+        _numpy()
+        tint = True
+    except ReskinnerException:
+        tint = False
+
+    def _cycle(index: int) -> None:
+        window, backend = _window(_layout(layout, counts), mock)
+        photos = _draw_images(window, backend) if tint else []
+        reskin(
+            window, _theme(index), theme, LOOK_AND_FEEL_TABLE, False, backend=backend
+        )
+        animated_reskin(
+            window,
+            _theme(index + 1),
+            theme,
+            LOOK_AND_FEEL_TABLE,
+            False,
+            duration_in_milliseconds=10,
+            backend=backend,
+        )
+        # Leaves a reskin of the non-selected tab deferred, which mustn't keep the window alive once it's closed.
+        reskin(
+            window,
+            _theme(index + 2),
+            theme,
+            LOOK_AND_FEEL_TABLE,
+            False,
+            backend=backend,
+            lazy=True,
+        )
+        if isinstance(window, Window):
+            window.close()
+        del photos
+
+    previous_handler = _ELEMENT_HANDLERS.get(Image)
+    if tint:
+        register_handler(Image, image_tint_handler)
+    try:
+        for index in range(warmup):
+            _cycle(index)
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        start = perf_counter()
+        for index in range(cycles):
+            _cycle(index)
+        duration = perf_counter() - start
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        if previous_handler is not None:
+            register_handler(Image, previous_handler)
+        else:
+            unregister_handler(Image)
+    statistics = after.compare_to(before, "lineno")
+    retained = sum(statistic.size_diff for statistic in statistics)
+    return {
+        "cycles": cycles,
+        "seconds": duration,
+        "retained_bytes": retained,
+        "threshold_bytes": threshold,
+        "passed": retained <= threshold,
+        "cache_sizes": cache_sizes(),
+        "top_allocations": [
+            f"{statistic.traceback}: {statistic.size_diff:+d} B"
+            for statistic in statistics[:5]
+            if statistic.size_diff > 0
+        ],
+    }
+
+
+def run_benchmarks(
+    mock: bool = False,
+    repeat: int = 20,
+    include: Optional[Sequence[str]] = None,
+    layout: Optional[Callable[[], List[List[Element]]]] = None,
+    **counts: int,
+) -> Dict[str, Any]:
+    """
+    Runs the benchmark suite.
+
+    First available from v3.2.0.
+    :param mock: If True, the mock backend gets used instead of real windows.
+    :param repeat: The number of reskin passes to be timed. Other benchmarks scale their repetitions from it.
+    :param include: The names of the benchmarks to run. Defaults to all of them but the (lengthy) memory benchmark.
+    :param layout: A callable returning the layout to use instead of the synthetic one.
+    :param counts: The element counts of the synthetic layout.
+    :return: The results, along with information about the environment they were obtained in.
+    """
+    benchmarks: Dict[str, Callable[[], Dict[str, float]]] = {
+        "reskin": lambda: bench_reskin(repeat, mock, layout, **counts),
+        "reskin_all": lambda: bench_reskin_all(
+            max(repeat // 4, 1), mock=mock, layout=layout, **counts
+        ),
+        "animated_reskin": lambda: bench_animated_reskin(
+            max(repeat // 10, 1), mock=mock, layout=layout, **counts
+        ),
+        "theme_compilation": lambda: bench_theme_compilation(repeat * 10),
+        "import": lambda: bench_import(max(repeat // 4, 1)),
+        "memory": lambda: bench_memory(repeat * 100, mock, layout=layout, **counts),
+    }
+    unknown = set(include or ()) - set(benchmarks)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}.")
+    return {
+        "meta": {
+            "reskinner": __version__,
+            "pysimplegui": psg_version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": "mock" if mock else "tk",
+            "counts": {**DEFAULT_COUNTS, **counts} if layout is None else None,
+            "layout": getattr(layout, "__qualname__", None),
+        },
+        "results": {
+            name: benchmark()
+            for name, benchmark in benchmarks.items()
+            if name in (include or set(benchmarks) - {"memory"})
+        },
+    }
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare_results(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    thresholds: Optional[Dict[str, float]] = None,
+    metric: str = "median_ms",
+) -> List[str]:
+    """
+    Compares benchmark results against a baseline.
+
+    First available from v3.2.0.
+    :param results: The results, as returned by `run_benchmarks`.
+    :param baseline: The baseline results, in the same format.
+    :param threshold: The relative slowdown above which a benchmark counts as a regression.
+    :param thresholds: Thresholds for specific benchmarks, overriding `threshold`.
+    :param metric: The metric to compare.
+    :return: A description of every regression found.
+    """
+    thresholds = thresholds or {}
+    regressions = []
+    for name, result in results["results"].items():
+        previous = baseline["results"].get(name, {}).get(metric)
+        if not previous or metric not in result:
+            continue
+        change = result[metric] / previous - 1
+        if change > thresholds.get(name, threshold):
+            regressions.append(
+                f"{name}: {metric} went from {previous:.3f} to {result[metric]:.3f} ({change:+.1%})."
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> int:
+    """
+    Runs the benchmark suite from the command line.
+
+    First available from v3.2.0.
+    :param argv: The command line arguments.
+    :param prog: The name of the program, as shown in the help.
+    :return: The exit code; 1 if any regressions were found, else 0.
+    """
+    parser = ArgumentParser(
+        prog=prog or f"python -m {__package__}.benchmark", description=__doc__
+    )
+    parser.add_argument("--mock", action="store_true", help="Use the mock backend.")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--only", nargs="+", metavar="BENCHMARK")
+    parser.add_argument("--output", help="Save the results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare against results saved earlier.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--count",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("ELEMENT", "COUNT"),
+        help=f"Element counts of the synthetic layout; any of {', '.join(DEFAULT_COUNTS)}.",
+    )
+    parser.add_argument(
+        "--layout",
+        metavar="MODULE:FACTORY",
+        help="Benchmark the layout returned by a callable instead of the synthetic layout.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.mock,
+        args.repeat,
+        args.only,
+        load_layout(args.layout) if args.layout else None,
+        **{element: int(count) for element, count in args.count},
+    )
+    for name, result in results["results"].items():
+        print(
+            f"{name:<20}"
+            + "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in result.items()
+            )
+        )
+    if args.output:
+        save_results(results, args.output)
+    if not all(result.get("passed", True) for result in results["results"].values()):
+        return 1
+    if args.baseline:
+        regressions = compare_results(
+            results, load_results(args.baseline), args.threshold
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+"""
+The command line interface of Reskinner, run with `python -m psg_reskinner`.
+
+- `demo` (the default) runs the demo.
+- `bench` runs the benchmark suite; see `psg_reskinner.benchmark`.
+- `profile` reskins a layout with statistics on, and prints what each element type and ColorProcessor method cost.
+- `export-colors` exports the colors a reskin of a layout would apply, as the operations it would perform.
+- `record` saves the journal of a reskin of a layout, which `replay` applies (and times) again.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
+from contextlib import nullcontext
+from typing import Any, List, Optional, Sequence, Tuple
+
+from PySimpleGUI import LOOK_AND_FEEL_TABLE, Window, theme
+
+from .backend import TkBackend
+from .benchmark import load_layout
+from .benchmark import main as bench_main
+from .journal import JournalBackend, load_journal, replay_journal, save_journal
+from .mock import MockBackend, MockWindow
+from .profiling import ChromeTraceSink, tracing
+from .psg_reskinner import animated_reskin, dry_run
+from .psg_reskinner import main as demo_main
+from .psg_reskinner import reskin
+
+PROG = f"python -m {__package__}"
+
+
+def _window(args: Namespace) -> Tuple[Any, Optional[TkBackend]]:
+    """
+    Internal use only.
+
+    Opens a window (or a mock window) of the layout given on the command line, in the theme it's meant to start in.
+
+    First available from v3.2.0.
+    :param args: The parsed command line arguments.
+    :return: The window and the backend to reskin it through.
+    """
+    if args.from_theme:
+        theme(args.from_theme)
+    layout = load_layout(args.layout)()
+    if args.mock:
+        return MockWindow(PROG, layout), MockBackend()
+    return Window(PROG, layout, finalize=True), None
+
+
+def _close(window: Any) -> None:
+    if isinstance(window, Window):
+        window.close()
+
+
+def _table(title: str, rows: List[Tuple[str, int, float]], total: float) -> str:
+    """
+    Internal use only.
+
+    Formats costs as a table, most expensive first.
+
+    First available from v3.2.0.
+    :param title: The heading of the first column.
+    :param rows: The name, count and seconds of every row.
+    :param total: The seconds the shares are relative to.
+    :return: The table.
+    """
+    lines = [f"{title:<24}{'count':>8}{'total ms':>12}{'mean ms':>12}{'share':>9}"]
+    for name, count, seconds in sorted(rows, key=lambda row: -row[2]):
+        lines.append(
+            f"{name:<24}{count:>8}{seconds * 1000:>12.3f}"
+            f"{seconds * 1000 / max(count, 1):>12.3f}"
+            f"{seconds / total if total else 0:>9.1%}"
+        )
+    return "\n".join(lines)
+
+
+def profile(args: Namespace) -> int:
+    """
+    Reskins a layout with statistics (and optionally tracing) on, and prints a cost table per element type and per
+    ColorProcessor method.
+
+    First available from v3.2.0.
+    :param args: The parsed command line arguments.
+    :return: The exit code.
+    """
+    window, backend = _window(args)
+    sink = ChromeTraceSink()
+    try:
+        with tracing(sink) if args.trace else nullcontext():
+            if args.animated:
+                stats = animated_reskin(
+                    window,
+                    args.theme,
+                    theme,
+                    LOOK_AND_FEEL_TABLE,
+                    set_future=False,
+                    duration_in_milliseconds=args.duration,
+                    backend=backend,
+                    stats=True,
+                )
+            else:
+                stats = reskin(
+                    window,
+                    args.theme,
+                    theme,
+                    LOOK_AND_FEEL_TABLE,
+                    set_future=False,
+                    backend=backend,
+                    stats=True,
+                )
+    finally:
+        _close(window)
+    if args.trace:
+        sink.save(args.trace)
+    if not stats.frames:
+        print(f"Nothing to do; the window is already in the {args.theme} theme.")
+        return 0
+    print(
+        _table(
+            "element type",
+            [
+                (name, stats.element_counts[name], seconds)
+                for name, seconds in stats.element_seconds.items()
+            ],
+            stats.seconds,
+        )
+    )
+    print()
+    print(
+        _table(
+            "method",
+            [
+                (name, stats.method_calls[name], seconds)
+                for name, seconds in stats.method_seconds.items()
+            ],
+            stats.seconds,
+        )
+    )
+    print()
+    print(
+        f"{stats.frames} frame(s) in {stats.seconds * 1000:.3f} ms ({stats.fps:.1f} FPS); "
+        f"{stats.operations_issued} operations issued, {stats.operations_skipped} skipped; "
+        f"{stats.refresh_seconds * 1000:.3f} ms refreshing."
+    )
+    return 0
+
+
+def export_colors(args: Namespace) -> int:
+    """
+    Writes the operations a reskin of a layout would perform, along with the colors each of them would apply, to a
+    JSON file (or prints them). Nothing gets applied.
+
+    First available from v3.2.0.
+    :param args: The parsed command line arguments.
+    :return: The exit code.
+    """
+    window, backend = _window(args)
+    try:
+        operations = dry_run(
+            window, args.theme, theme, LOOK_AND_FEEL_TABLE, backend=backend
+        )
+    finally:
+        _close(window)
+    _output([operation._asdict() for operation in operations], args.output)
+    return 0
+
+
+def record(args: Namespace) -> int:
+    """
+    Reskins a layout, and saves the journal of the operations applied.
+
+    First available from v3.2.0.
+    :param args: The parsed command line arguments.
+    :return: The exit code.
+    """
+    window, backend = _window(args)
+    journal = JournalBackend(backend)
+    old_theme = theme()
+    try:
+        reskin(
+            window,
+            args.theme,
+            theme,
+            LOOK_AND_FEEL_TABLE,
+            set_future=False,
+            backend=journal,
+        )
+    finally:
+        _close(window)
+    save_journal(
+        journal.entries,
+        args.output,
+        {"layout": args.layout, "from_theme": old_theme, "theme": args.theme},
+    )
+    print(f"Recorded {len(journal.entries)} operations to {args.output}.")
+    return 0
+
+
+def replay(args: Namespace) -> int:
+    """
+    Replays a journal, and prints how long applying its operations took.
+
+    First available from v3.2.0.
+    :param args: The parsed command line arguments.
+    :return: The exit code.
+    """
+    _, entries = load_journal(args.journal)
+    _output(
+        replay_journal(entries, MockBackend() if args.mock else None, args.repeat),
+        None,
+    )
+    return 0
+
+
+def _output(data: Any, path: Optional[str]) -> None:
+    if path:
+        with open(path, "w") as file:
+            json.dump(data, file, indent=2)
+    else:
+        print(json.dumps(data, indent=2))
+
+
+def _add_window_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "layout",
+        metavar="MODULE:FACTORY",
+        help="A callable returning the layout, e.g. my_app.layouts:main_layout.",
+    )
+    parser.add_argument("--theme", default="DarkBlue3", help="The theme to reskin to.")
+    parser.add_argument("--from-theme", help="The theme the window starts out in.")
+    parser.add_argument("--mock", action="store_true", help="Use the mock backend.")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the command line interface.
+
+    First available from v3.2.0.
+    :param argv: The command line arguments.
+    :return: The exit code.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # The benchmark suite parses its own arguments.
+    if argv[:1] == ["bench"]:
+        return bench_main(argv[1:], prog=f"{PROG} bench")
+
+    parser = ArgumentParser(
+        prog=PROG, description=__doc__, formatter_class=RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    commands.add_parser("demo", help="Run the demo (the default).")
+
+    commands.add_parser("bench", help="Run the benchmark suite.")
+
+    profile_parser = commands.add_parser(
+        "profile", help="Print what reskinning a layout costs, per element type."
+    )
+    _add_window_arguments(profile_parser)
+    profile_parser.add_argument(
+        "--animated", action="store_true", help="Profile an animated reskin."
+    )
+    profile_parser.add_argument(
+        "--duration", type=float, default=450, help="The animation duration in ms."
+    )
+    profile_parser.add_argument(
+        "--trace", metavar="PATH", help="Save a Chrome trace of the reskin."
+    )
+
+    export_parser = commands.add_parser(
+        "export-colors", help="Export the colors a reskin of a layout would apply."
+    )
+    _add_window_arguments(export_parser)
+    export_parser.add_argument("--output", metavar="PATH")
+
+    record_parser = commands.add_parser(
+        "record", help="Save the journal of a reskin of a layout."
+    )
+    _add_window_arguments(record_parser)
+    record_parser.add_argument(
+        "--output", metavar="PATH", required=True, help="Ends in .gz to compress."
+    )
+
+    replay_parser = commands.add_parser(
+        "replay", help="Apply (and time) the operations of a journal again."
+    )
+    replay_parser.add_argument("journal", metavar="PATH")
+    replay_parser.add_argument(
+        "--mock", action="store_true", help="Use the mock backend."
+    )
+    replay_parser.add_argument("--repeat", type=int, default=1)
+
+    args = parser.parse_args(argv)
+    if args.command == "profile":
+        return profile(args)
+    if args.command == "export-colors":
+        return export_colors(args)
+    if args.command == "record":
+        return record(args)
+    if args.command == "replay":
+        return replay(args)
+    demo_main()
+    return 0
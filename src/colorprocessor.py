@@ -25,12 +25,13 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
-from functools import cache
+from functools import cache, lru_cache
 from tkinter import Frame as TKFrame
 from tkinter import Menu as TKMenu
 from tkinter import Widget
 from tkinter.ttk import Style
-from typing import Any, Callable, Dict, Tuple, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from PySimpleGUI import (
     COLOR_SYSTEM_DEFAULT,
@@ -39,6 +40,7 @@ from PySimpleGUI import (
     Column,
     Combo,
     Element,
+    Multiline,
     OptionMenu,
     ProgressBar,
     Radio,
@@ -50,6 +52,7 @@ from PySimpleGUI import (
 from PySimpleGUI.PySimpleGUI import _hex_to_hsl, _hsl_to_rgb  # noqa
 from colour import Color
 
+from .backend import RecordingBackend, TkBackend, _combo_listbox
 from .constants import (
     HSL_INTERPOLATION,
     HUE_INTERPOLATION,
@@ -58,9 +61,81 @@ from .constants import (
     SCROLLBAR_BACKGROUND_COLOR,
     SCROLLBAR_FRAME_COLOR,
     SCROLLBAR_TROUGH_COLOR,
+    THEME_COLOR_KEYS,
 )
-from .default import _default_elements, _default_window
-from .utilities import _lower_class_name, clamp
+from .default import _cgetde, _cgetdw, _default_element_name, _default_elements
+from .utilities import _group_by_options, _tcl_command, clamp
+
+# The options supported by each type of menu entry (command, cascade, separator, tearoff etc.).
+_MENU_ENTRY_OPTIONS: Dict[str, FrozenSet[str]] = {}
+# The entry types of every menu encountered, along with the index of its last entry when they were cached.
+_MENU_ENTRY_TYPES: WeakKeyDictionary = WeakKeyDictionary()
+# The tag plan of every Table/Tree/Multiline/Canvas widget encountered, along with the tag set it was planned for.
+_TAG_PLANS: WeakKeyDictionary = WeakKeyDictionary()
+# The theme colors that the colors of Table/Tree row tags are matched against, in order of preference for themes that
+# use the same color for different keys.
+_ROW_TAG_THEME_KEYS: Dict[str, Tuple[Union[str, Tuple[str, int]], ...]] = {
+    "background": (
+        "BACKGROUND",
+        "INPUT",
+        ("BUTTON", 1),
+        "SCROLL",
+        ("PROGRESS", 1),
+        ("PROGRESS", 0),
+        "TEXT_INPUT",
+        "TEXT",
+        ("BUTTON", 0),
+    ),
+    "foreground": (
+        "TEXT",
+        "TEXT_INPUT",
+        ("BUTTON", 0),
+        "INPUT",
+        "BACKGROUND",
+        ("BUTTON", 1),
+        "SCROLL",
+        ("PROGRESS", 0),
+        ("PROGRESS", 1),
+    ),
+}
+# The tags grouping canvas items by the theme key of their fill or outline color.
+_CANVAS_ITEM_TAGS: Dict[Tuple[str, Union[str, Tuple[str, int]]], str] = {
+    (option, theme_dict_key): "reskinner:{}:{}".format(
+        option,
+        (
+            theme_dict_key
+            if isinstance(theme_dict_key, str)
+            else ".".join(map(str, theme_dict_key))
+        ),
+    )
+    for option in ("fill", "outline")
+    for theme_dict_key in THEME_COLOR_KEYS
+}
+# The same for Multiline text tags, whose colors usually come from the input colors.
+_TEXT_TAG_THEME_KEYS: Dict[str, Tuple[Union[str, Tuple[str, int]], ...]] = {
+    "background": (
+        "INPUT",
+        "BACKGROUND",
+        ("BUTTON", 1),
+        "SCROLL",
+        ("PROGRESS", 1),
+        ("PROGRESS", 0),
+        "TEXT_INPUT",
+        "TEXT",
+        ("BUTTON", 0),
+    ),
+    "foreground": (
+        "TEXT_INPUT",
+        "TEXT",
+        ("BUTTON", 0),
+        "BACKGROUND",
+        "INPUT",
+        ("BUTTON", 1),
+        "SCROLL",
+        ("PROGRESS", 0),
+        ("PROGRESS", 1),
+    ),
+}
 
 
 def _pbcompute(theme_dict: Dict, create_new_copy: bool = True):
@@ -76,38 +151,27 @@ def _pbcompute(theme_dict: Dict, create_new_copy: bool = True):
     return theme_dict
 
 
-def _cgetde(element_name: str, attribute: str):
+@lru_cache(maxsize=1024)
+def _color(color: str) -> Color:
     """
     Internal use only.
 
-    Shortcut function that calls the cget function of a default element.
+    Parses a color string. Results are cached (within bounds), so that every theme's palette only gets parsed once;
+    the Color objects returned must therefore never be modified.
 
-    First available from v3.0.0.
-    :param element_name: The name of the element.
-    :param attribute: The attribute to pass to the cget function.
-    :return: The result of the cget function.
+    First available from v3.2.0.
+    :param color: A valid color string.
+    :return: The Color object.
     """
-    return _default_elements[element_name].widget[attribute]
-
-
-def _cgetdw(attribute: str):
-    """
-    Internal use only.
-
-    Shortcut function that calls the cget function of the default window.
-
-    First available from v3.0.0.
-    :param attribute: The attribute to pass to the cget function.
-    :return: The result of the cget function.
-    """
-    return _default_window.TKroot[attribute]
+    return Color(color)
 
 
+@lru_cache(maxsize=1024)
 def _is_valid_color(color: str) -> bool:
     """
     Internal use only.
 
-    Checks if a color is valid or not
+    Checks if a color is valid or not. Results are cached (within bounds), since themes only use so many colors.
 
     First available from v3.0.0.
     :param color: A color string to be checked.
@@ -123,25 +187,10 @@ def _is_valid_color(color: str) -> bool:
         return True
 
 
-def _normalize_tk_color(tk_color) -> str:
-    """
-    Internal use only.
-
-    Converts TK system colors to regular hex colors.
-
-    First available from v3.0.0.
-    :param tk_color: The TK color to be converted.
-    :return: A hex color string.
-    """
-    result = Color()
-    result.set_rgb(tuple(x / 65535 for x in _default_window.TKroot.winfo_rgb(tk_color)))
-    return result.get_hex_l()
-
-
-@cache
 def _ds(
     value: Union[str, type(COLOR_SYSTEM_DEFAULT)],
     default_function: Callable,
+    backend: TkBackend,
 ):
     """
     Internal use only.
@@ -154,11 +203,147 @@ def _ds(
 
     :param default_function: A function that returns the value that should be used as default.
     :param value: The value to check for safety.
+    :param backend: The backend through which the default gets resolved.
     :return: A TK-safe color, no matter what the input value is.
     """
     if _is_valid_color(value):
         return value
-    return _normalize_tk_color(default_function())
+    return backend.resolve_default(default_function)
+
+
+def _menu_entry_types(menu: TKMenu) -> Tuple[str, ...]:
+    """
+    Internal use only.
+
+    Obtains the types of all entries of a menu, caching them (and the options each type supports) so that menus only
+    get introspected again when their number of entries changes.
+
+    First available from v3.2.0.
+    :param menu: The Tkinter menu object.
+    :return: The entry types, in index order.
+    """
+    end = menu.index("end")
+    cached = _MENU_ENTRY_TYPES.get(menu)
+    if cached is not None and cached[0] == end:
+        return cached[1]
+    # An empty menu has no end index. This fixes issue #8. Thank you, @richnanney for reporting!
+    entry_types = (
+        tuple(menu.type(index) for index in range(end + 1)) if end is not None else ()
+    )
+    for index, entry_type in enumerate(entry_types):
+        if entry_type not in _MENU_ENTRY_OPTIONS:
+            _MENU_ENTRY_OPTIONS[entry_type] = frozenset(
+                menu.entryconfigure(index).keys()
+            )
+    _MENU_ENTRY_TYPES[menu] = (end, entry_types)
+    return entry_types
+
+
+def invalidate_menu_cache(menu: TKMenu = None) -> None:
+    """
+    Forgets the cached entry types of a menu, or of all menus if none is given. Call this after changing the entries
+    of a menu without changing how many entries it has.
+
+    First available from v3.2.0.
+    :param menu: The Tkinter menu object.
+    :return: None
+    """
+    if menu is None:
+        _MENU_ENTRY_TYPES.clear()
+    else:
+        _MENU_ENTRY_TYPES.pop(menu, None)
+
+
+def invalidate_tag_cache(widget: Widget = None) -> None:
+    """
+    Forgets the cached tag plan of a Table/Tree/Multiline/Canvas widget, or of all of them if none is given. Call this
+    after recoloring tags (or canvas items) yourself without adding or removing any.
+
+    First available from v3.2.0.
+    :param widget: The ttk Treeview, Tk Text or Tk Canvas widget.
+    :return: None
+    """
+    if widget is None:
+        _TAG_PLANS.clear()
+    else:
+        _TAG_PLANS.pop(widget, None)
+
+
+def _menu_entries(
+    entry_types: Tuple[str, ...],
+    configs: Dict[str, str],
+) -> Dict[int, Dict[str, str]]:
+    """
+    Internal use only.
+
+    Plans the configuration of every entry of a menu, skipping the options each entry doesn't support. Fixes issue
+    #11.
+
+    First available from v3.2.0.
+    :param entry_types: The entry types of the menu, as returned by `_menu_entry_types`.
+    :param configs: The configuration arguments, in the format of attribute: value.
+    :return: The options of each entry, keyed by entry index. Entries with no supported options are left out.
+    """
+    entries = {}
+    for index, entry_type in enumerate(entry_types):
+        supported = _MENU_ENTRY_OPTIONS[entry_type]
+        options = {
+            attribute: value
+            for attribute, value in configs.items()
+            if attribute in supported
+        }
+        if options:
+            entries[index] = options
+    return entries
+
+
+@cache
+def _default_combo_listbox_option(attribute: str) -> str:
+    """
+    Internal use only.
+
+    Obtains (and memoizes) an option of the listbox in the default combo's popdown window.
+
+    First available from v3.2.0.
+    :param attribute: The option to obtain.
+    :return: The value of the option.
+    """
+    combo_widget = _default_elements()["combo"].widget
+    return combo_widget.tk.call(_combo_listbox(combo_widget), "cget", f"-{attribute}")
+
+
+def _freeze(configs: Dict[str, Any]) -> Tuple:
+    """
+    Internal use only.
+
+    Converts a (possibly nested) configs dict into a hashable tuple, so that it can be used to identify a target that
+    has already been processed during a pass.
+
+    First available from v3.2.0.
+    :param configs: The configs dict to be frozen.
+    :return: A hashable representation of the configs.
+    """
+    return tuple(
+        (attribute, _freeze(value) if isinstance(value, dict) else value)
+        for attribute, value in configs.items()
+    )
+
+
+def _applies_writes(backend: TkBackend) -> bool:
+    """
+    Internal use only.
+
+    Tells whether operations issued to a backend end up applied, i.e. whether no recorder along the way dry-runs them.
+
+    First available from v3.2.0.
+    :param backend: The backend.
+    :return: True if operations get applied.
+    """
+    while isinstance(backend, RecordingBackend):
+        if backend.dry_run:
+            return False
+        backend = backend.backend
+    return True
 
 
 def checkbox_radio_selectcolor(background_color, text_color) -> str:
@@ -192,12 +377,88 @@ class ColorProcessor:
         mode: Union[
             RGB_INTERPOLATION, HUE_INTERPOLATION, HSL_INTERPOLATION
         ] = RGB_INTERPOLATION,
+        backend: Optional[TkBackend] = None,
+        processed_targets: Optional[Set[Any]] = None,
     ):
+        """
+        :param old_theme_dict: The theme the reskin starts from.
+        :param new_theme_dict: The theme the reskin goes to.
+        :param styler: The ttk Style object.
+        :param progress: How far the reskin is, from 0 to 1.
+        :param mode: The interpolation mode.
+        :param backend: The backend operations go through. Defaults to a TkBackend.
+        :param processed_targets: The set of targets processed during the current pass. ColorProcessors given the same
+            set skip each other's targets, and `new_pass()` on any of them clears it for all of them.
+        """
+        self.backend = backend if backend is not None else TkBackend()
         self.mode = mode
         self.new_theme_dict = _pbcompute(new_theme_dict)
         self.old_theme_dict = _pbcompute(old_theme_dict)
         self.progress = progress
         self.styler = styler
+        self._processed_targets = (
+            processed_targets if processed_targets is not None else set()
+        )
+        # The options and state maps of the ttk styles planned during the current pass, applied by `flush_styles`.
+        self._pending_styles: Dict[str, Dict[str, str]] = {}
+        self._pending_maps: Dict[str, Dict[str, List]] = {}
+        # The widgets whose tag plans have been checked against their tag sets, which is done once per reskin (or
+        # animation) since their tags don't change in between.
+        self._checked_tag_plans: Set[str] = set()
+        # The old theme's colors (as hex) mapped to their theme keys, for every set of theme keys tags are matched to.
+        self._old_theme_colors: Dict[Tuple, Dict[str, Any]] = {}
+        # ReskinStats, when statistics are being collected.
+        self.stats = None
+        # The tracer emitting profiling events, when reskins are being traced.
+        self.tracer = None
+
+    def new_pass(self) -> None:
+        """
+        Internal use only.
+
+        Forgets the targets processed so far. Should be called at the start of every reskin pass, so that shared
+        targets (row frames, menus, ttk styles) get processed once per pass instead of once per element. The
+        processed targets of every ColorProcessor sharing them (see `processed_targets`) get forgotten too.
+
+        First available from v3.2.0.
+        :return: None
+        """
+        self._processed_targets.clear()
+
+    def flush_styles(self) -> None:
+        """
+        Internal use only.
+
+        Applies the ttk style options and state maps planned during the current pass. PySimpleGUI gives most ttk
+        elements a style of their own, but those of similar elements end up with the same options, so styles are
+        grouped by their options and every group gets configured with a single batched Tcl script.
+
+        First available from v3.2.0.
+        :return: None
+        """
+        if self._pending_styles:
+            self.backend.configure_styles(
+                self.styler, _group_by_options(self._pending_styles)
+            )
+            self._pending_styles = {}
+        if self._pending_maps:
+            self.backend.map_styles(self.styler, _group_by_options(self._pending_maps))
+            self._pending_maps = {}
+
+    def _first_visit(self, *target) -> bool:
+        """
+        Internal use only.
+
+        Records the target as processed for the current pass.
+
+        First available from v3.2.0.
+        :param target: Anything hashable that identifies the target.
+        :return: True if the target hasn't been processed during the current pass yet, else False.
+        """
+        if target in self._processed_targets:
+            return False
+        self._processed_targets.add(target)
+        return True
 
     def _transition(
         self,
@@ -341,9 +602,9 @@ class ColorProcessor:
     ):
         self.config(
             configs,
-            element.widget.configure,
+            lambda **kwargs: self.backend.configure(element.widget, kwargs),
             lambda attribute: _cgetde(
-                _lower_class_name(element),
+                _default_element_name(type(element)),
                 attribute,
             ),
         )
@@ -357,9 +618,11 @@ class ColorProcessor:
     ):
         # if self.styler.configure(style) is None:
         #     raise ReskinnerException(f"`{style}` doesn't exist.")
+        if not self._first_visit("style", style, _freeze(configs)):
+            return
         self.config(
             configs,
-            lambda **kwargs: self.styler.configure(style, **kwargs),
+            lambda **kwargs: self._pending_styles.setdefault(style, {}).update(kwargs),
             lambda attribute: self.styler.lookup(
                 default_style, attribute, default=fallback
             ),
@@ -375,6 +638,8 @@ class ColorProcessor:
     ) -> None:
         # if self.styler.configure(style) is None:
         #     raise ReskinnerException(f"`{style}` doesn't exist.")
+        if not self._first_visit("map", style, _freeze(configs), pass_state):
+            return
         values = {
             config_k: [
                 (
@@ -393,42 +658,32 @@ class ColorProcessor:
             ]
             for config_k, config_v in configs.items()
         }
-        self.styler.map(style, **values)
+        self._pending_maps.setdefault(style, {}).update(values)
 
     def window(
         self,
         window: Window,
         configs: Dict[str, Union[str, Tuple[str, int]]],
-    ):
-        self.config(configs, window.TKroot.configure, _cgetdw)
-
-    def parent_row_frame(
-        self,
-        parent_row_frame: TKFrame,
-        configs: Dict[str, Union[str, Tuple[str, int]]],
     ):
         self.config(
             configs,
-            parent_row_frame.configure,
-            getattr(_default_elements["text"], "ParentRowFrame").cget,
+            lambda **kwargs: self.backend.configure(window.TKroot, kwargs),
+            _cgetdw,
         )
 
-    def menu_entry(
+    def parent_row_frame(
         self,
-        menu: TKMenu,
-        index: int,
+        parent_row_frame: TKFrame,
         configs: Dict[str, Union[str, Tuple[str, int]]],
     ):
-        configs = dict(
-            filter(
-                lambda item: item[0] in menu.entryconfigure(index).keys(),
-                configs.items(),
-            )
-        )  # Filter the configs for menu entries that don't accept the full config dict. Fixes issue #11.
+        if not self._first_visit("frame", str(parent_row_frame), _freeze(configs)):
+            return
         self.config(
             configs,
-            lambda **cnf: menu.entryconfigure(index, cnf),
-            lambda attribute: _cgetde("menu", attribute),
+            lambda **kwargs: self.backend.configure(parent_row_frame, kwargs),
+            lambda attribute: _default_elements()["text"].ParentRowFrame.cget(
+                attribute
+            ),
         )
 
     def combo_popdown(
@@ -436,27 +691,12 @@ class ColorProcessor:
         combo: Combo,
         configs: Dict[str, Union[str, Tuple[str, int]]],
     ):
-        def _combo_popdown_default_getter(attribute):
-            _default_window.TKroot.tk.call(
-                "eval",
-                f"set defaultcombo [ttk::combobox::PopdownWindow {_default_elements['combo'].widget}]",
-            )
-            return _default_window.TKroot.tk.call(
-                "eval", f"$defaultcombo.f.l cget -{attribute}"
-            )
-
-        combo.widget.tk.call(
-            "eval", f"set popdown [ttk::combobox::PopdownWindow {combo.widget}]"
+        self.config(
+            configs,
+            lambda **kwargs: self.backend.configure_combo_listbox(combo.widget, kwargs),
+            _default_combo_listbox_option,
         )
 
-        def _combo_popdown_configurer(**kwargs):
-            command = "$popdown.f.l configure"
-            for attribute, value in kwargs.items():
-                command += f" -{attribute} {value}"
-            combo.widget.tk.call("eval", command)
-
-        self.config(configs, _combo_popdown_configurer, _combo_popdown_default_getter)
-
     def optionmenu_menu(
         self,
         optionmenu: OptionMenu,
@@ -464,8 +704,10 @@ class ColorProcessor:
     ):
         self.config(
             configs,
-            optionmenu.widget["menu"].configure,
-            _default_elements["optionmenu"].widget["menu"].cget,
+            lambda **kwargs: self.backend.configure(optionmenu.widget["menu"], kwargs),
+            lambda attribute: _default_elements()["optionmenu"]
+            .widget["menu"]
+            .cget(attribute),
         )
 
     def scrollbar(
@@ -473,6 +715,8 @@ class ColorProcessor:
         style_name: str,
         default_style: str,
     ):
+        if not self._first_visit("scrollbar", style_name, default_style):
+            return
         self.style(
             style_name,
             {
@@ -516,72 +760,58 @@ class ColorProcessor:
         :return: None
         """
 
-        # This fixes issue #8. Thank you, @richnanney for reporting!
-        if tkmenu.index("end") is None:
+        # Menus shared by several elements (e.g. window-wide right click menus) only get walked once per pass.
+        if not self._first_visit("menu", str(tkmenu)):
             return
 
-        for index in range(0, tkmenu.index("end") + 1):
-            self.menu_entry(
-                tkmenu,
-                index,
+        # Entry types are cached per menu, and all entries get reconfigured in one go.
+        entry_types = _menu_entry_types(tkmenu)
+        if entry_types:
+            self.config(
                 {
                     "foreground": "TEXT_INPUT",
                     "background": "INPUT",
                     "activeforeground": "INPUT",
                     "activebackground": "TEXT_INPUT",
                 },
+                lambda **cnf: self.backend.configure_menu_entries(
+                    tkmenu, _menu_entries(entry_types, cnf)
+                ),
+                lambda attribute: _cgetde("menu", attribute),
             )
 
         for child in tkmenu.children.values():
-            if issubclass(type(child), TKMenu):
+            if getattr(child, "widgetName", None) == "menu":
                 self.recurse_menu(child)
 
     def scrollable_column(self, column: Column):
         self.config(
             {"background": "BACKGROUND"},
-            column.TKColFrame.configure,
-            _default_elements["column"].TKColFrame.cget,
+            lambda **kwargs: self.backend.configure(column.TKColFrame, kwargs),
+            lambda attribute: _default_elements()["column"].TKColFrame.cget(attribute),
         )
         self.config(
             {"background": "BACKGROUND"},
-            getattr(column.TKColFrame, "canvas").children["!frame"].configure,
-            getattr(_default_elements["column"].TKColFrame, "canvas")
+            lambda **kwargs: self.backend.configure(
+                getattr(column.TKColFrame, "canvas").children["!frame"], kwargs
+            ),
+            lambda attribute: getattr(
+                _default_elements()["column"].TKColFrame, "canvas"
+            )
             .children["!frame"]
-            .cget,
+            .cget(attribute),
         )
 
     def combo(self, combo: Combo):
         # Configuring the listbox of the combo.
-        def _combo_listbox_default_getter(default_attribute):
-            cache(
-                lambda: _default_window.TKroot.tk.call(
-                    "eval",
-                    f"set defaultcombo [ttk::combobox::PopdownWindow {_default_elements['combo'].widget}]",
-                )
-            )()
-            return _default_window.TKroot.tk.call(
-                "eval", f"$defaultcombo.f.l cget -{default_attribute}"
-            )
-
-        combo.widget.tk.call(
-            "eval", f"set popdown [ttk::combobox::PopdownWindow {combo.widget}]"
-        )
-
-        def _combo_listbox_configurer(**kwargs):
-            for attribute, value in kwargs.items():
-                combo.widget.tk.call(
-                    "eval", f"$popdown.f.l configure -{attribute} {value}"
-                )
-
-        self.config(
+        self.combo_popdown(
+            combo,
             {
                 "background": "INPUT",
                 "foreground": "TEXT_INPUT",
                 "selectforeground": "INPUT",
                 "selectbackground": "TEXT_INPUT",
             },
-            _combo_listbox_configurer,
-            _combo_listbox_default_getter,
         )
         # Configuring the combo itself.
         style_name = combo.widget["style"]
@@ -595,7 +825,7 @@ class ColorProcessor:
                 "background": ("BUTTON", 1),
                 "arrowcolor": ("BUTTON", 0),
             },
-            _cgetde("combo", "style"),
+            self.backend.default_option("combo", "style"),
         )
         self.map(
             style_name,
@@ -603,12 +833,12 @@ class ColorProcessor:
                 "foreground": {"readonly": "TEXT_INPUT"},
                 "fieldbackground": {"readonly": "INPUT"},
             },
-            _cgetde("combo", "style"),
+            self.backend.default_option("combo", "style"),
             True,
         )
 
     def checkbox_or_radio(self, element: Union[Checkbox, Radio]):
-        element_name = _lower_class_name(element)
+        element_name = _default_element_name(type(element))
         toggle = checkbox_radio_selectcolor(
             self._processed(
                 "BACKGROUND",
@@ -619,9 +849,9 @@ class ColorProcessor:
                 lambda: _cgetde(element_name, "selectcolor"),
             ),
         )
-        element.widget.configure(
-            {"selectcolor": toggle}
-        )  # A rare case where we use the configure method directly.
+        self.backend.configure(
+            element.widget, {"selectcolor": toggle}
+        )  # A rare case where we skip the config method.
         self.element(
             element,
             {
@@ -634,8 +864,8 @@ class ColorProcessor:
 
     def table_or_tree(self, element: Union[Table, Tree]):
         style_name = element.widget["style"]
-        element_name = _lower_class_name(element)
-        default_style = _cgetde(element_name, "style")
+        element_name = _default_element_name(type(element))
+        default_style = self.backend.default_option(element_name, "style")
         self.style(
             style_name,
             {
@@ -680,13 +910,240 @@ class ColorProcessor:
                 f"{default_style}.Heading",
                 True,
             )
+        self.row_tags(element, default_style)
+
+    def row_tags(self, element: Union[Table, Tree], default_style: str) -> None:
+        """
+        Internal use only.
+
+        Recolors the item tags of a Table or Tree, which is where row colors, alternating row colors and Tree tag colors
+        live. Tag colors that don't match any color of the old theme are left alone.
+
+        First available from v3.2.0.
+        :param element: The Table or Tree element.
+        :param default_style: The default ttk style of the element, used for defaults.
+        :return: None
+        """
+        self.tags(
+            element.widget,
+            _ROW_TAG_THEME_KEYS,
+            lambda option: self.styler.lookup(default_style, option, default="white"),
+        )
+
+    def text_tags(self, element: Multiline) -> None:
+        """
+        Internal use only.
+
+        Recolors the text tags of a Multiline, such as the ones created when printing with `text_color` or
+        `background_color`, without touching the text itself. Tag colors that don't match any color of the old theme
+        are left alone, and so is the selection tag.
+
+        First available from v3.2.0.
+        :param element: The Multiline element.
+        :return: None
+        """
+        self.tags(
+            element.widget,
+            _TEXT_TAG_THEME_KEYS,
+            lambda option: _cgetde("multiline", option),
+            ("sel",),
+        )
+
+    def tags(
+        self,
+        widget: Widget,
+        theme_dict_keys: Dict[str, Tuple[Union[str, Tuple[str, int]], ...]],
+        default_function: Callable[[str], str],
+        ignored_tags: Tuple[str, ...] = (),
+    ) -> None:
+        """
+        Internal use only.
+
+        Recolors the tags of a treeview or text widget. Tags are grouped by the theme colors they use, so that every
+        group is configured at once no matter how many rows (or lines) share it, and all groups go out in a single
+        backend call.
+
+        First available from v3.2.0.
+        :param widget: The ttk Treeview or Tk Text widget.
+        :param theme_dict_keys: The theme dict keys that each tag option can be matched against, in order of preference.
+        :param default_function: A function returning the default value of an option.
+        :param ignored_tags: Tags to leave alone.
+        :return: None
+        """
+        plan = self._tag_plan(
+            widget, lambda: self._plan_tags(widget, theme_dict_keys, ignored_tags)
+        )
+        if not plan:
+            return
+        self.backend.configure_tags(
+            widget,
+            {
+                tags: {
+                    option: self._processed(
+                        theme_dict_key, lambda: default_function(option)
+                    )
+                    for option, theme_dict_key in options.items()
+                }
+                for tags, options in plan.items()
+            },
+        )
+
+    def _plan_tags(
+        self,
+        widget: Widget,
+        theme_dict_keys: Dict[str, Tuple[Union[str, Tuple[str, int]], ...]],
+        ignored_tags: Tuple[str, ...],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Internal use only.
+
+        Groups the tags of a widget by the old theme colors they use. Tags keep following the same theme keys from
+        one reskin to the next, so this is only done again once the widget's tags change.
+
+        First available from v3.2.0.
+        :param widget: The ttk Treeview or Tk Text widget.
+        :param theme_dict_keys: The theme dict keys that each tag option can be matched against, in order of preference.
+        :param ignored_tags: Tags to leave alone.
+        :return: The theme dict key of each option, keyed by the Tcl list of the tags using them.
+        """
+        groups: Dict[Tuple[Tuple[str, Any], ...], List[str]] = {}
+        for tag, colors in self.backend.tag_colors(widget).items():
+            if tag in ignored_tags:
+                continue
+            matches = (
+                (option, self._old_theme_key(color, theme_dict_keys.get(option, ())))
+                for option, color in colors.items()
+            )
+            options = tuple(
+                (option, theme_dict_key)
+                for option, theme_dict_key in matches
+                if theme_dict_key is not None
+            )
+            if options:
+                groups.setdefault(options, []).append(tag)
+        return {_tcl_command(*tags): dict(options) for options, tags in groups.items()}
+
+    def canvas_items(self, element: Element) -> None:
+        """
+        Internal use only.
+
+        Recolors the items drawn on a Canvas or Graph whose fill or outline match a color of the old theme. Items get
+        tagged by theme key once per reskin (or animation), and every tag is then recolored with a single
+        `itemconfigure`, so that the cost grows with the number of distinct colors rather than with the number of items.
+
+        First available from v3.2.0.
+        :param element: The Canvas or Graph element.
+        :return: None
+        """
+        widget = element.widget
+        plan = self._tag_plan(
+            widget,
+            lambda: self._plan_canvas_items(widget),
+            _applies_writes(self.backend),
+        )
+        if not plan:
+            return
+        self.backend.configure_items(
+            widget,
+            {
+                tag: {
+                    option: self._processed(
+                        theme_dict_key, lambda: _cgetde("canvas", "background")
+                    )
+                }
+                for tag, (option, theme_dict_key) in plan.items()
+            },
+        )
+
+    def _tag_plan(
+        self, widget: Widget, plan_function: Callable[[], Dict], cache: bool = True
+    ) -> Dict:
+        """
+        Internal use only.
+
+        Obtains the tag plan of a widget from `_TAG_PLANS`, planning it again if the widget's tag set has changed
+        since. The tag set is only read the first time a widget is seen during a reskin (or animation).
+
+        First available from v3.2.0.
+        :param widget: The ttk Treeview, Tk Text or Tk Canvas widget.
+        :param plan_function: A function planning the widget's tags.
+        :param cache: If False, a new plan doesn't get cached (e.g. because the tagging it relies on wasn't applied).
+        :return: The plan.
+        """
+        cached = _TAG_PLANS.get(widget)
+        if cached is not None and str(widget) in self._checked_tag_plans:
+            return cached[1]
+        tag_set = self.backend.tag_set(widget)
+        if cached is None or cached[0] != tag_set:
+            plan = plan_function()
+            if not cache:
+                return plan
+            cached = _TAG_PLANS[widget] = (tag_set, plan)
+        self._checked_tag_plans.add(str(widget))
+        return cached[1]
+
+    def _plan_canvas_items(
+        self, widget: Widget
+    ) -> Dict[str, Tuple[str, Union[str, Tuple[str, int]]]]:
+        """
+        Internal use only.
+
+        Moves the canvas item tags onto the items whose colors match the old theme.
+
+        First available from v3.2.0.
+        :param widget: The Tk Canvas widget.
+        :return: The option and theme dict key of every tag in use.
+        """
+        matches: Dict[str, List[Tuple[str, str]]] = {
+            tag: [] for tag in _CANVAS_ITEM_TAGS.values()
+        }
+        plan = {}
+        for option, color in self.backend.item_colors(widget):
+            theme_dict_key = self._old_theme_key(color, THEME_COLOR_KEYS)
+            if theme_dict_key is not None:
+                tag = _CANVAS_ITEM_TAGS[option, theme_dict_key]
+                matches[tag].append((option, color))
+                plan[tag] = (option, theme_dict_key)
+        self.backend.tag_items(widget, matches)
+        return plan
+
+    def _old_theme_key(
+        self, color: str, theme_dict_keys: Tuple[Union[str, Tuple[str, int]], ...]
+    ) -> Optional[Any]:
+        """
+        Internal use only.
+
+        Finds the old theme's key for a color. The reverse lookup is built once per set of keys.
+
+        First available from v3.2.0.
+        :param color: The color to look up.
+        :param theme_dict_keys: The theme dict keys to consider, in order of preference.
+        :return: The theme dict key, or None if the color isn't one of the old theme's.
+        """
+        if not theme_dict_keys or not _is_valid_color(color):
+            return None
+        theme_colors = self._old_theme_colors.get(theme_dict_keys)
+        if theme_colors is None:
+            theme_colors = self._old_theme_colors[theme_dict_keys] = {}
+            for theme_dict_key in reversed(theme_dict_keys):
+                key, index = (
+                    theme_dict_key
+                    if isinstance(theme_dict_key, tuple)
+                    else (theme_dict_key, None)
+                )
+                value = self.old_theme_dict.get(key)
+                if index is not None:
+                    value = value[index] if isinstance(value, (list, tuple)) else None
+                if _is_valid_color(value):
+                    theme_colors[_color(value).get_hex_l()] = theme_dict_key
+        return theme_colors.get(_color(color).get_hex_l())
 
     def progressbar(self, element: ProgressBar):
         style_name = element.ttk_style_name
         self.style(
             style_name,
             {"background": ("PROGRESS", 0), "troughcolor": ("PROGRESS", 1)},
-            _cgetde("progressbar", "style"),
+            self.backend.default_option("progressbar", "style"),
         )
 
     def _processed(
@@ -716,16 +1173,18 @@ class ColorProcessor:
                 self.new_theme_dict[theme_dict_key][theme_dict_index],
             )
         )
-        old_color = Color(
+        old_color = _color(
             _ds(
                 old_color,
                 default_function,
+                self.backend,
             )
         )
-        new_color = Color(
+        new_color = _color(
             _ds(
                 new_color,
                 default_function,
+                self.backend,
             )
         )
         return self._transition(old_color, new_color)
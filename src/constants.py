@@ -25,7 +25,8 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
-from PySimpleGUI import ttk_part_mapping_dict
+from typing import Dict
+from weakref import WeakKeyDictionary
 
 ALTER_MENU_ACTIVE_COLORS = True
 DEFAULT_ANIMATED_RESKIN_DURATION = 450
@@ -46,8 +47,28 @@ NON_GENERIC_ELEMENTS = [
     "tree",
     "verticalseparator",
 ]
+# How windows get refreshed after a reskin: a full `update` (processing pending events too), an `update_idletasks`
+# (redrawing only), not at all (left to the caller), or one `update_idletasks` per interpreter once Tk is idle.
+REFRESH_COALESCED = "coalesced"
+REFRESH_IDLETASKS = "idletasks"
+REFRESH_NONE = "none"
+REFRESH_UPDATE = "update"
 RGB_INTERPOLATION = "rgb"
-WINDOW_THEME_MAP = {}
+THEME_COLOR_KEYS = (
+    "BACKGROUND",
+    "TEXT",
+    "INPUT",
+    "TEXT_INPUT",
+    "SCROLL",
+    ("BUTTON", 0),
+    ("BUTTON", 1),
+    ("PROGRESS", 0),
+    ("PROGRESS", 1),
+)
+# Windows are held weakly, so that closed windows don't stay alive just because they were reskinned.
+WINDOW_THEME_MAP: WeakKeyDictionary = WeakKeyDictionary()
+# The themes of the containers (and elements) reskinned apart from their window, held weakly as well.
+ELEMENT_THEME_MAP: WeakKeyDictionary = WeakKeyDictionary()
 MAPPER = {
     "Background Color": "BACKGROUND",
     "Button Background Color": ("BUTTON", 1),
@@ -57,7 +78,27 @@ MAPPER = {
     "Text Color": "TEXT",
     "Slider Color": "SCROLL",
 }
-SCROLLBAR_TROUGH_COLOR: str = MAPPER[ttk_part_mapping_dict["Trough Color"]]
-SCROLLBAR_FRAME_COLOR: str = MAPPER[ttk_part_mapping_dict["Frame Color"]]
-SCROLLBAR_BACKGROUND_COLOR: str = MAPPER[ttk_part_mapping_dict["Background Color"]]
-SCROLLBAR_ARROW_COLOR: str = MAPPER[ttk_part_mapping_dict["Arrow Button Arrow Color"]]
+# The ttk scrollbar parts whose colors PySimpleGUI maps to theme colors. The SCROLLBAR_*_COLOR constants are resolved
+# from PySimpleGUI's mapping on first access, so that importing the constants doesn't import PySimpleGUI.
+SCROLLBAR_PARTS: Dict[str, str] = {
+    "SCROLLBAR_TROUGH_COLOR": "Trough Color",
+    "SCROLLBAR_FRAME_COLOR": "Frame Color",
+    "SCROLLBAR_BACKGROUND_COLOR": "Background Color",
+    "SCROLLBAR_ARROW_COLOR": "Arrow Button Arrow Color",
+}
+
+
+def __getattr__(attribute: str) -> str:
+    """
+    Resolves the SCROLLBAR_*_COLOR constants on first access.
+
+    First available from v3.2.0.
+    """
+    if attribute not in SCROLLBAR_PARTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {attribute!r}")
+    from PySimpleGUI import ttk_part_mapping_dict
+
+    value = globals()[attribute] = MAPPER[
+        ttk_part_mapping_dict[SCROLLBAR_PARTS[attribute]]
+    ]
+    return value
@@ -25,6 +25,9 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+from functools import cache, lru_cache
+from typing import Dict, Tuple
+
 from PySimpleGUI import (
     MENU_RIGHT_CLICK_EDITME_EXIT,
     Button,
@@ -33,6 +36,7 @@ from PySimpleGUI import (
     Checkbox,
     Column,
     Combo,
+    Element,
     Frame,
     Graph,
     HorizontalSeparator,
@@ -59,61 +63,199 @@ from PySimpleGUI import (
     Window,
     theme,
 )
+from colour import Color
 
-_previous_theme = theme()
-theme("GrayGrayGray")
+from .utilities import _lower_type_name
 
-_tree_data = TreeData()
-_tree_data.Insert(
-    "",
-    "_A_",
-    "Tree Item 1",
-    [1234],
-)
+# The element type each default element stands in for. Kept separate from the default elements themselves, so that
+# it's available without building the default window.
+_DEFAULT_ELEMENT_TYPES: Dict[type, str] = {
+    Button: "button",
+    ButtonMenu: "buttonmenu",
+    Canvas: "canvas",
+    Checkbox: "checkbox",
+    Column: "column",
+    Combo: "combo",
+    Frame: "frame",
+    Graph: "graph",
+    HorizontalSeparator: "horizontalseparator",
+    Input: "input",
+    Image: "image",
+    Listbox: "listbox",
+    Menu: "menu",
+    Multiline: "multiline",
+    OptionMenu: "optionmenu",
+    Pane: "pane",
+    ProgressBar: "progressbar",
+    Radio: "radio",
+    Sizegrip: "sizegrip",
+    Slider: "slider",
+    Spin: "spin",
+    StatusBar: "statusbar",
+    Tab: "tab",
+    TabGroup: "tabgroup",
+    Table: "table",
+    Text: "text",
+    Tree: "tree",
+    VerticalSeparator: "verticalseparator",
+}
 
 
-# DEFAULT ELEMENTS
-# The most minimal declarations for all elements. I wish there was an easier (or less hardcoded) way.
-_default_elements = {
-    "button": Button(),
-    "buttonmenu": ButtonMenu("", MENU_RIGHT_CLICK_EDITME_EXIT),
-    "canvas": Canvas(),
-    "checkbox": Checkbox(""),
-    "column": Column([[Text()]], scrollable=True),
-    "combo": Combo([""]),
-    "frame": Frame("", [[Text()]]),
-    "graph": Graph((2, 2), (0, 2), (2, 0)),
-    "horizontalseparator": HorizontalSeparator(),  # 'image': sg.Image(),
-    "input": Input(),
-    "image": Image(),
-    "listbox": Listbox([""]),
-    "menu": Menu([["File", ["Exit"]], ["Edit", ["Edit Me"]]]),
-    "multiline": Multiline(),
-    "optionmenu": OptionMenu([""]),
-    "pane": Pane([Column([[Text()]]), Column([[Text()]])]),
-    "progressbar": ProgressBar(0),
-    "radio": Radio("", 0),
-    "sizegrip": Sizegrip(),
-    "slider": Slider(),
-    "spin": Spin([0]),
-    "statusbar": StatusBar(""),
-    "tabgroup": TabGroup([[Tab("", [[Text()]], key="tab")]]),
-    "table": Table([["asdf"]]),
-    "text": Text(),
-    "tree": Tree(_tree_data, [""], num_rows=1),
-    "verticalseparator": VerticalSeparator(),
-}
-# A completely invisible window, which should at worst show a
-# small line at the top-right of the left display if
-# viewed on a Raspberry Pi with multiple monitors. Unlikely.
-_default_window = Window(
-    "",
-    [[element] for element in _default_elements.values()],
-    size=(1, 1),
-    no_titlebar=True,
-    alpha_channel=0,
-    location=(-1, -1),
-).finalize()
-
-_default_elements["tab"] = _default_window["tab"]
-theme(_previous_theme)
+@cache
+def _build_defaults() -> Tuple[Dict[str, Element], Window]:
+    """
+    Internal use only.
+
+    Builds the default elements and the invisible window holding them, the first time they're needed rather than at
+    import time. They're used to obtain reasonable defaults for themes with system default colors.
+
+    First available from v3.2.0.
+    :return: A tuple of the default elements (keyed by their lowercase class names) and the default window.
+    """
+    previous_theme = theme()
+    theme("GrayGrayGray")
+
+    tree_data = TreeData()
+    tree_data.Insert(
+        "",
+        "_A_",
+        "Tree Item 1",
+        [1234],
+    )
+
+    # DEFAULT ELEMENTS
+    # The most minimal declarations for all elements. I wish there was an easier (or less hardcoded) way.
+    elements = {
+        "button": Button(),
+        "buttonmenu": ButtonMenu("", MENU_RIGHT_CLICK_EDITME_EXIT),
+        "canvas": Canvas(),
+        "checkbox": Checkbox(""),
+        "column": Column([[Text()]], scrollable=True),
+        "combo": Combo([""]),
+        "frame": Frame("", [[Text()]]),
+        "graph": Graph((2, 2), (0, 2), (2, 0)),
+        "horizontalseparator": HorizontalSeparator(),  # 'image': sg.Image(),
+        "input": Input(),
+        "image": Image(),
+        "listbox": Listbox([""]),
+        "menu": Menu([["File", ["Exit"]], ["Edit", ["Edit Me"]]]),
+        "multiline": Multiline(),
+        "optionmenu": OptionMenu([""]),
+        "pane": Pane([Column([[Text()]]), Column([[Text()]])]),
+        "progressbar": ProgressBar(0),
+        "radio": Radio("", 0),
+        "sizegrip": Sizegrip(),
+        "slider": Slider(),
+        "spin": Spin([0]),
+        "statusbar": StatusBar(""),
+        "tabgroup": TabGroup([[Tab("", [[Text()]], key="tab")]]),
+        "table": Table([["asdf"]]),
+        "text": Text(),
+        "tree": Tree(tree_data, [""], num_rows=1),
+        "verticalseparator": VerticalSeparator(),
+    }
+    # A completely invisible window, which should at worst show a
+    # small line at the top-right of the left display if
+    # viewed on a Raspberry Pi with multiple monitors. Unlikely.
+    window = Window(
+        "",
+        [[element] for element in elements.values()],
+        size=(1, 1),
+        no_titlebar=True,
+        alpha_channel=0,
+        location=(-1, -1),
+    ).finalize()
+
+    elements["tab"] = window["tab"]
+    theme(previous_theme)
+    return elements, window
+
+
+def _default_elements() -> Dict[str, Element]:
+    """
+    Internal use only.
+
+    First available from v3.2.0.
+    :return: The default elements, keyed by their lowercase class names.
+    """
+    return _build_defaults()[0]
+
+
+def _default_window() -> Window:
+    """
+    Internal use only.
+
+    First available from v3.2.0.
+    :return: The invisible window holding the default elements.
+    """
+    return _build_defaults()[1]
+
+
+@cache
+def _cgetde(element_name: str, attribute: str):
+    """
+    Internal use only.
+
+    Shortcut function that calls the cget function of a default element. Default elements never change, so results
+    are cached.
+
+    First available from v3.0.0.
+    :param element_name: The name of the element.
+    :param attribute: The attribute to pass to the cget function.
+    :return: The result of the cget function.
+    """
+    return _default_elements()[element_name].widget[attribute]
+
+
+@cache
+def _default_element_name(element_type: type) -> str:
+    """
+    Internal use only.
+
+    Obtains the name of the default element matching an element type, so that subclasses of PySimpleGUI elements
+    (and aliased classes such as `InputText`) get the right defaults.
+
+    First available from v3.2.0.
+    :param element_type: The element class.
+    :return: The key of the default element in `_default_elements()`.
+    """
+    return next(
+        (
+            _DEFAULT_ELEMENT_TYPES[cls]
+            for cls in element_type.__mro__
+            if cls in _DEFAULT_ELEMENT_TYPES
+        ),
+        _lower_type_name(element_type),
+    )
+
+
+def _cgetdw(attribute: str):
+    """
+    Internal use only.
+
+    Shortcut function that calls the cget function of the default window.
+
+    First available from v3.0.0.
+    :param attribute: The attribute to pass to the cget function.
+    :return: The result of the cget function.
+    """
+    return _default_window().TKroot[attribute]
+
+
+@lru_cache(maxsize=256)
+def _normalize_tk_color(tk_color) -> str:
+    """
+    Internal use only.
+
+    Converts TK system colors to regular hex colors. Results are cached (within bounds), since there are only so many
+    system colors.
+
+    First available from v3.0.0.
+    :param tk_color: The TK color to be converted.
+    :return: A hex color string.
+    """
+    result = Color()
+    result.set_rgb(
+        tuple(x / 65535 for x in _default_window().TKroot.winfo_rgb(tk_color))
+    )
+    return result.get_hex_l()
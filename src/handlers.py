@@ -0,0 +1,371 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+from typing import Callable, Dict, Optional, Union
+
+from PySimpleGUI import (
+    Button,
+    ButtonMenu,
+    Canvas,
+    Checkbox,
+    Column,
+    Combo,
+    Element,
+    Frame,
+    Graph,
+    HorizontalSeparator,
+    Image,
+    Input,
+    Listbox,
+    Menu,
+    Multiline,
+    OptionMenu,
+    ProgressBar,
+    Radio,
+    Sizegrip,
+    Slider,
+    Spin,
+    StatusBar,
+    TabGroup,
+    Table,
+    Text,
+    Tree,
+    VerticalSeparator,
+)
+
+from .colorprocessor import ColorProcessor
+from .constants import ALTER_MENU_ACTIVE_COLORS
+from .tinting import tint_image
+from .utilities import _widget_capabilities
+
+ElementHandler = Callable[[ColorProcessor, Element], None]
+
+# Handlers registered for each element type.
+_ELEMENT_HANDLERS: Dict[type, ElementHandler] = {}
+# Handlers resolved for each element type encountered so far, including unregistered subclasses.
+_RESOLVED_HANDLERS: Dict[type, Optional[ElementHandler]] = {}
+
+
+def register_handler(
+    element_type: type, handler: Optional[ElementHandler] = None
+) -> Union[ElementHandler, Callable[[ElementHandler], ElementHandler]]:
+    """
+    Registers a handler which reskins elements of the given type (and its subclasses, unless they have handlers of
+    their own). This is how custom or third-party elements can be reskinned. May be used as a decorator.
+
+    The handler gets called with the ColorProcessor of the current pass and the element, after the generic tweaks
+    (background, right click menus, scrollbars) have been applied. Registering a handler for a type which already has
+    one replaces it.
+
+    First available from v3.2.0.
+    :param element_type: The element class the handler is meant for.
+    :param handler: A callable taking a ColorProcessor and an element.
+    :return: The handler, or a decorator which registers the handler if none was given.
+    """
+
+    def _register(_handler: ElementHandler) -> ElementHandler:
+        _ELEMENT_HANDLERS[element_type] = _handler
+        _RESOLVED_HANDLERS.clear()
+        return _handler
+
+    return _register if handler is None else _register(handler)
+
+
+def unregister_handler(element_type: type) -> None:
+    """
+    Removes the handler registered for the given element type, if any.
+
+    First available from v3.2.0.
+    :param element_type: The element class whose handler should be removed.
+    :return: None
+    """
+    _ELEMENT_HANDLERS.pop(element_type, None)
+    _RESOLVED_HANDLERS.clear()
+
+
+def get_handler(element_type: type) -> Optional[ElementHandler]:
+    """
+    Obtains the handler for an element type, which is the one registered for the closest class in its MRO.
+
+    First available from v3.2.0.
+    :param element_type: The element class.
+    :return: The handler, or None if the element type has none.
+    """
+    try:
+        return _RESOLVED_HANDLERS[element_type]
+    except KeyError:
+        handler = next(
+            (
+                _ELEMENT_HANDLERS[cls]
+                for cls in element_type.__mro__
+                if cls in _ELEMENT_HANDLERS
+            ),
+            None,
+        )
+        _RESOLVED_HANDLERS[element_type] = handler
+        return handler
+
+
+# BUILT-IN HANDLERS
+@register_handler(Button)
+def _button(cp: ColorProcessor, element: Button):
+    if _widget_capabilities(element.widget)[1]:  # For Ttk Buttons.
+        style = element.widget.cget("style")
+        cp.style(
+            style,
+            {
+                "background": ("BUTTON", 1),
+                "foreground": ("BUTTON", 0),
+            },
+            "TButton",
+        )
+        cp.map(
+            style,
+            {
+                "background": {
+                    "pressed": ("BUTTON", 0),
+                    "active": ("BUTTON", 0),
+                },
+                "foreground": {
+                    "pressed": ("BUTTON", 1),
+                    "active": ("BUTTON", 1),
+                },
+            },
+            "TButton",
+        )
+    else:  # For regular buttons.
+        cp.element(
+            element,
+            {
+                "background": ("BUTTON", 1),
+                "foreground": ("BUTTON", 0),
+                "activebackground": ("BUTTON", 0),
+                "activeforeground": ("BUTTON", 1),
+            },
+        )
+
+
+@register_handler(ButtonMenu)
+def _button_menu(cp: ColorProcessor, element: ButtonMenu):
+    cp.element(
+        element,
+        {
+            "background": ("BUTTON", 1),
+            "foreground": ("BUTTON", 0),
+        },
+    )
+    if getattr(element, "TKMenu", False):
+        cp.recurse_menu(element.TKMenu)  # noqa
+
+
+@register_handler(Canvas)
+def _canvas(cp: ColorProcessor, element: Canvas):
+    cp.element(element, {"highlightbackground": "BACKGROUND"})
+
+
+def canvas_items_handler(cp: ColorProcessor, element: Union[Canvas, Graph]) -> None:
+    """
+    An opt-in handler for Canvas and Graph elements which, on top of what the default Canvas handler does, recolors
+    the items drawn on them (lines, text, shapes...) whose fill or outline color came from the old theme. Items are
+    grouped by color, so that live charts with many items stay cheap to reskin. Enable it with
+    `register_handler(Graph, canvas_items_handler)` and/or `register_handler(Canvas, canvas_items_handler)`.
+
+    First available from v3.2.0.
+    :param cp: The ColorProcessor of the current pass.
+    :param element: The Canvas or Graph element.
+    :return: None
+    """
+    _canvas(cp, element)
+    cp.canvas_items(element)
+
+
+def image_tint_handler(cp: ColorProcessor, element: Union[Button, Image]) -> None:
+    """
+    An opt-in handler for Button and Image elements which, on top of what the default handlers do, tints their images
+    from the palette of the theme they were drawn for to the new theme's. Tinted images are cached, so switching back
+    and forth between themes (or animating) only tints each image a few times. Requires NumPy. Enable it with
+    `register_handler(Image, image_tint_handler)` and/or `register_handler(Button, image_tint_handler)`.
+
+    First available from v3.2.0.
+    :param cp: The ColorProcessor of the current pass.
+    :param element: The Button or Image element.
+    :return: None
+    """
+    if isinstance(element, Button):
+        _button(cp, element)
+    tint_image(cp, element)
+
+
+@register_handler(Column)
+def _column(cp: ColorProcessor, element: Column):
+    if getattr(element, "TKColFrame", False) and hasattr(
+        element.TKColFrame, "canvas"
+    ):  # This means the column is scrollable.
+        cp.scrollable_column(element)
+
+
+@register_handler(Combo)
+def _combo(cp: ColorProcessor, element: Combo):
+    cp.combo(element)
+
+
+@register_handler(Frame)
+def _frame(cp: ColorProcessor, element: Frame):
+    cp.element(element, {"foreground": "TEXT"})
+
+
+@register_handler(Listbox)
+def _listbox(cp: ColorProcessor, element: Listbox):
+    cp.element(
+        element,
+        {
+            "foreground": "TEXT_INPUT",
+            "background": "INPUT",
+            "selectforeground": "INPUT",
+            "selectbackground": "TEXT_INPUT",
+        },
+    )
+
+
+@register_handler(Menu)
+def _menu(cp: ColorProcessor, element: Menu):
+    cp.recurse_menu(element.widget)
+
+
+@register_handler(ProgressBar)
+def _progressbar(cp: ColorProcessor, element: ProgressBar):
+    cp.progressbar(element)
+
+
+@register_handler(OptionMenu)
+def _optionmenu(cp: ColorProcessor, element: OptionMenu):
+    cp.optionmenu_menu(
+        element,
+        {
+            "foreground": "TEXT_INPUT",
+            "background": "INPUT",
+        },
+    )
+    if ALTER_MENU_ACTIVE_COLORS:
+        cp.optionmenu_menu(
+            element,
+            {"activeforeground": "INPUT", "activebackground": "TEXT_INPUT"},
+        )
+    cp.element(element, {"foreground": "TEXT_INPUT", "background": "INPUT"})
+
+
+@register_handler(Sizegrip)
+def _sizegrip(cp: ColorProcessor, element: Sizegrip):
+    sizegrip_style = element.widget.cget("style")
+    cp.style(sizegrip_style, {"background": "BACKGROUND"}, "TSizegrip")
+
+
+@register_handler(Slider)
+def _slider(cp: ColorProcessor, element: Slider):
+    cp.element(element, {"foreground": "TEXT", "troughcolor": "SCROLL"})
+
+
+@register_handler(Spin)
+def _spin(cp: ColorProcessor, element: Spin):
+    cp.element(
+        element,
+        {
+            "background": "INPUT",
+            "foreground": "TEXT_INPUT",
+            "buttonbackground": "INPUT",
+        },
+    )
+
+
+@register_handler(TabGroup)
+def _tabgroup(cp: ColorProcessor, element: TabGroup):
+    style_name = element.widget.cget("style")
+    cp.style(style_name, {"background": "BACKGROUND"}, "TNotebook")
+    cp.style(
+        f"{style_name}.Tab",
+        {"background": "INPUT", "foreground": "TEXT_INPUT"},
+        "TNotebook.Tab",
+    )
+    cp.map(
+        f"{style_name}.Tab",
+        {
+            "foreground": {"pressed": ("BUTTON", 1), "selected": "TEXT"},
+            "background": {"pressed": ("BUTTON", 0), "selected": "BACKGROUND"},
+        },
+        f"{style_name}.Tab",
+        False,
+    )
+
+
+@register_handler(Checkbox)
+@register_handler(Radio)
+def _checkbox_or_radio(cp: ColorProcessor, element: Union[Checkbox, Radio]):
+    cp.checkbox_or_radio(element)
+
+
+@register_handler(HorizontalSeparator)
+@register_handler(VerticalSeparator)
+def _separator(
+    cp: ColorProcessor, element: Union[HorizontalSeparator, VerticalSeparator]
+):
+    style_name = element.widget.cget("style")
+    cp.style(style_name, {"background": "BACKGROUND"}, "TSeparator")
+
+
+@register_handler(Input)
+@register_handler(Multiline)
+def _input_or_multiline(cp: ColorProcessor, element: Union[Input, Multiline]):
+    cp.element(
+        element,
+        {
+            "foreground": "TEXT_INPUT",
+            "background": "INPUT",
+            "selectforeground": "INPUT",
+            "selectbackground": "TEXT_INPUT",
+            "insertbackground": "TEXT_INPUT",
+        },
+    )
+    if isinstance(element, Multiline):
+        cp.text_tags(element)
+
+
+@register_handler(StatusBar)
+@register_handler(Text)
+def _statusbar_or_text(cp: ColorProcessor, element: Union[StatusBar, Text]):
+    cp.element(
+        element,
+        {
+            "background": "BACKGROUND",
+            "foreground": "TEXT",
+        },
+    )
+
+
+@register_handler(Table)
+@register_handler(Tree)
+def _table_or_tree(cp: ColorProcessor, element: Union[Table, Tree]):
+    cp.table_or_tree(element)
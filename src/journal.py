@@ -0,0 +1,438 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+"""
+Operation journals: the exact sequence of operations a reskin applied, along with how long each one took, which can
+be saved to a compact file and replayed later against a fresh Tk interpreter or the mock backend.
+"""
+
+import gzip
+import json
+from time import perf_counter
+from tkinter import Menu as TKMenu
+from tkinter import Tk, Widget
+from tkinter.ttk import Style
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from PySimpleGUI import Window
+from PySimpleGUI import version as psg_version
+
+from .backend import _STYLES_TARGET, RecordingBackend, TkBackend
+from .colorprocessor import _menu_entry_types
+from .constants import REFRESH_UPDATE
+from .mock import MockBackend, MockMenu, MockWidget
+from .stats import _summary
+from .version import __version__
+
+# Identifies journal files, and the version of their format.
+JOURNAL_FORMAT = "psg_reskinner-journal"
+JOURNAL_VERSION = 1
+
+
+class JournalEntry(NamedTuple):
+    """
+    A single operation applied by a reskin.
+
+    First available from v3.2.0.
+
+    - `kind`, `target` and `options` are those of the corresponding `Operation`.
+    - `widget_class` is the Tk class of the target widget (e.g. "button" or "ttk::combobox"); empty for styles,
+        refreshes and the root window.
+    - `seconds` is how long applying the operation took; 0 if it wasn't applied.
+    - `entry_types` are the types of a menu's entries, in index order; empty for anything but menus.
+    """
+
+    kind: str
+    target: str
+    widget_class: str
+    options: Dict[Any, Any]
+    seconds: float
+    entry_types: Tuple[str, ...] = ()
+
+
+class JournalBackend(RecordingBackend):
+    """
+    Records every operation (and how long applying it took) into `entries` before passing it on to another backend.
+    Pass it to `reskin()` or `animated_reskin()`, then save the entries with `save_journal()`.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self, backend: Optional[TkBackend] = None, dry_run: bool = False):
+        super().__init__(backend, dry_run)
+        self.entries: List[JournalEntry] = []
+
+    def _journal(
+        self,
+        kind: str,
+        target: Any,
+        options: Dict,
+        apply: Callable[[], None],
+        entry_types: Tuple[str, ...] = (),
+    ) -> None:
+        """
+        Internal use only.
+
+        Records an operation, and applies it unless dry-running.
+
+        First available from v3.2.0.
+        :param kind: The kind of operation.
+        :param target: The widget (or menu, or combo) operated on, the ttk style name, or the window title.
+        :param options: The options of the operation.
+        :param apply: A callable which applies the operation.
+        :param entry_types: The types of a menu's entries.
+        :return: None
+        """
+        seconds = 0.0
+        if self._record(kind, target, options):
+            start = perf_counter()
+            apply()
+            seconds = perf_counter() - start
+        self.entries.append(
+            JournalEntry(
+                kind,
+                str(target),
+                getattr(target, "widgetName", ""),
+                dict(options),
+                seconds,
+                entry_types,
+            )
+        )
+
+    def configure(self, widget: Widget, options: Dict[str, str]) -> None:
+        self._journal(
+            "configure",
+            widget,
+            options,
+            lambda: self.backend.configure(widget, options),
+        )
+
+    def configure_widgets(
+        self, configurations: List[Tuple[Widget, Dict[str, str]]]
+    ) -> None:
+        # Journaled one by one, so that every configure gets timed.
+        for widget, options in configurations:
+            self.configure(widget, options)
+
+    def style_configure(self, styler: Style, style: str, options: Dict[str, str]):
+        self._journal(
+            "style",
+            style,
+            options,
+            lambda: self.backend.style_configure(styler, style, options),
+        )
+
+    def style_map(self, styler: Style, style: str, options: Dict[str, List]):
+        self._journal(
+            "map",
+            style,
+            options,
+            lambda: self.backend.style_map(styler, style, options),
+        )
+
+    def configure_styles(self, styler: Style, groups: Dict[str, Dict[str, str]]):
+        self._journal(
+            "styles",
+            _STYLES_TARGET,
+            groups,
+            lambda: self.backend.configure_styles(styler, groups),
+        )
+
+    def map_styles(self, styler: Style, groups: Dict[str, Dict[str, List]]):
+        self._journal(
+            "maps",
+            _STYLES_TARGET,
+            groups,
+            lambda: self.backend.map_styles(styler, groups),
+        )
+
+    def configure_menu_entries(
+        self, menu: TKMenu, entries: Dict[int, Dict[str, str]]
+    ) -> None:
+        self._journal(
+            "menu",
+            menu,
+            entries,
+            lambda: self.backend.configure_menu_entries(menu, entries),
+            _menu_entry_types(menu),
+        )
+
+    def configure_combo_listbox(
+        self, combo_widget: Widget, options: Dict[str, str]
+    ) -> None:
+        self._journal(
+            "listbox",
+            combo_widget,
+            options,
+            lambda: self.backend.configure_combo_listbox(combo_widget, options),
+        )
+
+    def configure_tags(self, widget: Widget, groups: Dict[str, Dict[str, str]]) -> None:
+        self._journal(
+            "tags", widget, groups, lambda: self.backend.configure_tags(widget, groups)
+        )
+
+    def tag_items(self, widget: Widget, tags: Dict[str, List[Tuple[str, str]]]) -> None:
+        self._journal(
+            "itemtags", widget, tags, lambda: self.backend.tag_items(widget, tags)
+        )
+
+    def configure_items(
+        self, widget: Widget, groups: Dict[str, Dict[str, str]]
+    ) -> None:
+        self._journal(
+            "items",
+            widget,
+            groups,
+            lambda: self.backend.configure_items(widget, groups),
+        )
+
+    def refresh(self, window: Window, strategy: str = REFRESH_UPDATE) -> None:
+        self._journal(
+            "refresh",
+            window.Title,
+            {"strategy": strategy},
+            lambda: self.backend.refresh(window, strategy),
+        )
+
+
+def _open(path: str, mode: str):
+    return gzip.open(path, mode) if path.endswith(".gz") else open(path, mode)
+
+
+def save_journal(
+    entries: List[JournalEntry], path: str, meta: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Saves a journal as JSON lines; a header followed by one line per entry. Paths ending in ".gz" get compressed.
+
+    First available from v3.2.0.
+    :param entries: The journal entries.
+    :param path: The path of the file.
+    :param meta: Anything else worth keeping along with the journal, e.g. the themes involved.
+    :return: None
+    """
+    header = {
+        "format": JOURNAL_FORMAT,
+        "version": JOURNAL_VERSION,
+        "reskinner": __version__,
+        "pysimplegui": psg_version,
+        "meta": meta or {},
+    }
+    with _open(path, "wt") as file:
+        file.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for entry in entries:
+            file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+def load_journal(path: str) -> Tuple[Dict[str, Any], List[JournalEntry]]:
+    """
+    Loads a journal saved with `save_journal()`.
+
+    First available from v3.2.0.
+    :param path: The path of the file.
+    :return: The header and the journal entries.
+    """
+    with _open(path, "rt") as file:
+        header = json.loads(file.readline())
+        if header.get("format") != JOURNAL_FORMAT:
+            raise ValueError(f"`{path}` isn't a Reskinner journal.")
+        if header["version"] > JOURNAL_VERSION:
+            raise ValueError(
+                f"`{path}` uses version {header['version']} of the journal format, which is newer than this "
+                f"version of Reskinner supports ({JOURNAL_VERSION})."
+            )
+        entries = []
+        for line in file:
+            kind, target, widget_class, options, seconds, entry_types = json.loads(line)
+            if kind == "menu":  # JSON keys are always strings.
+                options = {int(index): cnf for index, cnf in options.items()}
+            elif kind == "map":
+                options = {
+                    option: [tuple(pair) for pair in pairs]
+                    for option, pairs in options.items()
+                }
+            elif kind == "maps":
+                options = {
+                    styles: {
+                        option: [tuple(pair) for pair in pairs]
+                        for option, pairs in style_options.items()
+                    }
+                    for styles, style_options in options.items()
+                }
+            entries.append(
+                JournalEntry(
+                    kind, target, widget_class, options, seconds, tuple(entry_types)
+                )
+            )
+    return header, entries
+
+
+class _ReplayWindow:
+    """
+    Stands in for the window a journal was recorded from, so that refreshes can be replayed.
+    """
+
+    def __init__(self, title: str, refresh: Callable[[], None], root: Optional[Tk]):
+        self.Title = title
+        self.refresh = refresh
+        self.TKroot = root
+
+
+class _ReplayTargets:
+    """
+    Creates a fresh widget (or mock widget) standing in for every target a journal operates on.
+    """
+
+    def __init__(self, root: Optional[Tk] = None):
+        """
+        :param root: The root of the fresh Tk interpreter, or None to create mock widgets.
+        """
+        self.root = root
+        self.widgets: Dict[str, Any] = {}
+
+    def widget(self, entry: JournalEntry) -> Any:
+        widget = self.widgets.get(entry.target)
+        if widget is None:
+            widget = self.widgets[entry.target] = self._create(entry)
+        return widget
+
+    def _create(self, entry: JournalEntry) -> Any:
+        if self.root is None:
+            if entry.kind == "menu":
+                menu = MockMenu(entry.target)
+                for entry_type in entry.entry_types:
+                    menu.add(entry_type)
+                return menu
+            return MockWidget(
+                entry.target,
+                entry.widget_class or "toplevel",
+                entry.options if entry.kind == "configure" else (),
+            )
+        if not entry.widget_class or entry.target == ".":
+            return self.root
+        if entry.kind == "menu":
+            tearoff = entry.entry_types[:1] == ("tearoff",)
+            menu = TKMenu(self.root, tearoff=tearoff)
+            for entry_type in entry.entry_types[tearoff:]:
+                menu.add(entry_type)
+            return menu
+        return Widget(self.root, entry.widget_class)
+
+
+def replay_journal(
+    entries: List[JournalEntry],
+    backend: Optional[TkBackend] = None,
+    repeat: int = 1,
+) -> Dict[str, Any]:
+    """
+    Applies the operations of a journal again, against widgets created afresh for every target, and times them. This
+    benchmarks the apply stage of a reskin on its own, without any of the planning done by the ColorProcessor.
+
+    Against a TkBackend (the default), widgets are created in a fresh Tk interpreter, so a display is needed. Against
+    a MockBackend, mock widgets are used.
+
+    First available from v3.2.0.
+    :param entries: The journal entries.
+    :param backend: The backend to apply the operations through. Defaults to a TkBackend.
+    :param repeat: The number of times to replay the journal.
+    :return: The total time taken by the replays and by the recording, along with a timing summary per kind of
+        operation.
+    """
+    backend = backend if backend is not None else TkBackend()
+    mock = isinstance(backend, MockBackend)
+    root = None if mock else Tk()
+    try:
+        if root is not None:
+            root.withdraw()
+        styler = backend.styler() if mock else Style(root)
+        window = _ReplayWindow(
+            "Replay", (lambda: None) if mock else root.update_idletasks, root
+        )
+        targets = _ReplayTargets(root)
+        appliers: Dict[str, Callable[[JournalEntry], None]] = {
+            "configure": lambda entry: backend.configure(
+                targets.widget(entry), entry.options
+            ),
+            "style": lambda entry: backend.style_configure(
+                styler, entry.target, entry.options
+            ),
+            "map": lambda entry: backend.style_map(styler, entry.target, entry.options),
+            "styles": lambda entry: backend.configure_styles(styler, entry.options),
+            "maps": lambda entry: backend.map_styles(styler, entry.options),
+            "menu": lambda entry: backend.configure_menu_entries(
+                targets.widget(entry), entry.options
+            ),
+            "listbox": lambda entry: backend.configure_combo_listbox(
+                targets.widget(entry), entry.options
+            ),
+            "tags": lambda entry: backend.configure_tags(
+                targets.widget(entry), entry.options
+            ),
+            "itemtags": lambda entry: backend.tag_items(
+                targets.widget(entry),
+                {
+                    tag: [tuple(match) for match in matches]
+                    for tag, matches in entry.options.items()
+                },
+            ),
+            "items": lambda entry: backend.configure_items(
+                targets.widget(entry), entry.options
+            ),
+            "refresh": lambda entry: backend.refresh(
+                window, entry.options.get("strategy", REFRESH_UPDATE)
+            ),
+        }
+        # Every target gets created up front, so that only applying operations gets timed. Menus come first, since
+        # they're created along with their entries.
+        for entry in sorted(entries, key=lambda entry: entry.kind != "menu"):
+            if entry.kind in (
+                "configure",
+                "menu",
+                "listbox",
+                "tags",
+                "itemtags",
+                "items",
+            ):
+                targets.widget(entry)
+        samples: Dict[str, List[float]] = {kind: [] for kind in appliers}
+        for _ in range(repeat):
+            for entry in entries:
+                start = perf_counter()
+                appliers[entry.kind](entry)
+                samples[entry.kind].append(perf_counter() - start)
+    finally:
+        if root is not None:
+            root.destroy()
+    return {
+        "operations": len(entries),
+        "repeat": repeat,
+        "seconds": sum(map(sum, samples.values())) / repeat,
+        "recorded_seconds": sum(entry.seconds for entry in entries),
+        "kinds": {kind: _summary(times) for kind, times in samples.items() if times},
+    }
@@ -0,0 +1,636 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+from itertools import count
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from weakref import WeakSet, WeakValueDictionary
+
+from PySimpleGUI import (
+    Button,
+    ButtonMenu,
+    Canvas,
+    Checkbox,
+    Column,
+    Combo,
+    Element,
+    Frame,
+    Graph,
+    HorizontalSeparator,
+    Image,
+    Input,
+    Listbox,
+    Menu,
+    Multiline,
+    OptionMenu,
+    Pane,
+    ProgressBar,
+    Radio,
+    Sizegrip,
+    Slider,
+    Spin,
+    StatusBar,
+    Tab,
+    TabGroup,
+    Table,
+    Text,
+    Tree,
+    VerticalSeparator,
+)
+
+from .backend import TkBackend
+from .constants import REFRESH_UPDATE
+from .utilities import _tcl_split
+
+_COLOR_OPTIONS = ("background", "highlightbackground", "highlightcolor")
+_TEXT_OPTIONS = _COLOR_OPTIONS + ("foreground", "activebackground", "activeforeground")
+_INPUT_OPTIONS = _COLOR_OPTIONS + (
+    "foreground",
+    "selectforeground",
+    "selectbackground",
+    "insertbackground",
+)
+_TTK_OPTIONS = ("style", "class", "cursor", "takefocus")
+
+# Like Tk paths and PySimpleGUI's ttk style names, those of mock windows never repeat, even across windows.
+_MOCK_TOPLEVELS = count(1)
+_MOCK_STYLES = count(1)
+_MOCK_PHOTOS = count(1)
+# Every mock widget alive, so that whether an image is displayed can be checked.
+_MOCK_WIDGETS: WeakSet = WeakSet()
+
+# The Tk widget class and the options of the mock widget standing in for each element type.
+_MOCK_WIDGET_TYPES: Dict[type, Tuple[str, Tuple[str, ...]]] = {
+    Button: ("button", _TEXT_OPTIONS + ("image",)),
+    ButtonMenu: ("menubutton", _TEXT_OPTIONS),
+    Canvas: ("canvas", _COLOR_OPTIONS),
+    Checkbox: ("checkbutton", _TEXT_OPTIONS + ("selectcolor",)),
+    Column: ("frame", _COLOR_OPTIONS),
+    Combo: ("ttk::combobox", _TTK_OPTIONS + ("foreground", "background")),
+    Frame: ("labelframe", _COLOR_OPTIONS + ("foreground",)),
+    Graph: ("canvas", _COLOR_OPTIONS),
+    HorizontalSeparator: ("ttk::separator", _TTK_OPTIONS),
+    Image: ("label", _TEXT_OPTIONS + ("image",)),
+    Input: ("entry", _INPUT_OPTIONS),
+    Listbox: ("listbox", _INPUT_OPTIONS[:-1]),
+    Menu: ("menu", _TEXT_OPTIONS),
+    Multiline: ("text", _INPUT_OPTIONS),
+    OptionMenu: ("menubutton", _TEXT_OPTIONS + ("menu",)),
+    Pane: ("panedwindow", ("background",)),
+    ProgressBar: ("ttk::progressbar", _TTK_OPTIONS),
+    Radio: ("radiobutton", _TEXT_OPTIONS + ("selectcolor",)),
+    Sizegrip: ("ttk::sizegrip", _TTK_OPTIONS),
+    Slider: ("scale", _TEXT_OPTIONS + ("troughcolor",)),
+    Spin: ("spinbox", _INPUT_OPTIONS + ("buttonbackground",)),
+    StatusBar: ("label", _TEXT_OPTIONS),
+    Tab: ("frame", _COLOR_OPTIONS),
+    TabGroup: ("ttk::notebook", _TTK_OPTIONS),
+    Table: ("ttk::treeview", _TTK_OPTIONS),
+    Text: ("label", _TEXT_OPTIONS),
+    Tree: ("ttk::treeview", _TTK_OPTIONS),
+    VerticalSeparator: ("ttk::separator", _TTK_OPTIONS),
+}
+# The options supported by each type of menu entry.
+_MOCK_MENU_ENTRY_OPTIONS: Dict[str, Tuple[str, ...]] = {
+    "command": _TEXT_OPTIONS[3:] + ("background", "label", "state"),
+    "cascade": _TEXT_OPTIONS[3:] + ("background", "label", "menu", "state"),
+    "separator": ("background",),
+    "tearoff": ("background", "state"),
+}
+# Options of the default elements which the ColorProcessor reads up front.
+_MOCK_DEFAULT_OPTIONS: Dict[Tuple[str, str], str] = {
+    ("combo", "style"): "TCombobox",
+    ("progressbar", "style"): "Horizontal.TProgressbar",
+    ("table", "style"): "Treeview",
+    ("tree", "style"): "Treeview",
+}
+_MOCK_COLOR = "#000000"
+
+
+class MockWidget:
+    """
+    A stand-in for a Tk widget, which keeps its options in a dict.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        widget_name: str,
+        options: Sequence[str],
+        **values: Any,
+    ):
+        self._w = path
+        self.widgetName = widget_name
+        self.options: Dict[str, Any] = {
+            option: (
+                ""
+                if widget_name.startswith("ttk::") or option == "image"
+                else _MOCK_COLOR
+            )
+            for option in options
+        }
+        self.options.update(values)
+        self.children: Dict[str, "MockWidget"] = {}
+        self.popdown_options: Dict[str, Any] = {}
+        # The options of every item tag, for treeviews.
+        self.tags: Dict[str, Dict[str, Any]] = {}
+        # The options of every item, along with its tags under "tags", for canvases.
+        self.items: Dict[int, Dict[str, Any]] = {}
+        # The callbacks bound to every event sequence.
+        self.bindings: Dict[str, List[Callable]] = {}
+        # The window manager state, for toplevels, and the path of the selected tab, for notebooks.
+        self.window_state = "normal"
+        self.selected = ""
+        _MOCK_WIDGETS.add(self)
+
+    def __str__(self):
+        return self._w
+
+    def keys(self) -> List[str]:
+        return list(self.options)
+
+    def _root(self) -> "MockWidget":
+        # Mock widgets have no interpreter to share, so each stands in for its own root.
+        return self
+
+    def cget(self, option: str) -> Any:
+        return self.options[option]
+
+    __getitem__ = cget
+
+    def configure(self, cnf: Optional[Dict[str, Any]] = None, **kwargs):
+        self.options.update(cnf or {}, **kwargs)
+
+    config = configure
+
+    def bind(self, sequence: str, func: Callable, add: Optional[str] = None) -> str:
+        callbacks = self.bindings.setdefault(sequence, [])
+        if not add:
+            callbacks.clear()
+        callbacks.append(func)
+        return sequence
+
+    def event_generate(self, sequence: str) -> None:
+        for func in list(self.bindings.get(sequence, ())):
+            func(SimpleNamespace(widget=self))
+
+    def state(self) -> str:
+        return self.window_state
+
+    def select(self, tab_id: Optional[str] = None) -> Optional[str]:
+        if tab_id is None:
+            return self.selected
+        self.selected = str(tab_id)
+        self.event_generate("<<NotebookTabChanged>>")
+
+
+class MockMenu(MockWidget):
+    """
+    A stand-in for a Tk menu, with entries of their own.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path, "menu", _TEXT_OPTIONS)
+        self.entries: List[Tuple[str, Dict[str, Any]]] = []
+
+    def add(self, entry_type: str) -> None:
+        self.entries.append(
+            (
+                entry_type,
+                {
+                    option: _MOCK_COLOR
+                    for option in _MOCK_MENU_ENTRY_OPTIONS[entry_type]
+                },
+            )
+        )
+
+    def index(self, index: str) -> Optional[int]:
+        return (
+            (len(self.entries) - 1 if self.entries else None)
+            if index == "end"
+            else int(index)
+        )
+
+    def type(self, index: int) -> str:
+        return self.entries[index][0]
+
+    def entryconfigure(
+        self, index: int, cnf: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Optional[Dict[str, Tuple]]:
+        options = self.entries[index][1]
+        if cnf is None and not kwargs:
+            return {
+                option: (option, "", "", "", value) for option, value in options.items()
+            }
+        options.update(cnf or {}, **kwargs)
+
+
+class MockPhoto:
+    """
+    A stand-in for `tkinter.PhotoImage`, which keeps its pixels as RGB bytes.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(
+        self, width: int, height: int, pixels: bytes, transparent: Sequence[int] = ()
+    ):
+        self.name = f"pyimage{next(_MOCK_PHOTOS)}"
+        self.width = width
+        self.height = height
+        self.pixels = pixels
+        self.transparent = tuple(transparent)
+
+    def __str__(self):
+        return self.name
+
+
+class MockStyle:
+    """
+    A stand-in for `tkinter.ttk.Style`, which keeps configured styles and maps in dicts.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self):
+        self.configured: Dict[str, Dict[str, Any]] = {}
+        self.maps: Dict[str, Dict[str, Any]] = {}
+
+    def configure(self, style: str, query_opt: Optional[str] = None, **kwargs):
+        if query_opt is not None:
+            return self.configured.get(style, {}).get(query_opt)
+        self.configured.setdefault(style, {}).update(kwargs)
+
+    def map(self, style: str, query_opt: Optional[str] = None, **kwargs):
+        if query_opt is not None:
+            return self.maps.get(style, {}).get(query_opt, [])
+        self.maps.setdefault(style, {}).update(kwargs)
+
+    def lookup(self, style: str, option: str, state=None, default=None):
+        return self.configured.get(style, {}).get(option, default)
+
+
+class MockWindow:
+    """
+    A stand-in for a finalized PySimpleGUI window, made of real PySimpleGUI elements backed by mock widgets. It lets
+    you exercise `reskin()` without a display.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        layout: List[List[Element]],
+        right_click_menu: Optional[List] = None,
+    ):
+        """
+        :param title: The title of the window.
+        :param layout: The layout of the window, just like a PySimpleGUI layout.
+        :param right_click_menu: A right click menu definition applied to all elements, like in PySimpleGUI.
+        """
+        self.Title = title
+        self.Rows = layout
+        self.RightClickMenu = right_click_menu
+        self.TKroot = MockWidget(
+            f".!toplevel{next(_MOCK_TOPLEVELS)}", "toplevel", _COLOR_OPTIONS
+        )
+        self.TKRightClickMenu = None
+        self.refresh_count = 0
+        self._counter = count(1)
+        self._elements: List[Element] = []
+        self._build_rows(self.TKroot, layout)
+
+    def element_list(self) -> List[Element]:
+        return list(self._elements)
+
+    def refresh(self) -> "MockWindow":
+        self.refresh_count += 1
+        return self
+
+    def __getitem__(self, key) -> Element:
+        return next(element for element in self._elements if element.Key == key)
+
+    def _path(self, parent: MockWidget, widget_name: str) -> str:
+        name = widget_name.replace("ttk::", "")
+        return f"{parent}.!{name}{next(self._counter)}"
+
+    def _style_name(self, element: Element, base_style: str) -> str:
+        return f"{next(_MOCK_STYLES)}___{element.Key}{base_style}"
+
+    def _menu(self, parent: MockWidget, items: Sequence) -> MockMenu:
+        menu = MockMenu(self._path(parent, "menu"))
+        parent.children[menu._w.rsplit(".", 1)[1]] = menu
+        items = list(items)
+        for index, item in enumerate(items):
+            if isinstance(item, (list, tuple)):
+                continue
+            following = items[index + 1] if index + 1 < len(items) else None
+            if isinstance(following, (list, tuple)):
+                self._menu(menu, following)
+                menu.add("cascade")
+            elif str(item).startswith("---"):
+                menu.add("separator")
+            else:
+                menu.add("command")
+        return menu
+
+    def _build_rows(self, container: MockWidget, rows: List[List[Element]]) -> None:
+        for row in rows:
+            row_frame = MockWidget(
+                self._path(container, "frame"), "frame", _COLOR_OPTIONS
+            )
+            for element in row:
+                self._build_element(row_frame, element)
+
+    def _build_element(self, row_frame: MockWidget, element: Element) -> None:
+        element_type = next(
+            (cls for cls in type(element).__mro__ if cls in _MOCK_WIDGET_TYPES),
+            Text,
+        )
+        widget_name, options = _MOCK_WIDGET_TYPES[element_type]
+        if element_type is Button and getattr(element, "UseTtkButtons", False):
+            widget_name, options = "ttk::button", _TTK_OPTIONS
+        path = self._path(row_frame, widget_name)
+        widget = (
+            MockMenu(path)
+            if widget_name == "menu"
+            else MockWidget(path, widget_name, options)
+        )
+        if "style" in options:
+            widget.options["style"] = self._style_name(element, "")
+        element.Widget = widget
+        element.ParentRowFrame = row_frame
+        element.ParentForm = self
+        self._elements.append(element)
+
+        # Menus.
+        right_click_menu = (
+            getattr(element, "RightClickMenu", None) or self.RightClickMenu
+        )
+        if right_click_menu:
+            element.TKRightClickMenu = self._menu(self.TKroot, right_click_menu[1])
+            self.TKRightClickMenu = self.TKRightClickMenu or element.TKRightClickMenu
+        if element_type is Menu:
+            for label, items in element.MenuDefinition:
+                self._menu(widget, items)
+                widget.add("cascade")
+        elif element_type is ButtonMenu:
+            element.TKMenu = self._menu(widget, element.MenuDefinition[1])
+        elif element_type is OptionMenu:
+            widget.options["menu"] = self._menu(widget, element.Values)
+
+        # Scrollbars.
+        if element_type in (Listbox, Multiline, Table, Tree):
+            element.vsb_style_name = self._style_name(element, ".Vertical.TScrollbar")
+        elif element_type is ProgressBar:
+            element.ttk_style_name = widget.options["style"]
+
+        # Row tags, tagged and colored the way PySimpleGUI does.
+        if element_type is Table:
+            for row in range(len(element.Values or ())):
+                widget.tags[str(row)] = {"background": "", "foreground": ""}
+            if element.AlternatingRowColor is not None:
+                for row in range(0, len(element.Values or ()), 2):
+                    widget.tags[str(row)]["background"] = element.AlternatingRowColor
+            for row_def in element.RowColors or ():
+                tag = widget.tags.setdefault(
+                    str(row_def[0]), {"background": "", "foreground": ""}
+                )
+                if len(row_def) == 2:
+                    tag["background"] = row_def[1]
+                else:
+                    tag["background"], tag["foreground"] = row_def[2], row_def[1]
+
+        # Containers.
+        if element_type is Column:
+            element.TKColFrame = widget
+            if getattr(element, "Scrollable", False):
+                widget.canvas = MockWidget(
+                    self._path(widget, "canvas"), "canvas", _COLOR_OPTIONS
+                )
+                inner = MockWidget(f"{widget.canvas}.!frame", "frame", _COLOR_OPTIONS)
+                widget.canvas.children["!frame"] = inner
+                self._style_name(element, ".Vertical.TScrollbar")
+                element.ttk_style_name = self._style_name(
+                    element, ".Horizontal.TScrollbar"
+                )
+                self._build_rows(inner, element.Rows)
+                return
+        if element_type is Pane:
+            for column in element.PaneList:
+                self._build_element(row_frame, column)
+        elif element_type is TabGroup:
+            # Like PySimpleGUI, every row of tabs gets a frame of its own within the notebook.
+            for row in element.Rows:
+                tab_row_frame = MockWidget(
+                    self._path(widget, "frame"), "frame", _COLOR_OPTIONS
+                )
+                for tab in row:
+                    self._build_element(tab_row_frame, tab)
+                    widget.selected = widget.selected or str(tab.widget)
+        elif hasattr(element, "Rows"):
+            self._build_rows(widget, element.Rows)
+
+
+class MockBackend(TkBackend):
+    """
+    Applies operations to mock widgets and a mock style, and resolves every default to a fixed color without touching
+    Tk. Combine it with a `RecordingBackend` to count (or diff) operations on display-less machines.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self, default_color: str = _MOCK_COLOR):
+        """
+        :param default_color: The color every unusable theme color resolves to.
+        """
+        self.default_color = default_color
+        self.style = MockStyle()
+        # The photos created through the backend, while they're referenced.
+        self.photos: WeakValueDictionary = WeakValueDictionary()
+
+    def styler(self) -> MockStyle:
+        return self.style
+
+    def resolve_default(self, default_function) -> str:
+        return self.default_color
+
+    def default_option(self, element_name: str, attribute: str) -> Any:
+        return _MOCK_DEFAULT_OPTIONS.get((element_name, attribute), "")
+
+    def prewarm(self, element: Element) -> None:
+        pass
+
+    def widget_options(self, widget: MockWidget, options) -> Dict[str, str]:
+        return {option: widget.options.get(option, "") for option in options}
+
+    def style_options(self, styler: MockStyle, style: str, options) -> Dict[str, str]:
+        return {
+            option: styler.configure(style, option)
+            or styler.lookup(style, option, default="")
+            for option in options
+        }
+
+    def style_map_options(
+        self, styler: MockStyle, style: str, options
+    ) -> Dict[str, List]:
+        return {option: list(styler.map(style, option)) for option in options}
+
+    def menu_entry_options(self, menu: MockMenu, entries) -> Dict[int, Dict[str, str]]:
+        return {
+            index: {
+                option: menu.entries[index][1].get(option, "") for option in options
+            }
+            for index, options in entries.items()
+        }
+
+    def combo_listbox_options(
+        self, combo_widget: MockWidget, options
+    ) -> Dict[str, str]:
+        return {
+            option: combo_widget.popdown_options.get(option, "") for option in options
+        }
+
+    def item_options(self, widget: MockWidget, groups) -> Dict[str, Dict[str, str]]:
+        options = {}
+        for tag, group_options in groups.items():
+            item = next(
+                (item for item in widget.items.values() if tag in item.get("tags", ())),
+                {},
+            )
+            options[tag] = {option: item.get(option, "") for option in group_options}
+        return options
+
+    def tag_colors(self, widget: MockWidget) -> Dict[str, Dict[str, str]]:
+        return {
+            tag: {
+                "background": options.get("background", ""),
+                "foreground": options.get("foreground", ""),
+            }
+            for tag, options in widget.tags.items()
+        }
+
+    def refresh(self, window: MockWindow, strategy: str = REFRESH_UPDATE) -> None:
+        # Every strategy ends up drawing the mock window the same way.
+        window.refresh()
+
+    def configure_widgets(
+        self, configurations: List[Tuple[MockWidget, Dict[str, str]]]
+    ):
+        for widget, options in configurations:
+            widget.configure(options)
+
+    def configure_styles(self, styler: MockStyle, groups: Dict[str, Dict[str, str]]):
+        for styles, options in groups.items():
+            for style in _tcl_split(styles):
+                styler.configure(style, **options)
+
+    def map_styles(self, styler: MockStyle, groups: Dict[str, Dict[str, List]]):
+        for styles, options in groups.items():
+            for style in _tcl_split(styles):
+                styler.map(style, **options)
+
+    def configure_menu_entries(
+        self, menu: MockMenu, entries: Dict[int, Dict[str, str]]
+    ):
+        for index, options in entries.items():
+            menu.entryconfigure(index, options)
+
+    def configure_combo_listbox(
+        self, combo_widget: MockWidget, options: Dict[str, str]
+    ):
+        combo_widget.popdown_options.update(options)
+
+    def configure_tags(self, widget: MockWidget, groups: Dict[str, Dict[str, str]]):
+        for tags, options in groups.items():
+            for tag in _tcl_split(tags):
+                widget.tags.setdefault(tag, {}).update(options)
+
+    def tag_set(self, widget: MockWidget) -> Tuple[str, ...]:
+        if widget.widgetName == "canvas":
+            return tuple(map(str, widget.items))
+        return tuple(widget.tags)
+
+    def item_colors(self, widget: MockWidget) -> List[Tuple[str, str]]:
+        return list(
+            dict.fromkeys(
+                (option, item[option])
+                for item in widget.items.values()
+                for option in ("fill", "outline")
+                if item.get(option)
+            )
+        )
+
+    def tag_items(self, widget: MockWidget, tags: Dict[str, List[Tuple[str, str]]]):
+        matches = {match: tag for tag, pairs in tags.items() for match in pairs}
+        for item in widget.items.values():
+            item_tags = item.setdefault("tags", set())
+            item_tags.difference_update(tags)
+            for option in ("fill", "outline"):
+                tag = matches.get((option, item.get(option)))
+                if tag is not None:
+                    item_tags.add(tag)
+
+    def image_type(self, widget: MockWidget, image_name: str) -> str:
+        return "photo" if image_name in self.photos else ""
+
+    def read_photo(
+        self, widget: MockWidget, image_name: str
+    ) -> Tuple[int, int, bytes, bytes]:
+        photo = self.photos[image_name]
+        on_black, on_white = bytearray(photo.pixels), bytearray(photo.pixels)
+        for index in photo.transparent:
+            on_black[index * 3 : index * 3 + 3] = b"\x00\x00\x00"
+            on_white[index * 3 : index * 3 + 3] = b"\xff\xff\xff"
+        return photo.width, photo.height, bytes(on_black), bytes(on_white)
+
+    def image_in_use(self, master: Any, image_name: str) -> bool:
+        return any(
+            widget.options.get("image") == image_name for widget in _MOCK_WIDGETS
+        )
+
+    def create_photo(
+        self,
+        widget: MockWidget,
+        width: int,
+        height: int,
+        pixels: bytes,
+        transparent: Sequence[int],
+    ) -> MockPhoto:
+        photo = MockPhoto(width, height, pixels, transparent)
+        self.photos[photo.name] = photo
+        return photo
+
+    def configure_items(self, widget: MockWidget, groups: Dict[str, Dict[str, str]]):
+        for item in widget.items.values():
+            for tag in item.get("tags", ()):
+                item.update(groups.get(tag, {}))
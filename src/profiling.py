@@ -0,0 +1,231 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from PySimpleGUI import Element
+
+# The ColorProcessor methods that emit events while tracing.
+_TRACED_METHODS: Tuple[str, ...] = (
+    "window",
+    "element",
+    "parent_row_frame",
+    "scrollbar",
+    "style",
+    "map",
+    "flush_styles",
+    "recurse_menu",
+    "combo",
+    "combo_popdown",
+    "optionmenu_menu",
+    "scrollable_column",
+    "checkbox_or_radio",
+    "table_or_tree",
+    "row_tags",
+    "text_tags",
+    "canvas_items",
+    "progressbar",
+)
+# The sinks that receive events. Reskins are only traced while there is at least one.
+_TRACE_SINKS: List["TraceSink"] = []
+
+
+class TraceSink:
+    """
+    Receives the begin and end events of everything Reskinner traces. Subclass it and override `begin()` and `end()`
+    to send events wherever you need them; see `ChromeTraceSink`.
+
+    Events are named after what's being done ("animated_reskin", "reskin", "reskin_element", or a ColorProcessor
+    method such as "style" or "recurse_menu"), and their arguments identify what it's being done to: an element's key and type,
+    or the target (a ttk style name or a Tk path).
+
+    First available from v3.2.0.
+    """
+
+    def begin(self, name: str, timestamp: float, args: Dict[str, Any]) -> None:
+        """
+        :param name: The name of the event.
+        :param timestamp: The time the event began at, in seconds (from `time.perf_counter()`).
+        :param args: The arguments of the event.
+        :return: None
+        """
+
+    def end(self, name: str, timestamp: float, args: Dict[str, Any]) -> None:
+        """
+        :param name: The name of the event.
+        :param timestamp: The time the event ended at, in seconds (from `time.perf_counter()`).
+        :param args: The arguments of the event.
+        :return: None
+        """
+
+
+class ChromeTraceSink(TraceSink):
+    """
+    Collects events in the Chrome trace event format, which `chrome://tracing` and https://ui.perfetto.dev can open.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+
+    def _event(self, phase: str, name: str, timestamp: float, args: Dict[str, Any]):
+        self.events.append(
+            {
+                "name": name,
+                "cat": "psg_reskinner",
+                "ph": phase,
+                "ts": timestamp * 1_000_000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def begin(self, name: str, timestamp: float, args: Dict[str, Any]) -> None:
+        self._event("B", name, timestamp, args)
+
+    def end(self, name: str, timestamp: float, args: Dict[str, Any]) -> None:
+        self._event("E", name, timestamp, args)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the trace to a JSON file.
+
+        :param path: The path of the file.
+        :return: None
+        """
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.events}, file)
+
+
+def add_trace_sink(sink: TraceSink) -> TraceSink:
+    """
+    Starts sending trace events to a sink. Reskins started from then on get traced.
+
+    First available from v3.2.0.
+    :param sink: The sink.
+    :return: The sink.
+    """
+    _TRACE_SINKS.append(sink)
+    return sink
+
+
+def remove_trace_sink(sink: TraceSink) -> None:
+    """
+    Stops sending trace events to a sink.
+
+    First available from v3.2.0.
+    :param sink: The sink.
+    :return: None
+    """
+    if sink in _TRACE_SINKS:
+        _TRACE_SINKS.remove(sink)
+
+
+@contextmanager
+def tracing(sink: TraceSink) -> Iterator[TraceSink]:
+    """
+    Traces the reskins started within a `with` block.
+
+    First available from v3.2.0.
+    :param sink: The sink to send events to.
+    :return: The sink.
+    """
+    add_trace_sink(sink)
+    try:
+        yield sink
+    finally:
+        remove_trace_sink(sink)
+
+
+def _event_args(args: Tuple) -> Dict[str, Any]:
+    """
+    Internal use only.
+
+    Identifies what a traced call operates on: the first element among its arguments, else its first argument.
+
+    First available from v3.2.0.
+    :param args: The positional arguments of the call.
+    :return: The arguments of the event.
+    """
+    for arg in args:
+        if isinstance(arg, Element):
+            return {"key": str(arg.key), "type": type(arg).__name__}
+    return {"target": str(args[0])} if args else {}
+
+
+class _Tracer:
+    """
+    Sends the events of a single (possibly animated) reskin to the sinks that were active when it started.
+    """
+
+    def __init__(self):
+        self.sinks: Tuple[TraceSink, ...] = tuple(_TRACE_SINKS)
+
+    def begin(self, name: str, args: Dict[str, Any]) -> None:
+        timestamp = perf_counter()
+        for sink in self.sinks:
+            sink.begin(name, timestamp, args)
+
+    def end(self, name: str, args: Dict[str, Any]) -> None:
+        timestamp = perf_counter()
+        for sink in self.sinks:
+            sink.end(name, timestamp, args)
+
+    def traced(self, name: str, function: Callable) -> Callable:
+        def traced(*args, **kwargs):
+            event_args = _event_args(args)
+            self.begin(name, event_args)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.end(name, event_args)
+
+        return traced
+
+    def instrument(self, color_processor) -> "_Tracer":
+        """
+        Makes a ColorProcessor emit events for its methods.
+
+        :param color_processor: The ColorProcessor about to perform the reskin.
+        :return: The tracer itself.
+        """
+        for name in _TRACED_METHODS:
+            setattr(
+                color_processor,
+                name,
+                self.traced(name, getattr(color_processor, name)),
+            )
+        color_processor.tracer = self
+        return self
@@ -26,41 +26,174 @@
 #  SOFTWARE.
 
 from datetime import datetime, timedelta
+from functools import cache, partial
+from time import perf_counter
 from tkinter import TclError
-from tkinter.ttk import Style
-from tkinter.ttk import Widget as TTKWidget
-from typing import Callable, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary, ref
 
 from PySimpleGUI import (
     TITLEBAR_METADATA_MARKER,
-    Checkbox,
     Column,
-    Combo,
     Element,
-    OptionMenu,
-    ProgressBar,
-    Radio,
-    Table,
-    Tree,
+    Frame,
+    Pane,
+    Tab,
+    TabGroup,
     Window,
 )
 
+from .backend import Operation, RecordingBackend, TkBackend
 from .colorprocessor import ColorProcessor
 from .constants import (
-    ALTER_MENU_ACTIVE_COLORS,
     DEFAULT_ANIMATED_RESKIN_DURATION,
+    ELEMENT_THEME_MAP,
     HSL_INTERPOLATION,
     HUE_INTERPOLATION,
+    REFRESH_NONE,
+    REFRESH_UPDATE,
     RGB_INTERPOLATION,
     WINDOW_THEME_MAP,
 )
 from .deprecation import deprecation_trigger
 from .easings import EASE_CONSTANT
-from .utilities import _lower_class_name
+from .handlers import get_handler
+from .profiling import _TRACE_SINKS, _Tracer
+from .stats import ReskinStats
+from .utilities import _widget_capabilities
 from .version import __version__
 
-# DEPRECATION TRIGGER
-deprecation_trigger()
+# The reskins deferred until a hidden window, tab or container gets shown, keyed by what they wait on.
+_DEFERRED_RESKINS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+@cache
+def _initialize() -> None:
+    """
+    Internal use only.
+
+    Performs the one-time initialization deferred from import time (currently, the deprecation trigger).
+
+    First available from v3.2.0.
+    :return: None
+    """
+    # DEPRECATION TRIGGER
+    deprecation_trigger()
+
+
+def warmup(backend: Optional[TkBackend] = None) -> None:
+    """
+    Performs the initialization the first reskin would otherwise perform, so that the first reskin is as fast as
+    later ones. Besides the deferred one-time initialization, this resolves the default options read before every
+    reskin, which (with a TkBackend) builds the hidden window default colors get read from.
+
+    Importing psg_reskinner doesn't import PySimpleGUI, Tkinter or colour until they're needed; accessing `warmup`
+    (or `reskin`) imports them.
+
+    First available from v3.2.0.
+    :param backend: The backend defaults get resolved through. Defaults to a TkBackend.
+    :return: None
+    """
+    _initialize()
+    backend = backend if backend is not None else TkBackend()
+    for element_name in ("combo", "progressbar", "table", "tree"):
+        backend.default_option(element_name, "style")
+
+
+def prewarm(
+    window: Window,
+    themes: Sequence[str],
+    theme_function: Callable,
+    lf_table: dict,
+    element_filter: Optional[Callable[[Element], bool]] = None,
+    slice_size: int = 50,
+    backend: Optional[TkBackend] = None,
+) -> None:
+    """
+    Warms every cache a reskin of the window to each of the given themes relies on, so that the first theme switch is
+    as fast as later ones. The work is split into slices which run whenever Tk is idle, so the window stays
+    responsive meanwhile; windows without an event loop (such as mock windows) get prewarmed right away.
+
+    Prewarming performs the one-time initialization (see `warmup()`), prepares each element (e.g. creates the popdown
+    windows of combos) and dry-runs a reskin of each slice to every theme, which fills the caches of widget classes,
+    menu entries, handlers, default colors and parsed theme colors. No color tables get precomputed: the real reskin
+    still works out each color, only faster. Nothing gets applied to the window.
+
+    First available from v3.2.0.
+    :param window: The window to prewarm reskins of.
+    :param themes: The themes the window is likely to be reskinned to.
+    :param theme_function: The theme change function from PySimpleGUI within your code. Required because of namespaces.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code. The `themes` should be in there.
+    :param element_filter: The element filter the window will be reskinned with.
+    :param slice_size: The number of elements processed per slice.
+    :param backend: The backend the window will be reskinned through. Defaults to a TkBackend.
+    :return: None
+    """
+    backend = backend if backend is not None else TkBackend()
+    elements = [
+        element
+        for element in window.element_list()
+        if element_filter is None or element_filter(element)
+    ]
+    batches = [
+        elements[start : start + slice_size]
+        for start in range(0, len(elements), slice_size)
+    ]
+
+    def _prepare(batch: List[Element]) -> None:
+        for element in batch:
+            backend.prewarm(element)
+
+    def _dry_run(new_theme: str, index: int, batch: List[Element]) -> None:
+        _plan(
+            window,
+            new_theme,
+            theme_function,
+            lf_table,
+            None,  # The batch is filtered already.
+            index == 0,  # The window itself only needs to be planned once.
+            RecordingBackend(backend, dry_run=True),
+            None,
+            elements=batch,
+        )
+
+    slices = iter(
+        [partial(warmup, backend)]
+        + [partial(_prepare, batch) for batch in batches]
+        + [
+            partial(_dry_run, new_theme, index, batch)
+            for new_theme in themes
+            for index, batch in enumerate(batches)
+        ]
+    )
+    after_idle = getattr(window.TKroot, "after_idle", None)
+
+    def _next_slice() -> None:
+        work = next(slices, None)
+        if work is None:
+            return
+        try:
+            work()
+        except TclError:  # Closed window.
+            return
+        after_idle(_next_slice)
+
+    if after_idle is None:
+        for work in slices:
+            work()
+    else:
+        after_idle(_next_slice)
 
 
 # RESKIN AND UTILITY FUNCTIONS
@@ -72,8 +205,13 @@ def reskin(
     set_future: bool = True,
     element_filter: Optional[Callable[[Element], bool]] = None,
     reskin_background: bool = True,
+    backend: Optional[TkBackend] = None,
+    stats: bool = False,
+    scope: Optional[Union[Element, Iterable[Any]]] = None,
+    lazy: bool = False,
+    refresh: str = REFRESH_UPDATE,
     **kwargs,
-) -> None:
+) -> Optional[ReskinStats]:
     """
     Applies the theme instantaneously to the specified window. This is where the magic happens.
 
@@ -87,29 +225,66 @@ def reskin(
     :param element_filter: A callable of your choice that takes an element as its only parameter and returns True or
         False. Elements that result in True will be reskinned, and others will be skipped.
     :param reskin_background: If True, the background color of the window will be reskinned. Else, it won't.
+    :param backend: The backend through which the reskin gets applied. Defaults to a TkBackend, which applies it to
+        the window's widgets directly. Available from v3.2.0.
+    :param stats: If True, statistics on what the reskin did and what it cost get collected and returned. Available
+        from v3.2.0.
+    :param scope: A container element (Column, Frame, Tab...), or a collection of elements and/or keys. If given, only
+        those elements and their descendants get reskinned, and only they get walked; the theme is recorded for them
+        apart from the window's, and the window's background is left alone. Available from v3.2.0.
+    :param lazy: If True, what can't be seen gets reskinned when it's shown rather than now: non-selected tabs and
+        invisible containers when they get selected or shown, and the whole window if it's withdrawn or minimized
+        when it gets mapped again. Available from v3.2.0.
+    :param refresh: How the window gets refreshed afterwards. `REFRESH_UPDATE` (the default) runs a full Tk `update`,
+        which processes pending events too; `REFRESH_IDLETASKS` only redraws; `REFRESH_COALESCED` redraws once Tk is
+        idle, along with every other window asking for it until then; and `REFRESH_NONE` leaves it to you. Available
+        from v3.2.0.
     :param kwargs: Additional keyword arguments, meant for internal use only.
-    :return:
+    :return: The ReskinStats if `stats` is True, else None.
     """
+    scoped = _scope_elements(window, scope) if scope is not None else None
+    elements = kwargs.get("_elements")
+    if elements is None:
+        elements = window.element_list() if scoped is None else scoped[1]
     if not kwargs.get("_color_processor"):
-        # Firstly, we add the window to the mapping of windows that we've encountered thus far.
-        # This mapping is important because it enables us to obtain the previous theme programmatically
-        # at all times, a feature required by Reskinner.
-        if window not in list(WINDOW_THEME_MAP.keys()):
-            current_theme: str = theme_function()
-            WINDOW_THEME_MAP[window] = (current_theme, lf_table[current_theme])
-
-        # Obtain the old and new theme names and themedicts.
-        old_theme, old_theme_dict = WINDOW_THEME_MAP[window]
-        new_theme_dict = lf_table[new_theme].copy()
-        WINDOW_THEME_MAP[window] = (new_theme, new_theme_dict)
-        if set_future:
-            theme_function(new_theme)
+        _initialize()
+        deferred_reskin = partial(
+            _DeferredReskin,
+            window,
+            new_theme,
+            theme_function,
+            lf_table,
+            element_filter,
+            reskin_background,
+            backend,
+            refresh,
+        )
+        hidden = []
+        if lazy:
+            if _window_hidden(window):
+                _defer(window, deferred_reskin(scope), scope is None)
+                if set_future:
+                    theme_function(new_theme)
+                return ReskinStats() if stats else None
+            elements, hidden = _visible_elements(window, elements)
+        old_theme, old_theme_dict, new_theme_dict = _switch_theme(
+            window, new_theme, theme_function, lf_table, set_future, scoped, hidden
+        )
+        for root in hidden:
+            _defer(root, deferred_reskin(root))
 
         # Declare a styler object.
-        styler = Style()
+        backend = backend if backend is not None else TkBackend()
+        styler = backend.styler()
 
         # ColorProcessor
-        cp: ColorProcessor = ColorProcessor(old_theme_dict, new_theme_dict, styler)
+        cp: ColorProcessor = ColorProcessor(
+            old_theme_dict, new_theme_dict, styler, backend=backend
+        )
+        if stats:
+            ReskinStats().instrument(cp)
+        if _TRACE_SINKS:
+            _Tracer().instrument(cp)
     else:
         cp: ColorProcessor = kwargs.get("_color_processor")
         old_theme = kwargs.get("_old_theme")
@@ -118,269 +293,486 @@ def reskin(
         new_theme_dict = cp.new_theme_dict
 
     # Before going any further, we have enough info to disregard redundant calls, so we do so...
-    if (new_theme == old_theme) and (new_theme_dict == old_theme_dict):
-        return
+    if (
+        (new_theme == old_theme)
+        and (new_theme_dict == old_theme_dict)
+        and not kwargs.get("_force")
+    ):
+        return cp.stats
+
+    pass_start = perf_counter()
+    tracer = cp.tracer
+    if tracer is not None:
+        pass_args = {
+            "window": window.Title,
+            "theme": new_theme,
+            "progress": cp.progress,
+        }
+        tracer.begin("reskin", pass_args)
+    # Every target gets processed once per pass, no matter how many elements share it.
+    cp.new_pass()
+
+    _reskin_pass(cp, window, elements, scoped, element_filter, reskin_background)
+    cp.flush_styles()
+    if refresh != REFRESH_NONE:
+        cp.backend.refresh(window, refresh)
+    if tracer is not None:
+        tracer.end("reskin", pass_args)
+    stats = cp.stats
+    if stats is not None:
+        stats.add_frame(perf_counter() - pass_start)
+    return stats
+
+
+def _reskin_pass(
+    cp: ColorProcessor,
+    window: Window,
+    elements: List[Element],
+    scoped: Optional[Tuple[List[Element], List[Element]]],
+    element_filter: Optional[Callable[[Element], bool]],
+    reskin_background: bool,
+) -> None:
+    """
+    Internal use only.
+
+    Reskins the elements of a window, and its background if need be, as part of the ColorProcessor's current pass.
+    Starting the pass, flushing ttk styles and refreshing the window are left to the caller.
 
+    First available from v3.2.0.
+    :param cp: The ColorProcessor performing the reskin.
+    :param window: The window to operate on.
+    :param elements: The elements to reskin, before filtering.
+    :param scoped: The scope of the reskin, as returned by `_scope_elements`, or None for the whole window.
+    :param element_filter: The element filter, if any.
+    :param reskin_background: If True, the background color of the window gets reskinned as well.
+    :return: None
+    """
     # Window level changes
-    if reskin_background:
+    if reskin_background and scoped is None:
         cp.window(window, {"background": "BACKGROUND"})
 
     titlebar_row_frame = "Not Set"
 
-    # Handle element filtering
+    # Handle scoping and element filtering
+    if scoped is None:
+        outer_row_frames = frozenset()
+    else:
+        # The row frames holding the scope belong to the rest of the window.
+        outer_row_frames = frozenset(str(root.ParentRowFrame) for root in scoped[0])
     whitelist = (
-        filter(element_filter, window.element_list())
-        if element_filter is not None
-        else window.element_list()
+        filter(element_filter, elements) if element_filter is not None else elements
     )
     # Per-element changes happen henceforth
-    for element in whitelist:
-        element: Element
-        el = _lower_class_name(element)
-        # print(el)
-
-        # Generic tweaks
-        if (
-            getattr(element, "ParentRowFrame", False)
-            and element.metadata != TITLEBAR_METADATA_MARKER
-        ):
-            cp.parent_row_frame(element.ParentRowFrame, {"background": "BACKGROUND"})
-
-        if "background" in element.widget.keys() and element.widget.cget("background"):
-            cp.element(element, {"background": "BACKGROUND"})
-
-        # Right Click Menus (thanks for pointing this out @dwelden!)
-        if element.TKRightClickMenu:
-            cp.recurse_menu(element.TKRightClickMenu)
-
-        # TTK Scrollbars
-        if getattr(element, "vsb_style_name", False):
-            cp.scrollbar(element.vsb_style_name, "Vertical.TScrollbar")  # noqa
-        if getattr(element, "hsb_style_name", False):
-            cp.scrollbar(element.hsb_style_name, "Horizontal.TScrollbar")  # noqa
-        if getattr(
-            element, "ttk_style_name", False
-        ) and element.ttk_style_name.endswith("TScrollbar"):
-            if getattr(element, "Scrollable", False):
-                digit, rest = (
-                    getattr(element, "ttk_style_name")
-                    .replace("Horizontal", "Vertical")
-                    .split("_", 1)
-                )
-                digit = str(int(digit) - 1)
-                vertical_style = f"{digit}_{rest}"
-                cp.scrollbar(vertical_style, "TScrollbar")
-            cp.scrollbar(element.ttk_style_name, "TScrollbar")
-
-        # ACTUAL ELEMENT CUSTOMIZATIONS
-        # Custom Titlebar
-        if element.metadata == TITLEBAR_METADATA_MARKER:
-            cp.element(element, {"background": ("BUTTON", 1)})
-            if element.ParentRowFrame:
-                cp.parent_row_frame(
-                    element.ParentRowFrame, {"background": ("BUTTON", 1)}
-                )
-            titlebar_row_frame = str(element.ParentRowFrame)
-            continue
+    tracer = cp.tracer
+    reskin_element = (
+        _reskin_element
+        if tracer is None
+        else tracer.traced("reskin_element", _reskin_element)
+    )
+    stats = cp.stats
+    if stats is None:
+        for element in whitelist:
+            titlebar_row_frame = reskin_element(
+                cp, element, titlebar_row_frame, outer_row_frames
+            )
+    else:
+        whitelist = list(whitelist)
+        stats.add_elements(len(elements), len(whitelist))
+        for element in whitelist:
+            element_start = perf_counter()
+            titlebar_row_frame = reskin_element(
+                cp, element, titlebar_row_frame, outer_row_frames
+            )
+            stats.add_element(element, perf_counter() - element_start)
 
-        # Titlebar elements
-        if str(element.widget).startswith(titlebar_row_frame + "."):
-            cp.parent_row_frame(element.ParentRowFrame, {"background": ("BUTTON", 1)})
-            cp.element(element, {"background": ("BUTTON", 1)})
-            if "foreground" in element.widget.keys():
-                cp.element(element, {"foreground": ("BUTTON", 0)})
-            continue
 
-        # REGULAR ELEMENT CUSTOMIZATIONS
-        elif el == "button":  # Button
-            if issubclass(element.widget.__class__, TTKWidget):  # For Ttk Buttons.
-                style = element.widget.cget("style")
-                cp.style(
-                    style,
-                    {
-                        "background": ("BUTTON", 1),
-                        "foreground": ("BUTTON", 0),
-                    },
-                    "TButton",
-                )
-                cp.map(
-                    style,
-                    {
-                        "background": {
-                            "pressed": ("BUTTON", 0),
-                            "active": ("BUTTON", 0),
-                        },
-                        "foreground": {
-                            "pressed": ("BUTTON", 1),
-                            "active": ("BUTTON", 1),
-                        },
-                    },
-                    "TButton",
-                )
-                continue
-            else:  # For regular buttons.
-                cp.element(
-                    element,
-                    {
-                        "background": ("BUTTON", 1),
-                        "foreground": ("BUTTON", 0),
-                        "activebackground": ("BUTTON", 0),
-                        "activeforeground": ("BUTTON", 1),
-                    },
-                )
+def _reskin_element(
+    cp: ColorProcessor,
+    element: Element,
+    titlebar_row_frame: str,
+    outer_row_frames: FrozenSet[str] = frozenset(),
+) -> str:
+    """
+    Internal use only.
 
-        elif el == "buttonmenu":  # ButtonMenu
-            cp.element(
-                element,
-                {
-                    "background": ("BUTTON", 1),
-                    "foreground": ("BUTTON", 0),
-                },
+    Reskins a single element of a window.
+
+    First available from v3.2.0.
+    :param cp: The ColorProcessor performing the reskin.
+    :param element: The element to reskin.
+    :param titlebar_row_frame: The path of the custom titlebar's row frame, if it has been encountered yet.
+    :param outer_row_frames: The paths of row frames to leave alone, since they are outside the reskin's scope.
+    :return: The path of the custom titlebar's row frame, if it has been encountered yet.
+    """
+    options, _, background_may_be_empty = _widget_capabilities(element.widget)
+
+    # Generic tweaks
+    if (
+        getattr(element, "ParentRowFrame", False)
+        and element.metadata != TITLEBAR_METADATA_MARKER
+        and str(element.ParentRowFrame) not in outer_row_frames
+    ):
+        cp.parent_row_frame(element.ParentRowFrame, {"background": "BACKGROUND"})
+
+    if "background" in options and (
+        not background_may_be_empty or element.widget.cget("background")
+    ):
+        cp.element(element, {"background": "BACKGROUND"})
+
+    # Right Click Menus (thanks for pointing this out @dwelden!)
+    if element.TKRightClickMenu:
+        cp.recurse_menu(element.TKRightClickMenu)
+
+    # TTK Scrollbars
+    if getattr(element, "vsb_style_name", False):
+        cp.scrollbar(element.vsb_style_name, "Vertical.TScrollbar")  # noqa
+    if getattr(element, "hsb_style_name", False):
+        cp.scrollbar(element.hsb_style_name, "Horizontal.TScrollbar")  # noqa
+    if getattr(element, "ttk_style_name", False) and element.ttk_style_name.endswith(
+        "TScrollbar"
+    ):
+        if getattr(element, "Scrollable", False):
+            digit, rest = (
+                getattr(element, "ttk_style_name")
+                .replace("Horizontal", "Vertical")
+                .split("_", 1)
             )
-            if getattr(element, "TKMenu", False):
-                cp.recurse_menu(element.TKMenu)  # noqa
-            continue
+            digit = str(int(digit) - 1)
+            vertical_style = f"{digit}_{rest}"
+            cp.scrollbar(vertical_style, "TScrollbar")
+        cp.scrollbar(element.ttk_style_name, "TScrollbar")
+
+    # ACTUAL ELEMENT CUSTOMIZATIONS
+    # Custom Titlebar
+    if element.metadata == TITLEBAR_METADATA_MARKER:
+        cp.element(element, {"background": ("BUTTON", 1)})
+        if element.ParentRowFrame:
+            cp.parent_row_frame(element.ParentRowFrame, {"background": ("BUTTON", 1)})
+        return str(element.ParentRowFrame)
+
+    # Titlebar elements
+    if str(element.widget).startswith(titlebar_row_frame + "."):
+        cp.parent_row_frame(element.ParentRowFrame, {"background": ("BUTTON", 1)})
+        cp.element(element, {"background": ("BUTTON", 1)})
+        if "foreground" in options:
+            cp.element(element, {"foreground": ("BUTTON", 0)})
+        return titlebar_row_frame
+
+    # REGULAR ELEMENT CUSTOMIZATIONS
+    handler = get_handler(type(element))
+    if handler is not None:
+        handler(cp, element)
+    return titlebar_row_frame
+
+
+def _scope_elements(
+    window: Window, scope: Union[Element, Iterable[Any]]
+) -> Tuple[List[Element], List[Element]]:
+    """
+    Internal use only.
 
-        elif el == "canvas":
-            cp.element(element, {"highlightbackground": "BACKGROUND"})
-
-        elif el == "column" and getattr(
-            element, "TKColFrame", False
-        ):  # Scrollable Column
-            element: Column
-            if hasattr(
-                element.TKColFrame, "canvas"
-            ):  # This means the column is scrollable.
-                cp.scrollable_column(element)
-            continue
+    Resolves the scope of a reskin, walking only the subtrees it covers, in the same order as `window.element_list()`.
 
-        elif el == "combo":  # Combo
-            element: Combo
-            cp.combo(element)
-            continue
+    First available from v3.2.0.
+    :param window: The window the scope belongs to.
+    :param scope: A container element, or a collection of elements and/or keys.
+    :return: The elements the scope consists of, and every element in their subtrees (including themselves).
+    """
+    roots = [
+        item if isinstance(item, Element) else window[item]
+        for item in ((scope,) if isinstance(scope, (Element, str)) else scope)
+    ]
+    elements: Dict[int, Element] = {}
 
-        elif el == "frame":  # Frame
-            cp.element(element, {"foreground": "TEXT"})
-            continue
+    def walk(element: Element) -> None:
+        if id(element) in elements:
+            return
+        elements[id(element)] = element
+        if isinstance(element, (Column, Frame, Pane, Tab, TabGroup)):
+            for row in element.Rows:
+                for child in row:
+                    walk(child)
 
-        elif el == "listbox":  # Listbox
-            cp.element(
-                element,
-                {
-                    "foreground": "TEXT_INPUT",
-                    "background": "INPUT",
-                    "selectforeground": "INPUT",
-                    "selectbackground": "TEXT_INPUT",
-                },
-            )
-            continue
+    for root in roots:
+        walk(root)
+    return roots, list(elements.values())
 
-        elif el == "menu":  # Menu
-            cp.recurse_menu(element.widget)
-            continue
 
-        elif el == "progressbar":  # ProgressBar
-            element: ProgressBar
-            cp.progressbar(element)
-            continue
+def _scope_theme(window: Window, element: Element) -> Tuple[str, Dict]:
+    """
+    Internal use only.
 
-        elif el == "optionmenu":  # OptionMenu
-            element: OptionMenu
-            cp.optionmenu_menu(
-                element,
-                {
-                    "foreground": "TEXT_INPUT",
-                    "background": "INPUT",
-                },
-            )
-            if ALTER_MENU_ACTIVE_COLORS:
-                cp.optionmenu_menu(
-                    element,
-                    {"activeforeground": "INPUT", "activebackground": "TEXT_INPUT"},
-                )
-            cp.element(element, {"foreground": "TEXT_INPUT", "background": "INPUT"})
-            continue
+    Obtains the theme an element currently has, which is the one of its closest container reskinned apart from the
+    window, or else the window's.
 
-        elif el == "sizegrip":  # Sizegrip
-            sizegrip_style = element.widget.cget("style")
-            cp.style(sizegrip_style, {"background": "BACKGROUND"}, "TSizegrip")
-            continue
+    First available from v3.2.0.
+    :param window: The window the element belongs to.
+    :param element: The element.
+    :return: The theme name and theme dict.
+    """
+    while element is not None:
+        if element in ELEMENT_THEME_MAP:
+            return ELEMENT_THEME_MAP[element]
+        element = getattr(element, "ParentContainer", None)
+    return WINDOW_THEME_MAP[window]
 
-        elif el == "slider":  # Slider
-            cp.element(element, {"foreground": "TEXT", "troughcolor": "SCROLL"})
-            continue
 
-        elif el in "spin":  # Spin
-            cp.element(
-                element,
-                {
-                    "background": "INPUT",
-                    "foreground": "TEXT_INPUT",
-                    "buttonbackground": "INPUT",
-                },
-            )
-            continue
+def _switch_theme(
+    window: Window,
+    new_theme: str,
+    theme_function: Callable,
+    lf_table: dict,
+    set_future: bool,
+    scoped: Optional[Tuple[List[Element], List[Element]]] = None,
+    deferred: Sequence[Element] = (),
+) -> Tuple[str, Dict, Dict]:
+    """
+    Internal use only.
 
-        elif el == "tabgroup":  # TabGroup
-            style_name = element.widget.cget("style")
-            cp.style(style_name, {"background": "BACKGROUND"}, "TNotebook")
-            cp.style(
-                f"{style_name}.Tab",
-                {"background": "INPUT", "foreground": "TEXT_INPUT"},
-                "TNotebook.Tab",
-            )
-            cp.map(
-                f"{style_name}.Tab",
-                {
-                    "foreground": {"pressed": ("BUTTON", 1), "selected": "TEXT"},
-                    "background": {"pressed": ("BUTTON", 0), "selected": "BACKGROUND"},
-                },
-                f"{style_name}.Tab",
-                False,
-            )
-            continue
+    Records the new theme of a window (or of the scope of a reskin), and obtains the theme it had until now.
 
-        elif el in ("checkbox", "radio"):  # Checkbox, Radio
-            element: Union[Checkbox, Radio]
-            cp.checkbox_or_radio(element)
-            continue
+    First available from v3.2.0.
+    :param window: The window to operate on.
+    :param new_theme: The theme to transition to.
+    :param theme_function: The theme change function from PySimpleGUI within your code.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code.
+    :param set_future: If set to True, the `new_theme` will be applied to all future windows.
+    :param scoped: The scope of the reskin, as returned by `_scope_elements`, or None for the whole window.
+    :param deferred: Containers whose reskin is deferred, which keep the theme they currently have.
+    :return: The old theme name, the old theme dict and the new theme dict.
+    """
+    # Firstly, we add the window to the mapping of windows that we've encountered thus far.
+    # This mapping is important because it enables us to obtain the previous theme programmatically
+    # at all times, a feature required by Reskinner.
+    if window not in WINDOW_THEME_MAP:
+        current_theme: str = theme_function()
+        WINDOW_THEME_MAP[window] = (current_theme, lf_table[current_theme])
+    deferred_themes = {element: _scope_theme(window, element) for element in deferred}
 
-        elif el in (
-            "horizontalseparator",
-            "verticalseparator",
-        ):  # HorizontalSeparator, VerticalSeparator
-            style_name = element.widget.cget("style")
-            cp.style(style_name, {"background": "BACKGROUND"}, "TSeparator")
-            continue
+    # Obtain the old and new theme names and themedicts.
+    new_theme_dict = lf_table[new_theme].copy()
+    if scoped is None:
+        old_theme, old_theme_dict = WINDOW_THEME_MAP[window]
+        WINDOW_THEME_MAP[window] = (new_theme, new_theme_dict)
+        covered = [
+            element
+            for element in list(ELEMENT_THEME_MAP)
+            if getattr(element, "ParentForm", None) is window
+        ]
+    else:
+        roots, covered = scoped
+        old_theme, old_theme_dict = _scope_theme(window, roots[0])
+    # Themes recorded, and reskins deferred, within the scope are superseded by the new one.
+    for element in covered:
+        ELEMENT_THEME_MAP.pop(element, None)
+        if element in _DEFERRED_RESKINS:
+            _DEFERRED_RESKINS[element].clear()
+    if scoped is None and window in _DEFERRED_RESKINS:
+        _DEFERRED_RESKINS[window].clear()
+    if scoped is not None:
+        for root in roots:
+            ELEMENT_THEME_MAP[root] = (new_theme, new_theme_dict)
+    ELEMENT_THEME_MAP.update(deferred_themes)
+    if set_future:
+        theme_function(new_theme)
+    return old_theme, old_theme_dict, new_theme_dict
 
-        elif el in ("input", "multiline"):  # Input, Multiline
-            cp.element(
-                element,
-                {
-                    "foreground": "TEXT_INPUT",
-                    "background": "INPUT",
-                    "selectforeground": "INPUT",
-                    "selectbackground": "TEXT_INPUT",
-                    "insertbackground": "TEXT_INPUT",
-                },
-            )
+
+def _window_hidden(window: Window) -> bool:
+    """
+    Internal use only.
+
+    Checks whether a window is withdrawn or minimized.
+
+    First available from v3.2.0.
+    :param window: The window.
+    :return: True if the window can't be seen, else False.
+    """
+    return window.TKroot.state() in ("withdrawn", "iconic")
+
+
+def _visible_elements(
+    window: Window, elements: List[Element]
+) -> Tuple[List[Element], List[Element]]:
+    """
+    Internal use only.
+
+    Separates the elements that can be seen from those in non-selected tabs and invisible containers.
+
+    First available from v3.2.0.
+    :param window: The window the elements belong to.
+    :param elements: The elements, in the order of `window.element_list()`.
+    :return: The elements that can be seen, and the outermost tabs and containers that can't.
+    """
+    hidden: List[Element] = []
+    hidden_ids = set()
+    for element in elements:
+        if id(element) in hidden_ids:
             continue
+        if isinstance(element, (Column, Frame, Pane, TabGroup)) and not element.visible:
+            roots = [element]
+        elif isinstance(element, TabGroup):
+            selected = str(element.widget.select())
+            roots = [
+                tab
+                for row in element.Rows
+                for tab in row
+                if str(tab.widget) != selected
+            ]
+        else:
+            continue
+        for root in roots:
+            hidden.append(root)
+            hidden_ids.update(map(id, _scope_elements(window, root)[1]))
+    return [element for element in elements if id(element) not in hidden_ids], hidden
+
+
+class _DeferredReskin:
+    """
+    Internal use only.
+
+    A reskin deferred by a lazy reskin. It only holds weak references to the window and to the elements it's scoped
+    to, so that a window closed before the reskin could run still gets garbage collected.
 
-        elif el in ("statusbar", "text"):  # StatusBar, Text
-            cp.element(
-                element,
-                {
-                    "background": "BACKGROUND",
-                    "foreground": "TEXT",
-                },
+    First available from v3.2.0.
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        new_theme: str,
+        theme_function: Callable,
+        lf_table: dict,
+        element_filter: Optional[Callable[[Element], bool]],
+        reskin_background: bool,
+        backend: Optional[TkBackend],
+        refresh: str,
+        scope: Optional[Union[Element, Iterable[Any]]],
+    ):
+        self.window = ref(window)
+        self.arguments = (
+            new_theme,
+            theme_function,
+            lf_table,
+            False,
+            element_filter,
+            reskin_background,
+            backend,
+        )
+        self.refresh = refresh
+        self.single_scope = isinstance(scope, (Element, str))
+        # Elements are held weakly, keys as they are.
+        self.scope = (
+            None
+            if scope is None
+            else [
+                (True, ref(item)) if isinstance(item, Element) else (False, item)
+                for item in ([scope] if self.single_scope else scope)
+            ]
+        )
+
+    def __call__(self) -> None:
+        window = self.window()
+        if window is None:
+            return
+        scope = None
+        if self.scope is not None:
+            scope = []
+            for weak, item in self.scope:
+                if weak:
+                    item = item()
+                    if item is None:
+                        return
+                scope.append(item)
+        reskin(
+            window,
+            *self.arguments,
+            scope=scope[0] if self.single_scope else scope,
+            lazy=True,
+            refresh=self.refresh,
+        )
+
+
+def _defer(
+    target: Union[Window, Element], reskin_call: Callable[[], Any], replace: bool = True
+) -> None:
+    """
+    Internal use only.
+
+    Defers a reskin until a window gets mapped, a tab gets selected or a container gets shown. The events get bound
+    the first time anything is deferred for the target.
+
+    First available from v3.2.0.
+    :param target: The window, tab or container.
+    :param reskin_call: A callable performing the reskin.
+    :param replace: If True, the reskin replaces those deferred for the target so far, else it follows them.
+    :return: None
+    """
+    if target not in _DEFERRED_RESKINS:
+        if isinstance(target, Tab):
+            widget = None
+            tab_group = target.ParentContainer
+            if tab_group not in _DEFERRED_RESKINS:
+                _DEFERRED_RESKINS[tab_group] = []
+                tab_group.widget.bind(
+                    "<<NotebookTabChanged>>",
+                    lambda event: _run_deferred(_selected_tab(tab_group)),
+                    add="+",
+                )
+        elif isinstance(target, Element):
+            widget = target.widget
+        else:
+            widget = target.TKroot
+        if widget is not None:
+            # Toplevels also get the events of their descendants.
+            widget.bind(
+                "<Map>",
+                lambda event: (
+                    _run_deferred(target) if str(event.widget) == str(widget) else None
+                ),
+                add="+",
             )
-            continue
+    calls = _DEFERRED_RESKINS.setdefault(target, [])
+    if replace:
+        calls.clear()
+    calls.append(reskin_call)
 
-        elif el in ("table", "tree"):  # Table, Tree
-            element: Union[Table, Tree]
-            cp.table_or_tree(element)
-            continue
-    window.refresh()
+
+def _selected_tab(tab_group: TabGroup) -> Optional[Tab]:
+    """
+    Internal use only.
+
+    Finds the selected tab of a tab group.
+
+    First available from v3.2.0.
+    :param tab_group: The TabGroup element.
+    :return: The selected Tab element, if any.
+    """
+    selected = str(tab_group.widget.select())
+    return next(
+        (tab for row in tab_group.Rows for tab in row if str(tab.widget) == selected),
+        None,
+    )
+
+
+def _run_deferred(target: Optional[Union[Window, Element]]) -> None:
+    """
+    Internal use only.
+
+    Performs the reskins deferred for a window, tab or container, if any.
+
+    First available from v3.2.0.
+    :param target: The window, tab or container that got shown.
+    :return: None
+    """
+    if target is None:
+        return
+    calls = _DEFERRED_RESKINS.get(target)
+    if not calls:
+        return
+    _DEFERRED_RESKINS[target] = []
+    for call in calls:
+        call()
 
 
 def animated_reskin(
@@ -396,7 +788,12 @@ def animated_reskin(
         RGB_INTERPOLATION, HUE_INTERPOLATION, HSL_INTERPOLATION
     ] = RGB_INTERPOLATION,
     easing_function: Callable[[float], float] = EASE_CONSTANT,
-):
+    backend: Optional[TkBackend] = None,
+    stats: bool = False,
+    scope: Optional[Union[Element, Iterable[Any]]] = None,
+    lazy: bool = False,
+    refresh: str = REFRESH_UPDATE,
+) -> Optional[ReskinStats]:
     """
     Does the same as a regular reskin, but animates the effect over time.
 
@@ -408,6 +805,17 @@ def animated_reskin(
     :param interpolation_mode: Determines how interpolation is to be handled. May be `RGB_INTERPOLATION`,
         `HUE_INTERPOLATION`, or `HSL_INTERPOLATION`.
     :param easing_function: A callable acting as an easing function. Other available modes are prefixed with `EASE`.
+    :param backend: The backend through which the reskin gets applied. Defaults to a TkBackend. Available from
+        v3.2.0.
+    :param stats: If True, statistics on what the animation did and what it cost (including the number of frames,
+        the achieved FPS and the frame time distribution) get collected and returned. Available from v3.2.0.
+    :param scope: A container element, or a collection of elements and/or keys, to limit the animation to (along with
+        their descendants). Available from v3.2.0.
+    :param lazy: If True, what can't be seen doesn't get animated, but reskinned as soon as it's shown, the same way
+        as with `reskin`. Available from v3.2.0.
+    :param refresh: How the window gets refreshed after every frame; see `reskin`. Frames only get drawn if something
+        redraws the window while the animation runs, so prefer `REFRESH_IDLETASKS` to `REFRESH_NONE` or
+        `REFRESH_COALESCED` here. Available from v3.2.0.
 
     :param window: The window to operate on.
     :param new_theme: The theme to transition to.
@@ -418,62 +826,543 @@ def animated_reskin(
         False. Elements that result in True will be reskinned, and others will be skipped.
     :param reskin_background: If True, the background color of the window will be reskinned. Else, it won't.
 
-    :return:
+    :return: The ReskinStats if `stats` is True, else None.
     """
+    _initialize()
+    scoped = _scope_elements(window, scope) if scope is not None else None
+    elements = window.element_list() if scoped is None else scoped[1]
+    hidden = []
+    if lazy:
+        # There's no animating what can't be seen, so it gets a regular reskin when it's shown.
+        deferred_reskin = partial(
+            _DeferredReskin,
+            window,
+            new_theme,
+            theme_function,
+            lf_table,
+            element_filter,
+            reskin_background,
+            backend,
+            refresh,
+        )
+        if _window_hidden(window):
+            _defer(window, deferred_reskin(scope), scope is None)
+            if set_future:
+                theme_function(new_theme)
+            return ReskinStats() if stats else None
+        elements, hidden = _visible_elements(window, elements)
     delta = timedelta(milliseconds=duration_in_milliseconds)
     start_time = datetime.now()
     end_time = start_time + delta
-    # Firstly, we add the window to the mapping of windows that we've encountered thus far.
-    # This mapping is important because it enables us to obtain the previous theme programmatically
-    # at all times, a feature required by Reskinner.
-    if window not in list(WINDOW_THEME_MAP.keys()):
-        current_theme: str = theme_function()
-        WINDOW_THEME_MAP[window] = (current_theme, lf_table[current_theme])
-
-    # Obtain the old and new theme names and themedicts.
-    old_theme, old_theme_dict = WINDOW_THEME_MAP[window]
-    new_theme_dict = lf_table[new_theme].copy()
-    WINDOW_THEME_MAP[window] = (new_theme, new_theme_dict)
-    if set_future:
-        theme_function(new_theme)
+    old_theme, old_theme_dict, new_theme_dict = _switch_theme(
+        window, new_theme, theme_function, lf_table, set_future, scoped, hidden
+    )
+    for root in hidden:
+        _defer(root, deferred_reskin(root))
 
     # Declare a styler object.
-    styler = Style()
+    backend = backend if backend is not None else TkBackend()
+    styler = backend.styler()
 
     # ColorProcessor
     cp: ColorProcessor = ColorProcessor(
-        old_theme_dict, new_theme_dict, styler, 0, interpolation_mode
+        old_theme_dict, new_theme_dict, styler, 0, interpolation_mode, backend
+    )
+    if stats:
+        ReskinStats().instrument(cp)
+    if _TRACE_SINKS:
+        animation_args = {
+            "window": window.Title,
+            "theme": new_theme,
+            "duration_ms": duration_in_milliseconds,
+        }
+        _Tracer().instrument(cp).begin("animated_reskin", animation_args)
+    try:
+        while datetime.now() <= end_time:
+            cp.progress = easing_function(
+                round((datetime.now() - start_time) / delta, 4)
+            )
+            try:
+                reskin(
+                    window,
+                    new_theme,
+                    theme_function,
+                    lf_table,
+                    set_future,
+                    element_filter,
+                    reskin_background,
+                    scope=scope,
+                    refresh=refresh,
+                    _elements=elements,
+                    _color_processor=cp,
+                    _old_theme=old_theme,
+                    _new_theme=new_theme,
+                )
+            except TclError:  # Closed window.
+                return cp.stats
+        cp.progress = 1
+        return reskin(
+            window,
+            new_theme,
+            theme_function,
+            lf_table,
+            set_future,
+            element_filter,
+            reskin_background,
+            scope=scope,
+            refresh=refresh,
+            _elements=elements,
+            _color_processor=cp,
+            _old_theme=old_theme,
+            _new_theme=new_theme,
+        )
+    finally:
+        if cp.tracer is not None:
+            cp.tracer.end("animated_reskin", animation_args)
+
+
+def reskin_all(
+    new_theme: str,
+    theme_function: Callable,
+    lf_table: dict,
+    set_future: bool = True,
+    element_filter: Optional[Callable[[Element], bool]] = None,
+    reskin_background: bool = True,
+    backend: Optional[TkBackend] = None,
+    stats: bool = False,
+    refresh: str = REFRESH_UPDATE,
+) -> Optional[ReskinStats]:
+    """
+    Applies the theme to every live window Reskinner knows of, i.e. every window reskinned before that hasn't been
+    closed since. Windows that had the same theme share a single ColorProcessor (and everything it resolves), ttk
+    styles get configured once no matter how many windows use them, and the windows get refreshed together.
+
+    First available from v3.2.0.
+
+    :param new_theme: The theme to apply.
+    :param theme_function: The theme change function from PySimpleGUI within your code. Required because of namespaces.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code. The `new_theme` should be in there.
+    :param set_future: If set to True, the `new_theme` will be applied to all future windows.
+    :param element_filter: A callable of your choice that takes an element as its only parameter and returns True or
+        False. Elements that result in True will be reskinned, and others will be skipped.
+    :param reskin_background: If True, the background colors of the windows will be reskinned. Else, they won't.
+    :param backend: The backend through which the reskin gets applied. Defaults to a TkBackend.
+    :param stats: If True, statistics on what the reskin did and what it cost get collected and returned.
+    :param refresh: How the windows get refreshed afterwards; see `reskin`. Either way, they get refreshed together.
+    :return: The ReskinStats if `stats` is True, else None.
+    """
+    _initialize()
+    groups = _group_windows(
+        new_theme, theme_function, lf_table, set_future, backend, 1, RGB_INTERPOLATION
+    )
+    reskin_stats = _instrument_groups(groups, stats)
+    if groups:
+        _reskin_groups(
+            groups,
+            new_theme,
+            element_filter,
+            reskin_background,
+            refresh,
+            reskin_stats,
+        )
+    return reskin_stats
+
+
+def animated_reskin_all(
+    new_theme: str,
+    theme_function: Callable,
+    lf_table: dict,
+    set_future: bool = True,
+    element_filter: Optional[Callable[[Element], bool]] = None,
+    reskin_background: bool = True,
+    duration_in_milliseconds: float = DEFAULT_ANIMATED_RESKIN_DURATION,
+    interpolation_mode: Union[
+        RGB_INTERPOLATION, HUE_INTERPOLATION, HSL_INTERPOLATION
+    ] = RGB_INTERPOLATION,
+    easing_function: Callable[[float], float] = EASE_CONSTANT,
+    backend: Optional[TkBackend] = None,
+    stats: bool = False,
+    refresh: str = REFRESH_UPDATE,
+) -> Optional[ReskinStats]:
+    """
+    Does the same as `reskin_all`, but animates the effect over time. Every frame reskins all the windows and
+    refreshes them together; windows closed during the animation are dropped from it.
+
+    First available from v3.2.0.
+
+    :param duration_in_milliseconds: The duration of the animation in milliseconds.
+    :param interpolation_mode: Determines how interpolation is to be handled. May be `RGB_INTERPOLATION`,
+        `HUE_INTERPOLATION`, or `HSL_INTERPOLATION`.
+    :param easing_function: A callable acting as an easing function. Other available modes are prefixed with `EASE`.
+
+    :param new_theme: The theme to transition to.
+    :param theme_function: The theme change function from PySimpleGUI within your code. Required because of namespaces.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code. The `new_theme` should be in there.
+    :param set_future: If set to True, the `new_theme` will be applied to all future windows.
+    :param element_filter: A callable of your choice that takes an element as its only parameter and returns True or
+        False. Elements that result in True will be reskinned, and others will be skipped.
+    :param reskin_background: If True, the background colors of the windows will be reskinned. Else, they won't.
+    :param backend: The backend through which the reskin gets applied. Defaults to a TkBackend.
+    :param stats: If True, statistics on what the animation did and what it cost get collected and returned.
+    :param refresh: How the windows get refreshed after every frame; see `animated_reskin`.
+    :return: The ReskinStats if `stats` is True, else None.
+    """
+    _initialize()
+    delta = timedelta(milliseconds=duration_in_milliseconds)
+    start_time = datetime.now()
+    end_time = start_time + delta
+    groups = _group_windows(
+        new_theme, theme_function, lf_table, set_future, backend, 0, interpolation_mode
     )
-    while datetime.now() <= end_time:
-        cp.progress = easing_function(round((datetime.now() - start_time) / delta, 4))
+    reskin_stats = _instrument_groups(groups, stats)
+    while groups:
+        finished = datetime.now() > end_time
+        progress = (
+            1
+            if finished
+            else easing_function(round((datetime.now() - start_time) / delta, 4))
+        )
+        for cp, _ in groups:
+            cp.progress = progress
         try:
-            reskin(
-                window,
+            _reskin_groups(
+                groups,
                 new_theme,
-                theme_function,
-                lf_table,
-                set_future,
                 element_filter,
                 reskin_background,
-                _color_processor=cp,
-                _old_theme=old_theme,
-                _new_theme=new_theme,
+                refresh,
+                reskin_stats,
             )
-        except TclError:  # Closed window.
-            return
-    cp.progress = 1
-    reskin(
+        except TclError:  # Closed windows get dropped.
+            remaining = [
+                (cp, [window for window in windows if _window_alive(window)])
+                for cp, windows in groups
+            ]
+            if all(
+                len(alive) == len(windows)
+                for (_, alive), (_, windows) in zip(remaining, groups)
+            ):
+                raise
+            groups = [(cp, windows) for cp, windows in remaining if windows]
+            continue
+        if finished:
+            break
+    return reskin_stats
+
+
+def _window_alive(window: Window) -> bool:
+    """
+    Internal use only.
+
+    Checks whether a window is still open.
+
+    First available from v3.2.0.
+    :param window: The window.
+    :return: True if the window hasn't been closed, else False.
+    """
+    return window.TKroot is not None and not getattr(window, "TKrootDestroyed", False)
+
+
+def _group_windows(
+    new_theme: str,
+    theme_function: Callable,
+    lf_table: dict,
+    set_future: bool,
+    backend: Optional[TkBackend],
+    progress: float,
+    interpolation_mode: Union[RGB_INTERPOLATION, HUE_INTERPOLATION, HSL_INTERPOLATION],
+) -> List[Tuple[ColorProcessor, List[Window]]]:
+    """
+    Internal use only.
+
+    Switches every live window Reskinner knows of to the new theme, and groups those that need reskinning by the theme
+    they had. Every group gets a ColorProcessor of its own, but all of them share the targets processed during a
+    pass, so that ttk styles (which are global to the interpreter) get configured once.
+
+    First available from v3.2.0.
+    :param new_theme: The theme to apply.
+    :param theme_function: The theme change function from PySimpleGUI within your code.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code.
+    :param set_future: If set to True, the `new_theme` will be applied to all future windows.
+    :param backend: The backend through which the reskin gets applied. Defaults to a TkBackend.
+    :param progress: The progress the ColorProcessors start at.
+    :param interpolation_mode: The interpolation mode of the ColorProcessors.
+    :return: Every ColorProcessor, along with the windows it reskins.
+    """
+    backend = backend if backend is not None else TkBackend()
+    styler = backend.styler()
+    groups: Dict[str, Tuple[ColorProcessor, List[Window]]] = {}
+    processed_targets = set()
+    for window in [
+        window for window in list(WINDOW_THEME_MAP) if _window_alive(window)
+    ]:
+        old_theme, old_theme_dict, new_theme_dict = _switch_theme(
+            window, new_theme, theme_function, lf_table, False
+        )
+        if (new_theme == old_theme) and (new_theme_dict == old_theme_dict):
+            continue
+        if old_theme not in groups:
+            cp = ColorProcessor(
+                old_theme_dict,
+                new_theme_dict,
+                styler,
+                progress,
+                interpolation_mode,
+                backend,
+                processed_targets,
+            )
+            groups[old_theme] = (cp, [])
+        groups[old_theme][1].append(window)
+    if set_future:
+        theme_function(new_theme)
+    return list(groups.values())
+
+
+def _instrument_groups(
+    groups: List[Tuple[ColorProcessor, List[Window]]], stats: bool
+) -> Optional[ReskinStats]:
+    """
+    Internal use only.
+
+    Makes the ColorProcessors of a batch of windows report to a single ReskinStats and tracer, as requested.
+
+    First available from v3.2.0.
+    :param groups: Every ColorProcessor, along with the windows it reskins.
+    :param stats: If True, statistics get collected.
+    :return: The ReskinStats if `stats` is True, else None.
+    """
+    reskin_stats = ReskinStats() if stats else None
+    tracer = _Tracer() if _TRACE_SINKS else None
+    for cp, _ in groups:
+        if reskin_stats is not None:
+            reskin_stats.instrument(cp)
+        if tracer is not None:
+            tracer.instrument(cp)
+    return reskin_stats
+
+
+def _reskin_groups(
+    groups: List[Tuple[ColorProcessor, List[Window]]],
+    new_theme: str,
+    element_filter: Optional[Callable[[Element], bool]],
+    reskin_background: bool,
+    refresh: str,
+    reskin_stats: Optional[ReskinStats],
+) -> None:
+    """
+    Internal use only.
+
+    Performs a single pass over a batch of windows, then refreshes them all at once.
+
+    First available from v3.2.0.
+    :param groups: Every ColorProcessor, along with the windows it reskins.
+    :param new_theme: The theme being applied.
+    :param element_filter: The element filter, if any.
+    :param reskin_background: If True, the background colors of the windows get reskinned as well.
+    :param refresh: The refresh strategy.
+    :param reskin_stats: The ReskinStats to record the pass in, if any.
+    :return: None
+    """
+    pass_start = perf_counter()
+    first_cp = groups[0][0]
+    tracer = first_cp.tracer
+    if tracer is not None:
+        pass_args = {
+            "windows": sum(len(windows) for _, windows in groups),
+            "theme": new_theme,
+            "progress": first_cp.progress,
+        }
+        tracer.begin("reskin_all", pass_args)
+    # The targets processed are shared by every ColorProcessor, so starting a pass on one starts it on all of them.
+    first_cp.new_pass()
+    for cp, windows in groups:
+        for window in windows:
+            _reskin_pass(
+                cp,
+                window,
+                window.element_list(),
+                None,
+                element_filter,
+                reskin_background,
+            )
+    for cp, _ in groups:
+        cp.flush_styles()
+    # Windows share the interpreter, so updating one of them updates them all.
+    if refresh != REFRESH_NONE:
+        last_cp, last_windows = groups[-1]
+        last_cp.backend.refresh(last_windows[-1], refresh)
+    if tracer is not None:
+        tracer.end("reskin_all", pass_args)
+    if reskin_stats is not None:
+        reskin_stats.add_frame(perf_counter() - pass_start)
+
+
+def dry_run(
+    window: Window,
+    new_theme: str,
+    theme_function: Callable,
+    lf_table: dict,
+    element_filter: Optional[Callable[[Element], bool]] = None,
+    reskin_background: bool = True,
+    backend: Optional[TkBackend] = None,
+    scope: Optional[Union[Element, Iterable[Any]]] = None,
+) -> List[Operation]:
+    """
+    Plans a reskin without applying it, and returns every operation it would have performed. Neither the window, the
+    global theme nor the theme Reskinner has on record for the window get changed.
+
+    First available from v3.2.0.
+
+    :param window: The window to operate on.
+    :param new_theme: The theme to transition to.
+    :param theme_function: The theme change function from PySimpleGUI within your code. Required because of namespaces.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code. The `new_theme` should be in there.
+    :param element_filter: A callable of your choice that takes an element as its only parameter and returns True or
+        False. Elements that result in True will be reskinned, and others will be skipped.
+    :param reskin_background: If True, the background color of the window will be reskinned. Else, it won't.
+    :param backend: The backend through which defaults get resolved. Defaults to a TkBackend.
+    :param scope: A container element, or a collection of elements and/or keys, to limit the reskin to (along with
+        their descendants).
+    :return: The operation log.
+    """
+    recorder = RecordingBackend(backend, dry_run=True)
+    _plan(
         window,
         new_theme,
         theme_function,
         lf_table,
-        set_future,
         element_filter,
         reskin_background,
-        _color_processor=cp,
-        _old_theme=old_theme,
-        _new_theme=new_theme,
+        recorder,
+        scope,
     )
+    return recorder.log
+
+
+def _plan(
+    window: Window,
+    new_theme: str,
+    theme_function: Callable,
+    lf_table: dict,
+    element_filter: Optional[Callable[[Element], bool]],
+    reskin_background: bool,
+    recorder: RecordingBackend,
+    scope: Optional[Union[Element, Iterable[Any]]],
+    force: bool = False,
+    elements: Optional[List[Element]] = None,
+) -> None:
+    """
+    Internal use only.
+
+    Runs a reskin through a dry-running recorder, then puts back the themes Reskinner has on record and the reskins
+    it has deferred, as they were before.
+
+    First available from v3.2.0.
+    :param window: The window to operate on.
+    :param new_theme: The theme to plan the reskin to.
+    :param theme_function: The theme change function from PySimpleGUI within your code.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code.
+    :param element_filter: The element filter, if any.
+    :param reskin_background: If True, the background color of the window gets planned as well.
+    :param recorder: The dry-running recorder.
+    :param scope: The scope of the reskin, if any.
+    :param force: If True, the reskin gets planned even if the window already has the theme.
+    :param elements: The elements to plan the reskin of, instead of walking the window (or scope) for them.
+    :return: None
+    """
+    previous = WINDOW_THEME_MAP.get(window)
+    previous_scopes = dict(ELEMENT_THEME_MAP)
+    previous_deferred = {
+        target: list(calls) for target, calls in _DEFERRED_RESKINS.items()
+    }
+    try:
+        reskin(
+            window,
+            new_theme,
+            theme_function,
+            lf_table,
+            False,
+            element_filter,
+            reskin_background,
+            recorder,
+            scope=scope,
+            _force=force,
+            _elements=elements,
+        )
+    finally:
+        if previous is None:
+            WINDOW_THEME_MAP.pop(window, None)
+        else:
+            WINDOW_THEME_MAP[window] = previous
+        ELEMENT_THEME_MAP.clear()
+        ELEMENT_THEME_MAP.update(previous_scopes)
+        for target, calls in previous_deferred.items():
+            _DEFERRED_RESKINS[target][:] = calls
+
+
+def reskinned_finalize(
+    window: Window,
+    new_theme: str,
+    theme_function: Callable,
+    lf_table: dict,
+    set_future: bool = True,
+    element_filter: Optional[Callable[[Element], bool]] = None,
+    reskin_background: bool = True,
+    backend: Optional[TkBackend] = None,
+) -> Window:
+    """
+    Finalizes a window straight into a theme. Use it instead of finalizing a window and then reskinning it, which
+    paints the window in the theme it was created in before recoloring it.
+
+    The window is built fully transparent (just like PySimpleGUI builds every window) and kept withdrawn until the
+    reskin has been applied and refreshed in one go, so its first paint is already in the new theme. The window is
+    registered in the theme map as well. Windows that are already finalized just get reskinned.
+
+    First available from v3.2.0.
+    :param window: The window to finalize.
+    :param new_theme: The theme to finalize the window in.
+    :param theme_function: The theme change function from PySimpleGUI within your code. Required because of namespaces.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code. The `new_theme` should be in there.
+    :param set_future: If set to True, the `new_theme` will be applied to all future windows.
+    :param element_filter: A callable of your choice that takes an element as its only parameter and returns True or
+        False. Elements that result in True will be reskinned, and others will be skipped.
+    :param reskin_background: If True, the background color of the window will be reskinned. Else, it won't.
+    :param backend: The backend through which the reskin gets applied. Defaults to a TkBackend.
+    :return: The window, so that calls can be chained like `Window.finalize()`.
+    """
+    if window.TKroot is not None:
+        reskin(
+            window,
+            new_theme,
+            theme_function,
+            lf_table,
+            set_future,
+            element_filter,
+            reskin_background,
+            backend,
+        )
+        return window
+
+    alpha_channel = window.AlphaChannel
+    window.AlphaChannel = 0
+    try:
+        window.finalize()
+        window.hide()
+        reskin(
+            window,
+            new_theme,
+            theme_function,
+            lf_table,
+            set_future,
+            element_filter,
+            reskin_background,
+            backend,
+        )
+    finally:
+        window.AlphaChannel = alpha_channel
+    window.un_hide()
+    window.set_alpha(1 if alpha_channel is None else alpha_channel)
+    return window
 
 
 def toggle_transparency(window: Window) -> None:
@@ -0,0 +1,327 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+"""
+Color snapshots: the colors Reskinner has applied to a window, captured so that they can be applied again in one go,
+without any interpolation, theme lookup or default resolution. Useful for undoing a reskin, or cancelling a preview.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from PySimpleGUI import Element, Window
+
+from .backend import _STYLES_TARGET, RecordingBackend, TkBackend
+from .constants import (
+    ELEMENT_THEME_MAP,
+    REFRESH_NONE,
+    REFRESH_UPDATE,
+    WINDOW_THEME_MAP,
+)
+from .psg_reskinner import (
+    _DEFERRED_RESKINS,
+    _initialize,
+    _plan,
+    _scope_elements,
+    _scope_theme,
+)
+from .utilities import _group_by_options, _tcl_split
+
+
+class ColorSnapshot:
+    """
+    The colors applied to (part of) a window, as captured by `take_snapshot()`. Pass it to `restore_snapshot()` to
+    apply them again.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(
+        self,
+        window: Window,
+        elements: Optional[List[Element]],
+        theme: Optional[Tuple[str, Dict]],
+        scopes: Dict[Element, Tuple[str, Dict]],
+        configurations: List[Tuple[Any, Dict[str, str]]],
+        operations: List[Tuple[str, Any, Dict]],
+    ):
+        """
+        :param window: The window the snapshot was taken of.
+        :param elements: The elements in the scope of the snapshot, or None for the whole window.
+        :param theme: The theme Reskinner had on record for the window, if any.
+        :param scopes: The themes Reskinner had on record for containers within the scope of the snapshot.
+        :param configurations: The widgets, each along with the values of its options.
+        :param operations: Every other kind of operation, as (kind, target, options).
+        """
+        self.window = window
+        self.elements = elements
+        self.theme = theme
+        self.scopes = scopes
+        self.configurations = configurations
+        self.operations = operations
+
+    def __len__(self) -> int:
+        return len(self.configurations) + len(self.operations)
+
+
+class _SnapshotBackend(RecordingBackend):
+    """
+    Internal use only.
+
+    Captures the current values of whatever a dry-run reskin would have written, instead of recording the values it
+    would have written.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self, backend: Optional[TkBackend] = None):
+        super().__init__(backend, dry_run=True)
+        self.configurations: List[Tuple[Any, Dict[str, str]]] = []
+        self.operations: List[Tuple[str, Any, Dict]] = []
+        # The (option, color) pairs every canvas item tag would have gone onto, keyed by canvas.
+        self.item_tags: Dict[str, Dict[str, List[Tuple[str, str]]]] = {}
+
+    def configure(self, widget, options: Dict[str, str]) -> None:
+        self.configurations.append(
+            (widget, self.backend.widget_options(widget, options))
+        )
+
+    def style_configure(self, styler, style: str, options: Dict[str, str]):
+        self.operations.append(
+            ("style", style, self.backend.style_options(styler, style, options))
+        )
+
+    def style_map(self, styler, style: str, options: Dict[str, List]):
+        self.operations.append(
+            ("map", style, self.backend.style_map_options(styler, style, options))
+        )
+
+    def configure_styles(self, styler, groups: Dict[str, Dict[str, str]]):
+        # Styles that got grouped by the options they'd get are regrouped by the options they have.
+        self.operations.append(
+            (
+                "styles",
+                _STYLES_TARGET,
+                _group_by_options(
+                    {
+                        style: self.backend.style_options(styler, style, options)
+                        for styles, options in groups.items()
+                        for style in _tcl_split(styles)
+                    }
+                ),
+            )
+        )
+
+    def map_styles(self, styler, groups: Dict[str, Dict[str, List]]):
+        self.operations.append(
+            (
+                "maps",
+                _STYLES_TARGET,
+                _group_by_options(
+                    {
+                        style: self.backend.style_map_options(styler, style, options)
+                        for styles, options in groups.items()
+                        for style in _tcl_split(styles)
+                    }
+                ),
+            )
+        )
+
+    def configure_menu_entries(self, menu, entries: Dict[int, Dict[str, str]]) -> None:
+        self.operations.append(
+            ("menu", menu, self.backend.menu_entry_options(menu, entries))
+        )
+
+    def configure_combo_listbox(self, combo_widget, options: Dict[str, str]) -> None:
+        self.operations.append(
+            (
+                "listbox",
+                combo_widget,
+                self.backend.combo_listbox_options(combo_widget, options),
+            )
+        )
+
+    def configure_tags(self, widget, groups: Dict[str, Dict[str, str]]) -> None:
+        # Tags that got grouped by the colors they'd get are regrouped by the colors they have.
+        colors = self.backend.tag_colors(widget)
+        self.operations.append(
+            (
+                "tags",
+                widget,
+                _group_by_options(
+                    {
+                        tag: {
+                            option: colors.get(tag, {}).get(option, "")
+                            for option in options
+                        }
+                        for tags, options in groups.items()
+                        for tag in _tcl_split(tags)
+                    }
+                ),
+            )
+        )
+
+    def tag_items(self, widget, tags: Dict[str, List[Tuple[str, str]]]) -> None:
+        # The tagging only gets recorded: the items it would have tagged are the ones with the colors it lists.
+        self.item_tags[str(widget)] = tags
+
+    def configure_items(self, widget, groups: Dict[str, Dict[str, str]]) -> None:
+        tags = self.item_tags.get(str(widget))
+        if tags is None:
+            # The items were tagged by an earlier reskin, so their colors can be read through their tags.
+            options = self.backend.item_options(widget, groups)
+        else:
+            options = {
+                tag: {option: dict(tags[tag])[option] for option in group_options}
+                for tag, group_options in groups.items()
+            }
+        self.operations.append(("items", widget, options))
+
+    def refresh(self, window: Window, strategy: str = REFRESH_UPDATE) -> None:
+        pass
+
+
+def take_snapshot(
+    window: Window,
+    theme_function: Callable,
+    lf_table: dict,
+    element_filter: Optional[Callable[[Element], bool]] = None,
+    reskin_background: bool = True,
+    backend: Optional[TkBackend] = None,
+    scope: Optional[Union[Element, Iterable[Any]]] = None,
+) -> ColorSnapshot:
+    """
+    Captures the colors currently applied to a window: every widget option, ttk style option and state map a reskin
+    would write, along with the themes Reskinner has on record for the window. Nothing gets changed.
+
+    First available from v3.2.0.
+    :param window: The window to capture.
+    :param theme_function: The theme change function from PySimpleGUI within your code. Required because of namespaces.
+    :param lf_table: The LOOK_AND_FEEL_TABLE from PySimpleGUI from within your code.
+    :param element_filter: A callable of your choice that takes an element as its only parameter and returns True or
+        False. Only elements that result in True get captured.
+    :param reskin_background: If True, the background color of the window gets captured as well.
+    :param backend: The backend through which the colors get read. Defaults to a TkBackend.
+    :param scope: A container element, or a collection of elements and/or keys, to limit the snapshot to (along with
+        their descendants).
+    :return: The snapshot.
+    """
+    _initialize()
+    scoped = _scope_elements(window, scope) if scope is not None else None
+    # Planning a reskin to the current theme touches exactly what a reskin would.
+    if window not in WINDOW_THEME_MAP:
+        current_theme = theme_function()
+    elif scoped is not None:
+        current_theme = _scope_theme(window, scoped[0][0])[0]
+    else:
+        current_theme = WINDOW_THEME_MAP[window][0]
+    capturer = _SnapshotBackend(backend)
+    _plan(
+        window,
+        current_theme,
+        theme_function,
+        lf_table,
+        element_filter,
+        reskin_background,
+        capturer,
+        scope,
+        force=True,
+    )
+    elements = None if scoped is None else scoped[1]
+    return ColorSnapshot(
+        window,
+        elements,
+        WINDOW_THEME_MAP.get(window),
+        {
+            element: theme
+            for element, theme in ELEMENT_THEME_MAP.items()
+            if (
+                getattr(element, "ParentForm", None) is window
+                if elements is None
+                else element in elements
+            )
+        },
+        capturer.configurations,
+        capturer.operations,
+    )
+
+
+def restore_snapshot(
+    snapshot: ColorSnapshot,
+    backend: Optional[TkBackend] = None,
+    refresh: str = REFRESH_UPDATE,
+) -> None:
+    """
+    Applies the colors captured by `take_snapshot()` again, along with the themes Reskinner had on record. Widgets
+    get configured with a single batched Tcl script, and the window gets refreshed (at most) once. Reskins still deferred by a
+    lazy reskin within the scope of the snapshot get dropped.
+
+    First available from v3.2.0.
+    :param snapshot: The snapshot.
+    :param backend: The backend through which the colors get applied. Defaults to a TkBackend.
+    :param refresh: How the window gets refreshed afterwards; one of the `REFRESH_*` constants, as with `reskin`.
+    :return: None
+    """
+    backend = backend if backend is not None else TkBackend()
+    styler = backend.styler()
+    appliers: Dict[str, Callable[[Any, Dict], None]] = {
+        "style": lambda target, options: backend.style_configure(
+            styler, target, options
+        ),
+        "map": lambda target, options: backend.style_map(styler, target, options),
+        "styles": lambda target, options: backend.configure_styles(styler, options),
+        "maps": lambda target, options: backend.map_styles(styler, options),
+        "menu": backend.configure_menu_entries,
+        "listbox": backend.configure_combo_listbox,
+        "tags": backend.configure_tags,
+        "items": backend.configure_items,
+    }
+    backend.configure_widgets(snapshot.configurations)
+    for kind, target, options in snapshot.operations:
+        appliers[kind](target, options)
+    if refresh != REFRESH_NONE:
+        backend.refresh(snapshot.window, refresh)
+
+    window = snapshot.window
+    if snapshot.elements is None:
+        covered = [
+            element
+            for element in list(ELEMENT_THEME_MAP)
+            if getattr(element, "ParentForm", None) is window
+        ]
+        if snapshot.theme is None:
+            WINDOW_THEME_MAP.pop(window, None)
+        else:
+            WINDOW_THEME_MAP[window] = snapshot.theme
+        if window in _DEFERRED_RESKINS:
+            _DEFERRED_RESKINS[window].clear()
+    else:
+        covered = snapshot.elements
+    for element in covered:
+        ELEMENT_THEME_MAP.pop(element, None)
+        if element in _DEFERRED_RESKINS:
+            _DEFERRED_RESKINS[element].clear()
+    ELEMENT_THEME_MAP.update(snapshot.scopes)
@@ -0,0 +1,286 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+from collections import Counter, defaultdict
+from statistics import mean, median
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySimpleGUI import Element, Window
+
+from .backend import RecordingBackend, TkBackend
+from .colorprocessor import (
+    ColorProcessor,
+    _color,
+    _default_combo_listbox_option,
+    _is_valid_color,
+)
+from .constants import REFRESH_UPDATE
+from .default import _cgetde, _default_element_name, _normalize_tk_color
+from .profiling import _TRACED_METHODS
+from .utilities import _lower_type_name
+
+# The ColorProcessor methods timed while statistics are being collected.
+_TIMED_METHODS: Tuple[str, ...] = _TRACED_METHODS + ("config", "_processed")
+# The caches whose hit rates get reported.
+_CACHES: Dict[str, Callable] = {
+    "_is_valid_color": _is_valid_color,
+    "_color": _color,
+    "_cgetde": _cgetde,
+    "_normalize_tk_color": _normalize_tk_color,
+    "_lower_type_name": _lower_type_name,
+    "_default_element_name": _default_element_name,
+    "_default_combo_listbox_option": _default_combo_listbox_option,
+}
+
+
+def _summary(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Internal use only.
+
+    Summarizes timing samples (in seconds) in milliseconds.
+
+    First available from v3.2.0.
+    :param samples: The timing samples, in seconds.
+    :return: The number of samples, along with their minimum, median, mean, 95th percentile and maximum.
+    """
+    milliseconds = sorted(sample * 1000 for sample in samples) or [0.0]
+    return {
+        "samples": len(samples),
+        "min_ms": milliseconds[0],
+        "median_ms": median(milliseconds),
+        "mean_ms": mean(milliseconds),
+        "p95_ms": milliseconds[
+            min(len(milliseconds) - 1, int(len(milliseconds) * 0.95))
+        ],
+        "max_ms": milliseconds[-1],
+    }
+
+
+def _cache_counts() -> Dict[str, Tuple[int, int]]:
+    return {
+        name: (function.cache_info().hits, function.cache_info().misses)
+        for name, function in _CACHES.items()
+    }
+
+
+class ReskinStats:
+    """
+    Statistics on what a reskin did and what it cost, returned by `reskin()` and `animated_reskin()` when they're
+    called with `stats=True`.
+
+    Every pass of an animated reskin is a frame, and counts and timings accumulate across frames. Cache hit rates
+    cover the whole reskin, and only account for lookups made while it ran.
+
+    `operations` counts the write operations issued to the backend by kind, and `write_operations` counts those that
+    actually got applied, i.e. none of them when dry-running. A batched write counts once however many widgets it
+    covers, and reads (of defaults, current colors...) aren't counted.
+
+    Collecting statistics wraps the ColorProcessor's methods and the backend, so none of it costs anything when
+    statistics aren't requested.
+
+    First available from v3.2.0.
+    """
+
+    def __init__(self):
+        self.elements_visited: int = 0
+        self.elements_filtered: int = 0
+        self.operations: Counter = Counter()
+        self.operations_skipped: int = 0
+        self.write_operations: int = 0
+        self.cache_hits: Dict[str, Tuple[int, int]] = {"targets": (0, 0)}
+        self.element_seconds: Dict[str, float] = defaultdict(float)
+        self.element_counts: Counter = Counter()
+        self.method_seconds: Dict[str, float] = defaultdict(float)
+        self.method_calls: Counter = Counter()
+        self.refresh_seconds: float = 0.0
+        self.frame_times: List[float] = []
+        self.seconds: float = 0.0
+        self._start = perf_counter()
+        self._start_cache_counts = _cache_counts()
+        self._depths: Counter = Counter()
+
+    @property
+    def operations_issued(self) -> int:
+        return sum(self.operations.values())
+
+    @property
+    def frames(self) -> int:
+        return len(self.frame_times)
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.seconds if self.seconds else 0.0
+
+    @property
+    def cache_hit_rates(self) -> Dict[str, float]:
+        return {
+            name: hits / (hits + misses) if hits + misses else 0.0
+            for name, (hits, misses) in self.cache_hits.items()
+        }
+
+    def frame_time_summary(self) -> Dict[str, float]:
+        """
+        Summarizes the duration of every frame (i.e. every reskin pass) in milliseconds.
+
+        :return: The number of frames, along with their minimum, median, mean, 95th percentile and maximum duration.
+        """
+        return _summary(self.frame_times)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Converts the statistics into a JSON-serializable dictionary, e.g. for telemetry.
+
+        :return: The statistics.
+        """
+        return {
+            "seconds": self.seconds,
+            "elements_visited": self.elements_visited,
+            "elements_filtered": self.elements_filtered,
+            "operations_issued": self.operations_issued,
+            "operations_skipped": self.operations_skipped,
+            "operations": dict(self.operations),
+            "write_operations": self.write_operations,
+            "cache_hit_rates": self.cache_hit_rates,
+            "element_seconds": dict(self.element_seconds),
+            "element_counts": dict(self.element_counts),
+            "method_seconds": dict(self.method_seconds),
+            "method_calls": dict(self.method_calls),
+            "refresh_seconds": self.refresh_seconds,
+            "frames": self.frames,
+            "fps": self.fps,
+            "frame_times": self.frame_time_summary(),
+        }
+
+    def instrument(self, color_processor: ColorProcessor) -> "ReskinStats":
+        """
+        Internal use only.
+
+        Makes a ColorProcessor (and its backend) report to these statistics.
+
+        First available from v3.2.0.
+        :param color_processor: The ColorProcessor about to perform the reskin.
+        :return: The statistics themselves.
+        """
+        for name in _TIMED_METHODS:
+            setattr(
+                color_processor,
+                name,
+                self._timed(name, getattr(color_processor, name)),
+            )
+        first_visit = color_processor._first_visit
+
+        def _first_visit(*target) -> bool:
+            first = first_visit(*target)
+            hits, misses = self.cache_hits["targets"]
+            self.cache_hits["targets"] = (hits + (not first), misses + first)
+            self.operations_skipped += not first
+            return first
+
+        color_processor._first_visit = _first_visit
+        color_processor.backend = _StatsBackend(color_processor.backend, self)
+        color_processor.stats = self
+        return self
+
+    def _timed(self, name: str, method: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            self.method_calls[name] += 1
+            if self._depths[name]:  # Recursive calls are part of the outermost one.
+                return method(*args, **kwargs)
+            self._depths[name] += 1
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.method_seconds[name] += perf_counter() - start
+                self._depths[name] -= 1
+
+        return timed
+
+    def add_elements(self, elements: int, whitelisted: int) -> None:
+        """
+        Internal use only.
+
+        Records how many elements a pass went through, and how many of them the element filter skipped.
+
+        First available from v3.2.0.
+        :param elements: The number of elements in the window.
+        :param whitelisted: The number of elements that passed the filter.
+        :return: None
+        """
+        self.elements_visited += whitelisted
+        self.elements_filtered += elements - whitelisted
+
+    def add_element(self, element: Element, seconds: float) -> None:
+        self.element_seconds[type(element).__name__] += seconds
+        self.element_counts[type(element).__name__] += 1
+
+    def add_frame(self, seconds: float) -> None:
+        """
+        Internal use only.
+
+        Records a finished reskin pass, and brings the totals up to date.
+
+        First available from v3.2.0.
+        :param seconds: The duration of the pass.
+        :return: None
+        """
+        self.frame_times.append(seconds)
+        self.seconds = perf_counter() - self._start
+        self.cache_hits.update(
+            {
+                name: (
+                    hits - self._start_cache_counts[name][0],
+                    misses - self._start_cache_counts[name][1],
+                )
+                for name, (hits, misses) in _cache_counts().items()
+            }
+        )
+
+
+class _StatsBackend(RecordingBackend):
+    """
+    Passes operations on to another backend, counting them (and how many of them get applied) instead of logging
+    them, and timing window refreshes.
+    """
+
+    def __init__(self, backend: Optional[TkBackend], stats: ReskinStats):
+        super().__init__(backend)
+        self.stats = stats
+        # Nothing reaches Tcl when the wrapped backend is dry-running.
+        self._applies = not getattr(self.backend, "dry_run", False)
+
+    def _record(self, kind: str, target: Any, options: Dict) -> bool:
+        self.stats.operations[kind] += 1
+        self.stats.write_operations += self._applies
+        return True
+
+    def refresh(self, window: Window, strategy: str = REFRESH_UPDATE) -> None:
+        start = perf_counter()
+        super().refresh(window, strategy)
+        self.stats.refresh_seconds += perf_counter() - start
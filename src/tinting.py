@@ -0,0 +1,309 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from PySimpleGUI import Element
+
+from .backend import TkBackend
+from .colorprocessor import ColorProcessor, _color, _is_valid_color
+from .constants import THEME_COLOR_KEYS
+from .exception import ReskinnerException
+
+# The number of steps animated reskins tint images in. Frames in between reuse the closest keyframe.
+TINT_KEYFRAMES = 4
+# How far (as a distance in RGB space) a pixel can be from a theme color and still follow it.
+TINT_TOLERANCE = 64.0
+# The number of tinted images kept across all images, and the number of originals. Beyond that, the least recently
+# used ones get dropped, unless they're still displayed (or, for originals, still have tinted versions kept).
+_TINT_CACHE_SIZE = 64
+_ORIGINAL_CACHE_SIZE = 32
+
+
+class _Original(NamedTuple):
+    """
+    Internal use only.
+
+    The pixels of an image as they were first seen, along with the theme they were drawn for.
+
+    First available from v3.2.0.
+    """
+
+    pixels: Any
+    transparent: Tuple[int, ...]
+    theme_dict: Dict[str, Any]
+    # A weak reference to a widget's Tk root, through which whether the image is still displayed can be checked. Weak,
+    # so that the cache doesn't keep closed windows alive.
+    master: "weakref.ref[Any]"
+
+
+# The original of every image tinted recently, keyed by image name, least recently used first.
+_ORIGINALS: "OrderedDict[str, _Original]" = OrderedDict()
+# The tinted images, keyed by the name of their original and by palettes, least recently used first.
+_TINTED: "OrderedDict[Tuple[str, bytes, bytes], Any]" = OrderedDict()
+# The name of the original of every tinted image.
+_TINT_SOURCES: Dict[str, str] = {}
+
+
+def _numpy():
+    """
+    Internal use only.
+
+    Imports NumPy, which image tinting requires but Reskinner doesn't.
+
+    First available from v3.2.0.
+    :return: The numpy module.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ReskinnerException(
+            "Image tinting requires NumPy, which can be installed with `pip install numpy`."
+        ) from None
+    return numpy
+
+
+def clear_tint_cache(backend: Optional[TkBackend] = None) -> None:
+    """
+    Forgets every original and tinted image which isn't displayed anymore. Images which are stay cached, since
+    dropping a tinted image deletes it.
+
+    First available from v3.2.0.
+    :param backend: The backend the images were tinted through. Defaults to a TkBackend.
+    :return: None
+    """
+    _evict(backend if backend is not None else TkBackend(), 0, 0)
+
+
+def tint_image(cp: ColorProcessor, element: Element) -> None:
+    """
+    Internal use only.
+
+    Tints the image of an element from the palette of the theme it was drawn for to the palette the reskin is
+    currently at. Images are always tinted from their original pixels, and tinted versions are cached by image and
+    palette. Animated reskins only tint images at `TINT_KEYFRAMES` steps, so that frames in between cost nothing.
+
+    First available from v3.2.0.
+    :param cp: The ColorProcessor of the current pass.
+    :param element: The element whose widget displays the image.
+    :return: None
+    """
+    backend = cp.backend
+    widget = element.widget
+    if "image" not in widget.keys():
+        return
+    displayed = str(widget.cget("image"))
+    if not displayed or backend.image_type(widget, displayed) != "photo":
+        return
+    image_name = _TINT_SOURCES.get(displayed, displayed)
+    original = _ORIGINALS.get(image_name)
+    cached = original is not None
+    if cached:
+        _ORIGINALS.move_to_end(image_name)
+    else:
+        original = _ORIGINALS[image_name] = _capture(
+            backend, widget, image_name, cp.old_theme_dict
+        )
+    keyframe = round(cp.progress * TINT_KEYFRAMES) / TINT_KEYFRAMES
+    source, target = _palettes(
+        original.theme_dict, cp.old_theme_dict, cp.new_theme_dict, keyframe
+    )
+    tinted_name = image_name
+    if not _numpy().array_equal(source, target):
+        key = (image_name, source.tobytes(), target.tobytes())
+        image = _TINTED.get(key)
+        if image is None:
+            cached = False
+            image = _TINTED[key] = _photo_image(
+                backend, widget, original, _tint(original.pixels, source, target)
+            )
+            _TINT_SOURCES[str(image)] = image_name
+        else:
+            _TINTED.move_to_end(key)
+        tinted_name = str(image)
+    if tinted_name != displayed:
+        backend.configure(widget, {"image": tinted_name})
+    if not cached:
+        _evict(backend, _TINT_CACHE_SIZE, _ORIGINAL_CACHE_SIZE)
+
+
+def _evict(backend: TkBackend, tinted_size: int, original_size: int) -> None:
+    """
+    Internal use only.
+
+    Drops the least recently used tinted images and originals beyond the sizes given. Tinted images still displayed
+    are kept, since dropping them deletes them, and so are the originals of those kept.
+
+    First available from v3.2.0.
+    :param backend: The backend through which to check whether images are displayed.
+    :param tinted_size: The number of tinted images to keep.
+    :param original_size: The number of originals to keep.
+    :return: None
+    """
+    excess = len(_TINTED) - tinted_size
+    for key, image in list(_TINTED.items()):
+        if excess <= 0:
+            break
+        if not backend.image_in_use(image, str(image)):
+            del _TINTED[key]
+            del _TINT_SOURCES[str(image)]
+            excess -= 1
+    excess = len(_ORIGINALS) - original_size
+    if excess <= 0:
+        return
+    sources = set(_TINT_SOURCES.values())
+    for image_name, original in list(_ORIGINALS.items()):
+        if excess <= 0:
+            break
+        if image_name in sources:
+            continue
+        master = original.master()
+        if master is None or not backend.image_in_use(master, image_name):
+            del _ORIGINALS[image_name]
+            excess -= 1
+
+
+def _capture(
+    backend: TkBackend, widget: Any, image_name: str, theme_dict: Dict[str, Any]
+) -> _Original:
+    """
+    Internal use only.
+
+    Reads the pixels of a photo image, finding its transparent pixels in a single vectorized comparison.
+
+    First available from v3.2.0.
+    :param backend: The backend through which to read the image.
+    :param widget: A widget of the Tk interpreter the image belongs to.
+    :param image_name: The name of the image.
+    :param theme_dict: The theme the image was drawn for.
+    :return: The original.
+    """
+    numpy = _numpy()
+    width, height, on_black, on_white = backend.read_photo(widget, image_name)
+    pixels = numpy.frombuffer(on_black, numpy.uint8).reshape(height, width, 3)
+    transparent = (
+        pixels != numpy.frombuffer(on_white, numpy.uint8).reshape(height, width, 3)
+    ).any(axis=2)
+    return _Original(
+        pixels,
+        tuple(numpy.flatnonzero(transparent).tolist()),
+        dict(theme_dict),
+        weakref.ref(widget._root()),
+    )
+
+
+def _palettes(
+    original_theme_dict: Dict[str, Any],
+    old_theme_dict: Dict[str, Any],
+    new_theme_dict: Dict[str, Any],
+    progress: float,
+) -> Tuple[Any, Any]:
+    """
+    Internal use only.
+
+    Builds the palettes an image gets tinted between, out of the theme colors usable in every theme involved. Colors
+    used by several keys of the original theme follow the first of them in `THEME_COLOR_KEYS`. The target palette is
+    lerped between the old and new themes.
+
+    First available from v3.2.0.
+    :param original_theme_dict: The theme the image was drawn for.
+    :param old_theme_dict: The theme the reskin starts from.
+    :param new_theme_dict: The theme the reskin goes to.
+    :param progress: How far the reskin is, from 0 to 1.
+    :return: The source and target palettes, as arrays of RGB rows.
+    """
+    numpy = _numpy()
+    colors: List[List[Tuple[float, float, float]]] = [[], [], []]
+    for theme_dict_key in THEME_COLOR_KEYS:
+        key, index = (
+            theme_dict_key
+            if isinstance(theme_dict_key, tuple)
+            else (theme_dict_key, None)
+        )
+        values = []
+        for theme_dict in (original_theme_dict, old_theme_dict, new_theme_dict):
+            value = theme_dict.get(key)
+            if index is not None:
+                value = value[index] if isinstance(value, (list, tuple)) else None
+            values.append(value)
+        if not all(_is_valid_color(value) for value in values):
+            continue
+        rgbs = [_color(value).get_rgb() for value in values]
+        if rgbs[0] not in colors[0]:
+            for palette, rgb in zip(colors, rgbs):
+                palette.append(rgb)
+    source, old, new = (
+        numpy.array(palette, numpy.float32).reshape(-1, 3) * 255 for palette in colors
+    )
+    return source, numpy.rint(old + (new - old) * progress)
+
+
+def _tint(pixels: Any, source: Any, target: Any) -> Any:
+    """
+    Internal use only.
+
+    Moves every pixel along with the palette colors near it, in a single vectorized pass. Each palette color pulls a
+    pixel by its own shift, weighted by how close the pixel is to it, so that anti-aliased edges follow along.
+
+    First available from v3.2.0.
+    :param pixels: The original pixels, as an array of shape (height, width, 3).
+    :param source: The palette the pixels were drawn with.
+    :param target: The palette to tint the pixels to.
+    :return: The tinted pixels.
+    """
+    numpy = _numpy()
+    flat = pixels.reshape(-1, 3).astype(numpy.float32)
+    distances = numpy.linalg.norm(flat[:, None, :] - source[None, :, :], axis=2)
+    weights = numpy.clip(1 - distances / TINT_TOLERANCE, 0, 1)
+    weights /= numpy.maximum(weights.sum(axis=1, keepdims=True), 1)
+    tinted = flat + weights @ (target - source)
+    return (
+        numpy.clip(numpy.rint(tinted), 0, 255).astype(numpy.uint8).reshape(pixels.shape)
+    )
+
+
+def _photo_image(
+    backend: TkBackend, widget: Any, original: _Original, pixels: Any
+) -> Any:
+    """
+    Internal use only.
+
+    Creates a photo image out of tinted pixels, with the transparency of the original.
+
+    First available from v3.2.0.
+    :param backend: The backend through which to create the image.
+    :param widget: A widget of the Tk interpreter to create the image in.
+    :param original: The original the pixels were tinted from.
+    :param pixels: The tinted pixels.
+    :return: The image.
+    """
+    height, width = pixels.shape[:2]
+    return backend.create_photo(
+        widget, width, height, pixels.tobytes(), original.transparent
+    )
@@ -25,12 +25,45 @@
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 
+import re
 from functools import cache
+from tkinter import Widget
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+# Classic Tk widget classes whose background may legitimately be empty.
+_BACKGROUNDLESS_WIDGET_NAMES = ("frame", "labelframe", "toplevel")
+# Capabilities of every widget class encountered so far, keyed on the Python class and the Tk widget class.
+_WIDGET_CAPABILITIES: Dict[Tuple[type, str], Tuple[FrozenSet[str], bool, bool]] = {}
 
 
 @cache
-def _lower_class_name(_object):
-    return type(_object).__name__.lower()
+def _lower_type_name(_type: type) -> str:
+    return _type.__name__.lower()
+
+
+def _widget_capabilities(widget: Widget) -> Tuple[FrozenSet[str], bool, bool]:
+    """
+    Internal use only.
+
+    Obtains the capabilities of a widget's class, introspecting it only the first time that class is encountered.
+
+    First available from v3.2.0.
+    :param widget: The widget to be checked.
+    :return: A tuple of the options the widget supports, whether it's a ttk widget and whether its background
+        may be empty (in which case it has to be checked with `cget` before use).
+    """
+    widget_class = (type(widget), getattr(widget, "widgetName", ""))
+    capabilities = _WIDGET_CAPABILITIES.get(widget_class)
+    if capabilities is None:
+        # All ttk widget classes are created through the `ttk::` namespace, which also makes this work for widgets
+        # that merely mimic Tk ones (like those of the mock backend).
+        is_ttk = widget_class[1].startswith("ttk::")
+        capabilities = _WIDGET_CAPABILITIES[widget_class] = (
+            frozenset(widget.keys()),
+            is_ttk,
+            is_ttk or widget_class[1] in _BACKGROUNDLESS_WIDGET_NAMES,
+        )
+    return capabilities
 
 
 def transprint(object, **kwargs):
@@ -40,3 +73,88 @@ def transprint(object, **kwargs):
 
 def clamp(v: float):
     return min(max(v, 0), 1)
+
+
+_TCL_SPECIAL_CHARACTERS = re.compile(r'[\s"$;\[\]\\{}]')
+_TCL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+_TCL_UNESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+_TCL_QUOTED_WORD = re.compile(r"(?:\\.|[^\s\\])+", re.DOTALL)
+
+
+def _tcl_word(value: Any) -> str:
+    """
+    Internal use only.
+
+    Quotes a value so that Tcl reads it back as exactly one word, no matter what characters it contains.
+
+    First available from v3.2.0.
+    :param value: The value to be quoted.
+    :return: The quoted Tcl word.
+    """
+    word = str(value)
+    if not word:
+        return "{}"
+    return _TCL_SPECIAL_CHARACTERS.sub(
+        lambda match: _TCL_ESCAPES.get(match.group(), "\\" + match.group()), word
+    )
+
+
+def _tcl_command(*words: Any) -> str:
+    """
+    Internal use only.
+
+    Builds a properly quoted Tcl command out of the words given, for use in batched scripts.
+
+    First available from v3.2.0.
+    :param words: The command name followed by its arguments.
+    :return: The Tcl command string.
+    """
+    return " ".join(_tcl_word(word) for word in words)
+
+
+def _tcl_split(tcl_list: str) -> List[str]:
+    """
+    Internal use only.
+
+    Splits a Tcl list built by `_tcl_command` back into its words, without needing a Tcl interpreter.
+
+    First available from v3.2.0.
+    :param tcl_list: The Tcl list string.
+    :return: The words.
+    """
+    return [
+        (
+            ""
+            if word == "{}"
+            else re.sub(
+                r"\\(.)",
+                lambda match: _TCL_UNESCAPES.get(match.group(1), match.group(1)),
+                word,
+                flags=re.DOTALL,
+            )
+        )
+        for word in _TCL_QUOTED_WORD.findall(tcl_list)
+    ]
+
+
+def _group_by_options(
+    options_by_name: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Internal use only.
+
+    Groups names (of tags, styles...) that have the exact same options, so that every distinct set of options only
+    needs to be applied once.
+
+    First available from v3.2.0.
+    :param options_by_name: The options of every name. List values (e.g. state maps) are supported.
+    :return: The options shared by each group, keyed by the Tcl list of the names in the group.
+    """
+    groups: Dict[Tuple, Tuple[Dict[str, Any], List[str]]] = {}
+    for name, options in options_by_name.items():
+        key = tuple(
+            (option, tuple(value) if isinstance(value, list) else value)
+            for option, value in options.items()
+        )
+        groups.setdefault(key, (options, []))[1].append(name)
+    return {_tcl_command(*names): options for options, names in groups.values()}
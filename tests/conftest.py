@@ -0,0 +1,72 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import PySimpleGUI as sg
+import pytest
+
+# The package lives in src/, so it gets imported from there under its real name.
+_SRC = Path(__file__).resolve().parent.parent / "src"
+_spec = importlib.util.spec_from_file_location(
+    "psg_reskinner", _SRC / "__init__.py", submodule_search_locations=[str(_SRC)]
+)
+sys.modules["psg_reskinner"] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sys.modules["psg_reskinner"])
+
+from psg_reskinner import RecordingBackend  # noqa: E402
+from psg_reskinner.constants import ELEMENT_THEME_MAP, WINDOW_THEME_MAP  # noqa: E402
+from psg_reskinner.mock import MockBackend  # noqa: E402
+from psg_reskinner.psg_reskinner import _DEFERRED_RESKINS  # noqa: E402
+
+START_THEME = "LightGreen"
+
+
+@pytest.fixture(autouse=True)
+def theme_state():
+    """
+    Starts every test from the same theme, without any themes or deferred reskins on record.
+    """
+    sg.theme(START_THEME)
+    yield
+    WINDOW_THEME_MAP.clear()
+    ELEMENT_THEME_MAP.clear()
+    _DEFERRED_RESKINS.clear()
+    sg.theme(START_THEME)
+
+
+@pytest.fixture
+def backend() -> MockBackend:
+    return MockBackend()
+
+
+@pytest.fixture
+def recorder(backend: MockBackend) -> RecordingBackend:
+    return RecordingBackend(backend)
@@ -0,0 +1,208 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+from collections import Counter
+
+import PySimpleGUI as sg
+
+from psg_reskinner import (
+    RecordingBackend,
+    dry_run,
+    prewarm,
+    register_handler,
+    reskin,
+    unregister_handler,
+)
+from psg_reskinner.handlers import get_handler
+from psg_reskinner.mock import MockBackend, MockWindow
+
+NEW_THEME = "DarkBlue3"
+
+
+def _reskin(window, backend, new_theme=NEW_THEME, **kwargs):
+    return reskin(
+        window, new_theme, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend, **kwargs
+    )
+
+
+def test_shared_targets_are_processed_once_per_pass(recorder):
+    window = MockWindow(
+        "W",
+        [[sg.Text("a", key="A"), sg.Text("b"), sg.Input()]],
+        right_click_menu=["", ["Copy", "Paste"]],
+    )
+    _reskin(window, recorder)
+    targets = Counter((operation.kind, operation.target) for operation in recorder.log)
+    # Three elements share the row frame.
+    assert targets["configure", str(window["A"].ParentRowFrame)] == 1
+    menus = [count for (kind, _), count in targets.items() if kind == "menu"]
+    assert menus and max(menus) == 1
+
+
+def test_menu_entries_are_configured_in_one_operation(recorder):
+    window = MockWindow("W", [[sg.Menu([["File", ["Open", "---", "Exit"]]])]])
+    _reskin(window, recorder)
+    menus = [operation for operation in recorder.log if operation.kind == "menu"]
+    assert len(menus) == 2
+    submenu = next(
+        operation for operation in menus if operation.target.count(".!menu") == 2
+    )
+    assert set(submenu.options) == {0, 1, 2}
+    # Separators only have a background.
+    assert set(submenu.options[1]) == {"background"}
+    foreground = sg.LOOK_AND_FEEL_TABLE[NEW_THEME]["TEXT_INPUT"].lower()
+    assert submenu.options[0]["foreground"].lower() == foreground
+
+
+def test_handlers_are_dispatched_by_element_type(backend):
+    class CustomText(sg.Text):
+        pass
+
+    calls = []
+    register_handler(CustomText, lambda cp, element: calls.append(element))
+    try:
+        window = MockWindow("W", [[CustomText("custom", key="C"), sg.Text("plain")]])
+        _reskin(window, backend)
+        assert calls == [window["C"]]
+    finally:
+        unregister_handler(CustomText)
+    # Without a handler of its own, the handler of the base class applies again.
+    assert get_handler(CustomText) is get_handler(sg.Text)
+    _reskin(window, backend, "Dark")
+    assert calls == [window["C"]]
+    background = sg.LOOK_AND_FEEL_TABLE["Dark"]["BACKGROUND"].lower()
+    assert window["C"].widget.options["background"].lower() == background
+
+
+def test_tabs_never_configure_the_notebook(recorder):
+    window = MockWindow(
+        "W",
+        [
+            [
+                sg.TabGroup(
+                    [[sg.Tab("a", [[sg.Text("x")]]), sg.Tab("b", [[sg.Text("y")]])]],
+                    key="TG",
+                )
+            ]
+        ],
+    )
+    _reskin(window, recorder)
+    notebook = str(window["TG"].widget)
+    assert all(
+        not (operation.kind == "configure" and operation.target == notebook)
+        for operation in recorder.log
+    )
+
+
+def test_dry_run_leaves_the_window_alone(backend):
+    window = MockWindow("W", [[sg.Text("a", key="A"), sg.Button("b")]])
+    before = dict(window["A"].widget.options)
+    operations = dry_run(
+        window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend
+    )
+    assert operations
+    assert window["A"].widget.options == before
+    assert sg.theme() != NEW_THEME
+
+
+def test_stats_count_applied_writes(backend):
+    layout = lambda: [[sg.Text("a"), sg.Input(), sg.Button("b", use_ttk_buttons=True)]]
+    stats = _reskin(MockWindow("W", layout()), backend, stats=True)
+    assert stats.operations_issued > 0
+    assert stats.write_operations == stats.operations_issued
+    dry = _reskin(
+        MockWindow("D", layout()),
+        RecordingBackend(backend, dry_run=True),
+        "Dark",
+        stats=True,
+    )
+    assert dry.operations_issued > 0
+    assert dry.write_operations == 0
+
+
+def test_prewarm_schedules_a_single_chain_of_slices(backend):
+    window = MockWindow("W", [[sg.Text(str(i)) for i in range(5)]])
+    scheduled = []
+    window.TKroot.after_idle = scheduled.append
+    prewarm(
+        window,
+        [NEW_THEME],
+        sg.theme,
+        sg.LOOK_AND_FEEL_TABLE,
+        slice_size=2,
+        backend=backend,
+    )
+    assert len(scheduled) == 1
+    slices = 0
+    while scheduled:
+        scheduled.pop(0)()
+        slices += 1
+        assert len(scheduled) <= 1
+    # Warming up, 3 slices of elements to prepare and 3 to plan, and the call finding nothing left.
+    assert slices == 8
+
+
+def test_prewarm_plans_slices_without_walking_the_window(backend, monkeypatch):
+    window = MockWindow("W", [[sg.Text(str(i)) for i in range(5)]])
+    walks = []
+    element_list = window.element_list
+    monkeypatch.setattr(
+        window, "element_list", lambda: walks.append(1) or element_list()
+    )
+    prewarm(
+        window,
+        [NEW_THEME, "Dark"],
+        sg.theme,
+        sg.LOOK_AND_FEEL_TABLE,
+        slice_size=2,
+        backend=backend,
+    )
+    # Only prewarm itself lists the elements; each slice's dry run gets its batch handed over.
+    assert len(walks) == 1
+
+
+def test_tag_plans_outlive_a_reskin():
+    class _TagCountingBackend(MockBackend):
+        def __init__(self):
+            super().__init__()
+            self.reads = 0
+
+        def tag_colors(self, widget):
+            self.reads += 1
+            return super().tag_colors(widget)
+
+    backend = _TagCountingBackend()
+    table = sg.Table([[1], [2]], headings=["h"], alternating_row_color="#123456")
+    window = MockWindow("W", [[table]])
+    _reskin(window, backend)
+    _reskin(window, backend, "Dark")
+    assert backend.reads == 1
+    # A new row (and so a new tag) calls for a new plan.
+    table.widget.tags["2"] = {"background": "", "foreground": ""}
+    _reskin(window, backend)
+    assert backend.reads == 2
@@ -0,0 +1,113 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+import PySimpleGUI as sg
+
+from psg_reskinner import REFRESH_NONE, reskin, reskin_all
+from psg_reskinner.constants import WINDOW_THEME_MAP
+from psg_reskinner.mock import MockBackend, MockWindow
+
+THEMES = ("DarkBlue3", "Dark", "DarkBlue3")
+
+
+def _windows(backend):
+    windows = [
+        MockWindow(
+            f"W{index}",
+            [
+                [
+                    sg.Text("a"),
+                    sg.Input(),
+                    sg.Combo(["a"]),
+                    sg.Button("b", use_ttk_buttons=True),
+                ]
+            ],
+        )
+        for index in range(len(THEMES))
+    ]
+    for window, theme in zip(windows, THEMES):
+        reskin(window, theme, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    return windows
+
+
+def _colors(windows, backend):
+    return (
+        [
+            [dict(window.TKroot.options)]
+            # Style names differ from one window to the next.
+            + [
+                {
+                    option: value
+                    for option, value in element.widget.options.items()
+                    if option != "style"
+                }
+                for element in window.element_list()
+            ]
+            for window in windows
+        ],
+        sorted(
+            repr(sorted(options.items()))
+            for options in backend.style.configured.values()
+        ),
+    )
+
+
+def test_reskin_all_matches_reskinning_each_window(backend):
+    windows = _windows(backend)
+    for window in windows:
+        reskin(window, "LightBlue", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    expected = _colors(windows, backend)
+    WINDOW_THEME_MAP.clear()
+
+    backend = MockBackend()
+    windows = _windows(backend)
+    refreshes = sum(window.refresh_count for window in windows)
+    stats = reskin_all(
+        "LightBlue", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend, stats=True
+    )
+    assert _colors(windows, backend) == expected
+    assert sum(window.refresh_count for window in windows) - refreshes == 1
+    assert stats.frames == 1
+    assert {WINDOW_THEME_MAP[window][0] for window in windows} == {"LightBlue"}
+    assert sg.theme() == "LightBlue"
+
+
+def test_reskin_all_skips_closed_windows_and_can_skip_refreshing(backend):
+    windows = _windows(backend)
+    windows[0].TKrootDestroyed = True
+    refreshes = [window.refresh_count for window in windows]
+    reskin_all(
+        "LightBlue",
+        sg.theme,
+        sg.LOOK_AND_FEEL_TABLE,
+        backend=backend,
+        refresh=REFRESH_NONE,
+    )
+    assert [window.refresh_count for window in windows] == refreshes
+    assert WINDOW_THEME_MAP[windows[0]][0] == THEMES[0]
+    assert WINDOW_THEME_MAP[windows[1]][0] == "LightBlue"
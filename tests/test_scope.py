@@ -0,0 +1,174 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+import gc
+from weakref import ref
+
+import PySimpleGUI as sg
+
+from psg_reskinner import animated_reskin, reskin
+from psg_reskinner.constants import ELEMENT_THEME_MAP, WINDOW_THEME_MAP
+from psg_reskinner.psg_reskinner import _DEFERRED_RESKINS
+from psg_reskinner.mock import MockWindow
+
+NEW_THEME = "DarkBlue3"
+NEW_BACKGROUND = sg.LOOK_AND_FEEL_TABLE[NEW_THEME]["BACKGROUND"].lower()
+
+
+def _background(window, key) -> str:
+    return window[key].widget.options["background"].lower()
+
+
+def _scoped_window() -> MockWindow:
+    return MockWindow(
+        "W",
+        [
+            [
+                sg.Frame(
+                    "f",
+                    [
+                        [
+                            sg.Text("a", key="A"),
+                            sg.Column([[sg.Text("b", key="B")]], key="INNER"),
+                        ]
+                    ],
+                    key="F",
+                )
+            ],
+            [sg.Text("out", key="OUT")],
+        ],
+    )
+
+
+def test_scope_only_reskins_the_container_and_its_descendants(recorder):
+    window = _scoped_window()
+    before = _background(window, "OUT")
+    reskin(
+        window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=recorder, scope="F"
+    )
+    targets = {operation.target for operation in recorder.log}
+    assert str(window["B"].widget) in targets
+    assert str(window["OUT"].widget) not in targets
+    assert str(window["F"].ParentRowFrame) not in targets
+    assert str(window.TKroot) not in targets
+    assert _background(window, "OUT") == before
+    assert _background(window, "B") == NEW_BACKGROUND
+    assert {
+        element.Key: theme for element, (theme, _) in ELEMENT_THEME_MAP.items()
+    } == {"F": NEW_THEME}
+    assert WINDOW_THEME_MAP[window][0] == "LightGreen"
+
+
+def test_scope_by_keys(backend):
+    window = _scoped_window()
+    reskin(
+        window,
+        NEW_THEME,
+        sg.theme,
+        sg.LOOK_AND_FEEL_TABLE,
+        backend=backend,
+        scope=["A", "INNER"],
+    )
+    assert _background(window, "A") == NEW_BACKGROUND
+    assert _background(window, "B") == NEW_BACKGROUND
+    assert _background(window, "OUT") != NEW_BACKGROUND
+
+
+def _tabbed_window() -> MockWindow:
+    return MockWindow(
+        "W",
+        [
+            [
+                sg.TabGroup(
+                    [
+                        [
+                            sg.Tab("one", [[sg.Text("a", key="A")]], key="T1"),
+                            sg.Tab("two", [[sg.Text("b", key="B")]], key="T2"),
+                        ]
+                    ],
+                    key="TG",
+                )
+            ],
+            [sg.Column([[sg.Text("h", key="H")]], key="HIDDEN", visible=False)],
+        ],
+    )
+
+
+def test_lazy_reskin_defers_unselected_tabs(backend):
+    window = _tabbed_window()
+    reskin(
+        window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend, lazy=True
+    )
+    assert _background(window, "A") == NEW_BACKGROUND
+    assert _background(window, "B") != NEW_BACKGROUND
+    window["TG"].widget.select(str(window["T2"].widget))
+    assert _background(window, "B") == NEW_BACKGROUND
+
+
+def test_lazy_reskin_defers_hidden_containers(backend):
+    window = _tabbed_window()
+    reskin(
+        window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend, lazy=True
+    )
+    assert _background(window, "H") != NEW_BACKGROUND
+    window["HIDDEN"]._visible = True
+    window["HIDDEN"].widget.event_generate("<Map>")
+    assert _background(window, "H") == NEW_BACKGROUND
+
+
+def test_full_reskin_supersedes_deferred_reskins(backend):
+    window = _tabbed_window()
+    reskin(
+        window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend, lazy=True
+    )
+    animated_reskin(
+        window,
+        "Dark",
+        sg.theme,
+        sg.LOOK_AND_FEEL_TABLE,
+        duration_in_milliseconds=20,
+        backend=backend,
+    )
+    dark = sg.LOOK_AND_FEEL_TABLE["Dark"]["BACKGROUND"].lower()
+    assert _background(window, "B") == dark
+    window["TG"].widget.select(str(window["T2"].widget))
+    assert _background(window, "B") == dark
+
+
+def test_deferred_reskins_dont_keep_closed_windows_alive(backend):
+    window = _tabbed_window()
+    reskin(
+        window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend, lazy=True
+    )
+    assert window["T2"] in _DEFERRED_RESKINS
+    window_ref = ref(window)
+    del window
+    gc.collect()
+    assert window_ref() is None
+    assert len(WINDOW_THEME_MAP) == 0
+    assert len(_DEFERRED_RESKINS) == 0
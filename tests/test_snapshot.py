@@ -0,0 +1,137 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+import copy
+
+import PySimpleGUI as sg
+
+from psg_reskinner import (
+    canvas_items_handler,
+    register_handler,
+    reskin,
+    restore_snapshot,
+    take_snapshot,
+    unregister_handler,
+)
+from psg_reskinner.constants import WINDOW_THEME_MAP
+from psg_reskinner.mock import MockWindow
+
+
+def _window() -> MockWindow:
+    return MockWindow(
+        "W",
+        [
+            [sg.Text("a", key="A"), sg.Button("b", use_ttk_buttons=True)],
+            [sg.Combo(["a"]), sg.Input(), sg.Checkbox("c"), sg.ProgressBar(10)],
+            [sg.Table([[1], [2]], headings=["h"], alternating_row_color="#123456")],
+            [sg.Frame("f", [[sg.Text("x", key="X")]], key="F")],
+            [sg.Menu([["File", ["Open", "---", "Exit"]]])],
+        ],
+    )
+
+
+def _state(window, backend):
+    widgets = {}
+
+    def walk(widget):
+        widgets[str(widget)] = (
+            dict(widget.options),
+            copy.deepcopy(getattr(widget, "entries", None)),
+            dict(widget.popdown_options),
+            copy.deepcopy(widget.tags),
+        )
+        for child in widget.children.values():
+            walk(child)
+
+    walk(window.TKroot)
+    for element in window.element_list():
+        for widget in (element.widget, element.ParentRowFrame):
+            walk(widget)
+    return (
+        widgets,
+        copy.deepcopy(backend.style.configured),
+        copy.deepcopy(backend.style.maps),
+    )
+
+
+def test_snapshot_round_trip(backend, recorder):
+    window = _window()
+    reskin(window, "DarkBlue3", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    before = _state(window, backend)
+    snapshot = take_snapshot(window, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    assert len(snapshot)
+    assert _state(window, backend) == before
+
+    reskin(window, "Dark", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    assert _state(window, backend) != before
+    restore_snapshot(snapshot, backend=recorder)
+    assert _state(window, backend) == before
+    assert WINDOW_THEME_MAP[window][0] == "DarkBlue3"
+    assert [operation.kind for operation in recorder.log].count("refresh") == 1
+
+
+def test_scoped_snapshot(backend):
+    window = _window()
+    reskin(window, "DarkBlue3", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    snapshot = take_snapshot(
+        window, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend, scope="F"
+    )
+    captured = dict(window["X"].widget.options)
+    reskin(window, "Dark", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    outside = dict(window["A"].widget.options)
+    restore_snapshot(snapshot, backend=backend)
+    assert window["X"].widget.options == captured
+    assert window["A"].widget.options == outside
+
+
+def test_snapshot_leaves_canvas_item_tags_alone(backend):
+    theme_dict = sg.LOOK_AND_FEEL_TABLE[sg.theme()]
+    window = MockWindow("W", [[sg.Graph((10, 10), (0, 0), (10, 10), key="G")]])
+    items = window["G"].widget.items
+    items.update(
+        {
+            1: {"fill": theme_dict["TEXT"], "outline": "", "tags": {"user"}},
+            2: {"fill": theme_dict["BACKGROUND"], "outline": "", "tags": set()},
+            3: {"fill": "red", "outline": "", "tags": set()},
+        }
+    )
+    register_handler(sg.Graph, canvas_items_handler)
+    try:
+        before = copy.deepcopy(items)
+        snapshot = take_snapshot(
+            window, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend
+        )
+        assert items == before
+        reskin(window, "DarkBlue3", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+        assert items[1]["fill"] != before[1]["fill"]
+        restore_snapshot(snapshot, backend=backend)
+        assert [item["fill"] for item in items.values()] == [
+            item["fill"] for item in before.values()
+        ]
+    finally:
+        unregister_handler(sg.Graph)
@@ -0,0 +1,101 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+from tkinter import Tcl
+from types import SimpleNamespace
+
+import PySimpleGUI as sg
+
+from psg_reskinner import TkBackend, reskin
+from psg_reskinner.mock import MockWindow
+from psg_reskinner.utilities import _tcl_split
+
+
+def test_identical_styles_are_configured_once(recorder, backend):
+    window = MockWindow(
+        "W", [[sg.Button(str(index), use_ttk_buttons=True) for index in range(3)]]
+    )
+    reskin(window, "DarkBlue3", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=recorder)
+    kinds = [operation.kind for operation in recorder.log]
+    assert "style" not in kinds and "map" not in kinds
+    assert kinds.count("styles") == kinds.count("maps") == 1
+
+    styles = next(operation for operation in recorder.log if operation.kind == "styles")
+    style_names = [element.widget.options["style"] for element in window.element_list()]
+    assert len(styles.options) == 1
+    assert sorted(_tcl_split(next(iter(styles.options)))) == sorted(style_names)
+    for style_name in style_names:
+        assert backend.style.configured[style_name] == next(
+            iter(styles.options.values())
+        )
+        assert style_name in backend.style.maps
+
+
+def test_styles_with_different_options_are_grouped_apart(recorder):
+    window = MockWindow(
+        "W",
+        [
+            [
+                sg.Button("a", use_ttk_buttons=True),
+                sg.Button("b", use_ttk_buttons=True),
+                sg.ProgressBar(10),
+            ]
+        ],
+    )
+    reskin(window, "DarkBlue3", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=recorder)
+    styles = next(operation for operation in recorder.log if operation.kind == "styles")
+    assert sorted(len(_tcl_split(names)) for names in styles.options) == [1, 2]
+
+
+def test_batched_maps_keep_multi_state_statespecs_together():
+    # A stand-in for ttk::style, which records its arguments, so no display is needed.
+    tcl = Tcl()
+    tcl.eval("namespace eval ttk {}; proc ttk::style {args} {lappend ::calls $args}")
+    TkBackend().map_styles(
+        SimpleNamespace(tk=tcl),
+        {
+            "A B": {
+                "foreground": [
+                    ("!disabled", "!selected", "#ffffff"),
+                    ("active", "#000000"),
+                ]
+            }
+        },
+    )
+    calls = [tcl.splitlist(call) for call in tcl.splitlist(tcl.eval("set ::calls"))]
+    assert [call[:3] for call in calls] == [
+        ("map", "A", "-foreground"),
+        ("map", "B", "-foreground"),
+    ]
+    for call in calls:
+        assert tcl.splitlist(call[3]) == (
+            "!disabled !selected",
+            "#ffffff",
+            "active",
+            "#000000",
+        )
@@ -0,0 +1,154 @@
+#  PSG_Reskinner
+#
+#  Enables changing the themes of your PySimpleGUI windows and elements
+#  instantaneously on the fly without the need for re-instantiating the window.
+#
+#  MIT License
+#
+#  Copyright (c) 2023 Divine Afam-Ifediogor
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+
+import gc
+
+import pytest
+import PySimpleGUI as sg
+
+from psg_reskinner import (
+    animated_reskin,
+    clear_tint_cache,
+    image_tint_handler,
+    register_handler,
+    reskin,
+    unregister_handler,
+)
+from psg_reskinner import tinting
+from psg_reskinner.handlers import _ELEMENT_HANDLERS
+from psg_reskinner.mock import MockBackend, MockWindow
+
+pytest.importorskip("numpy")
+
+NEW_THEME = "DarkBlue3"
+
+
+def _rgb(color: str) -> bytes:
+    return bytes.fromhex(color.lstrip("#"))
+
+
+class _CountingBackend(MockBackend):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def read_photo(self, widget, image_name):
+        self.reads += 1
+        return super().read_photo(widget, image_name)
+
+
+def _clear_tint_cache() -> None:
+    # Mock windows are only gone (and their images no longer displayed) once collected.
+    gc.collect()
+    clear_tint_cache(MockBackend())
+
+
+@pytest.fixture
+def tint_handler():
+    previous = _ELEMENT_HANDLERS.get(sg.Image)
+    register_handler(sg.Image, image_tint_handler)
+    _clear_tint_cache()
+    yield
+    unregister_handler(sg.Image)
+    if previous is not None:
+        register_handler(sg.Image, previous)
+    _clear_tint_cache()
+
+
+def _window(backend):
+    old = sg.LOOK_AND_FEEL_TABLE[sg.theme()]
+    # The theme's background, then its text color, an unrelated color and a transparent pixel.
+    photo = backend.create_photo(
+        None,
+        2,
+        2,
+        _rgb(old["BACKGROUND"]) + _rgb(old["TEXT"]) + _rgb("#ff0000") * 2,
+        (3,),
+    )
+    window = MockWindow("W", [[sg.Image(key="I")]])
+    window["I"].widget.options["image"] = str(photo)
+    return window, photo
+
+
+def test_images_follow_the_theme(tint_handler):
+    backend = _CountingBackend()
+    window, photo = _window(backend)
+    reskin(window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    tinted = backend.photos[window["I"].widget.options["image"]]
+    assert tinted is not photo
+    new = sg.LOOK_AND_FEEL_TABLE[NEW_THEME]
+    assert tinted.pixels[:3] == _rgb(new["BACKGROUND"].lower())
+    assert tinted.pixels[6:9] == _rgb("#ff0000")
+    assert tinted.transparent == (3,)
+
+
+def test_tinted_images_are_reused_and_restored(tint_handler):
+    backend = _CountingBackend()
+    window, photo = _window(backend)
+    reskin(window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    tinted_name = window["I"].widget.options["image"]
+    reskin(window, "LightGreen", sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    # Back in the theme it was drawn for, the image is the original again.
+    assert window["I"].widget.options["image"] == str(photo)
+    photos = len(backend.photos)
+    reskin(window, NEW_THEME, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+    assert window["I"].widget.options["image"] == tinted_name
+    assert len(backend.photos) == photos
+    assert backend.reads == 1
+
+
+def test_animations_only_tint_keyframes(tint_handler):
+    backend = _CountingBackend()
+    window, photo = _window(backend)
+    animated_reskin(
+        window,
+        NEW_THEME,
+        sg.theme,
+        sg.LOOK_AND_FEEL_TABLE,
+        duration_in_milliseconds=50,
+        backend=backend,
+    )
+    assert len(tinting._TINTED) <= tinting.TINT_KEYFRAMES
+    assert backend.reads == 1
+
+
+def test_eviction_keeps_displayed_images(tint_handler, monkeypatch):
+    monkeypatch.setattr(tinting, "_TINT_CACHE_SIZE", 1)
+    backend = MockBackend()
+    window, photo = _window(backend)
+    for theme in ("Dark", "DarkBlue3", "Reddit", "DarkAmber"):
+        reskin(window, theme, sg.theme, sg.LOOK_AND_FEEL_TABLE, backend=backend)
+        displayed = window["I"].widget.options["image"]
+        assert displayed in backend.photos
+        assert list(tinting._TINTED.values()) == [backend.photos[displayed]]
+    clear_tint_cache(backend)
+    assert len(tinting._TINTED) == 1
+    del window
+    _clear_tint_cache()
+    assert len(tinting._TINTED) == 0
+    assert len(tinting._ORIGINALS) == 0